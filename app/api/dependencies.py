@@ -1,17 +1,103 @@
 """Shared API dependencies for FastAPI routes"""
 
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, Header, status
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.db.deps import get_db
 from app.models.auth import AdminUser
-from app.services.auth_service import decode_admin_token
+from app.services.auth_service import decode_admin_claims, decode_admin_token
+
+# Admin lookup cache (admin_id -> (expires_at, snapshot))
+ADMIN_CACHE_TTL_SECONDS = 60.0
+ADMIN_CACHE_MAX_SIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class AdminSnapshot:
+    """Read-only copy of the AdminUser fields routes rely on"""
+
+    id: int
+    username: str
+    company_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class AdminClaims:
+    """Admin identity taken straight from verified JWT claims"""
+
+    id: int
+    username: str
+
+
+_admin_cache: Dict[int, Tuple[float, AdminSnapshot]] = {}
+# Sync dependencies run in the threadpool; guard every read-modify-write
+_admin_cache_lock = threading.Lock()
+
+
+def _get_cached_admin(admin_id: int) -> Optional[AdminSnapshot]:
+    """Return cached admin snapshot if present and not expired"""
+    with _admin_cache_lock:
+        entry = _admin_cache.get(admin_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            _admin_cache.pop(admin_id, None)
+            return None
+        return snapshot
+
+
+def _cache_admin(snapshot: AdminSnapshot) -> None:
+    """Store admin snapshot, evicting the oldest entry when full"""
+    with _admin_cache_lock:
+        if len(_admin_cache) >= ADMIN_CACHE_MAX_SIZE:
+            _admin_cache.pop(next(iter(_admin_cache)), None)
+        _admin_cache[snapshot.id] = (
+            time.monotonic() + ADMIN_CACHE_TTL_SECONDS,
+            snapshot,
+        )
+
+
+def invalidate_admin_cache(admin_id: Optional[int] = None) -> None:
+    """Drop one cached admin (or all when admin_id is None) after a mutation"""
+    with _admin_cache_lock:
+        if admin_id is None:
+            _admin_cache.clear()
+        else:
+            _admin_cache.pop(admin_id, None)
+
+
+@event.listens_for(AdminUser, "after_update")
+@event.listens_for(AdminUser, "after_delete")
+def _invalidate_changed_admin(mapper, connection, target: AdminUser) -> None:
+    """
+    Drop the cached snapshot whenever an AdminUser row is updated or deleted
+    through the ORM, so the change is seen on this worker's next request.
+
+    Other workers keep their entry until ADMIN_CACHE_TTL_SECONDS expires.
+    Bulk query.update()/delete() bypass these events; call
+    invalidate_admin_cache() after those.
+    """
+    invalidate_admin_cache(target.id)
 
 
 def _extract_token(authorization: Optional[str]) -> str:
-    """Extract token from Authorization header"""
-    if not authorization or not authorization.startswith("Bearer "):
+    """
+    Extract token from Authorization header.
+
+    Single shared implementation for admin auth; rejects a missing header,
+    a wrong scheme or an empty token before any decoding work.
+    """
+    if (
+        authorization is None
+        or len(authorization) <= 7
+        or authorization[:7] != "Bearer "
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header",
@@ -19,20 +105,60 @@ def _extract_token(authorization: Optional[str]) -> str:
     return authorization[7:]  # Remove "Bearer " prefix
 
 
-async def get_current_admin(
+def _load_admin(admin_id: int, db: Session) -> AdminSnapshot:
+    """Cached admin snapshot; 401 once the admin no longer exists"""
+    cached = _get_cached_admin(admin_id)
+    if cached is not None:
+        return cached
+
+    admin = db.query(AdminUser).filter(AdminUser.id == admin_id).first()
+    if not admin:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Admin not found"
+        )
+
+    snapshot = AdminSnapshot(
+        id=admin.id, username=admin.username, company_name=admin.company_name
+    )
+    _cache_admin(snapshot)
+    return snapshot
+
+
+def get_current_admin(
     authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
-) -> AdminUser:
-    """Dependency to get current authenticated admin"""
+) -> AdminSnapshot:
+    """
+    Dependency to get current authenticated admin.
+
+    Plain def so FastAPI runs the blocking admin lookup in its threadpool
+    instead of on the event loop.
+    """
     token = _extract_token(authorization)
     admin_id = decode_admin_token(token)
     if not admin_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         )
+    return _load_admin(admin_id, db)
 
-    admin = db.query(AdminUser).filter(AdminUser.id == admin_id).first()
-    if not admin:
+
+def get_current_admin_claims(
+    authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
+) -> AdminClaims:
+    """
+    Dependency to get current admin identity from the verified JWT claims.
+
+    Use for routes that only need the admin id/username; routes needing
+    profile fields should depend on get_current_admin instead. Tokens live
+    30 days, so the admin is still checked against the cached lookup: a
+    deleted admin is rejected once its cache entry is dropped (at once on
+    this worker, within ADMIN_CACHE_TTL_SECONDS elsewhere).
+    """
+    token = _extract_token(authorization)
+    claims = decode_admin_claims(token)
+    if not claims:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Admin not found"
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         )
-    return admin
+    _load_admin(claims["admin_id"], db)
+    return AdminClaims(id=claims["admin_id"], username=claims.get("username", ""))
@@ -0,0 +1,215 @@
+"""Shared response helpers for FastAPI routes"""
+
+import functools
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+# Array items encoded per chunk written by streaming_json_response
+STREAM_CHUNK_ITEMS = 500
+
+
+def adapter_json_response(adapter: TypeAdapter, data: Any) -> Response:
+    """
+    Validate ORM rows (or plain data) and serialize them in one pass.
+
+    The adapter reads attributes straight off ORM objects and pydantic's
+    serializer walks the whole payload natively, so the route skips the
+    per-row model construction and FastAPI's response_model re-validation.
+    """
+    validated = adapter.validate_python(data, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(validated, by_alias=True),
+        media_type="application/json",
+    )
+
+
+def streaming_json_response(adapter: TypeAdapter, items: Iterable) -> Response:
+    """
+    Stream items as a JSON array, encoding each one with an item adapter.
+
+    Items are validated and serialized as they are read, and written out
+    STREAM_CHUNK_ITEMS at a time, so memory stays bounded however many rows
+    the iterable yields. Pass a yield_per query to stream from the database;
+    the db session stays open until the body is sent.
+    """
+
+    def generate() -> Iterator[bytes]:
+        parts = [b"["]
+        for count, item in enumerate(items):
+            validated = adapter.validate_python(item, from_attributes=True)
+            if count:
+                parts.append(b",")
+            parts.append(adapter.dump_json(validated, by_alias=True))
+            if len(parts) >= 2 * STREAM_CHUNK_ITEMS:
+                yield b"".join(parts)
+                parts = []
+        parts.append(b"]")
+        yield b"".join(parts)
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def streaming_ndjson_response(adapter: TypeAdapter, items: Iterable) -> Response:
+    """
+    Stream items as newline-delimited JSON, one encoded item per line.
+
+    Same chunking as streaming_json_response; clients can parse each line as
+    it arrives instead of waiting for the closing bracket.
+    """
+
+    def generate() -> Iterator[bytes]:
+        parts = []
+        for item in items:
+            validated = adapter.validate_python(item, from_attributes=True)
+            parts.append(adapter.dump_json(validated, by_alias=True) + b"\n")
+            if len(parts) >= STREAM_CHUNK_ITEMS:
+                yield b"".join(parts)
+                parts = []
+        if parts:
+            yield b"".join(parts)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers etag (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag for a response body (a short content hash)"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def etag_json_response(request: Request, adapter: TypeAdapter, data: Any) -> Response:
+    """
+    Like adapter_json_response, plus a content-hash ETag.
+
+    A client that sends back a matching If-None-Match gets a bodyless 304.
+    """
+    validated = adapter.validate_python(data, from_attributes=True)
+    body = adapter.dump_json(validated, by_alias=True)
+    etag = body_etag(body)
+    headers = {"ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Every ResponseCache, and those by the topic they hold, for the clear helpers
+_all_caches: List["ResponseCache"] = []
+_caches_by_topic: Dict[str, List["ResponseCache"]] = {}
+
+
+def clear_response_caches(*topics: str) -> None:
+    """
+    Clear every ResponseCache registered under one of topics.
+
+    Routes that change another module's data name the topic ("readings",
+    "cycles", ...) instead of importing that route module's cache.
+    """
+    for topic in topics:
+        for cache in _caches_by_topic.get(topic, ()):
+            cache.clear()
+
+
+def clear_all_response_caches() -> None:
+    """Clear every ResponseCache, whatever its topic (e.g. between tests)"""
+    for cache in _all_caches:
+        cache.clear()
+
+
+class ResponseCache:
+    """
+    Short-lived in-process cache of serialized read-route responses.
+
+    Decorate a handler that returns a Response; hits are keyed on the
+    handler name and its query/path arguments (the db session and request
+    are ignored) and are served without touching the database. Call clear()
+    from the routes that mutate the cached data, or clear_response_caches()
+    with the cache's topic from routes in other modules.
+
+    The cache is per process: with several workers a write clears only the
+    worker that served it, and the others may serve the old response until
+    ttl_seconds runs out. Keep TTLs to what a stale list can tolerate.
+
+    Responses carry a content-hash ETag. Handlers that also take a
+    `request: Request` argument answer a matching If-None-Match with a
+    bodyless 304, which on a hit skips the query and the body both. Pass
+    cache_control to also send a Cache-Control header with both.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int = 1024,
+        topic: Optional[str] = None,
+        cache_control: Optional[str] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.cache_control = cache_control
+        self._entries: Dict[Tuple, Tuple[float, bytes, str, str]] = {}
+        self._lock = threading.Lock()
+        # Bumped by clear(); a miss computed before a clear is not stored
+        self._generation = 0
+        _all_caches.append(self)
+        if topic is not None:
+            _caches_by_topic.setdefault(topic, []).append(self)
+
+    def __call__(self, handler: Callable[..., Response]) -> Callable[..., Response]:
+        @functools.wraps(handler)
+        def wrapper(**kwargs):
+            key = (handler.__name__,) + tuple(
+                sorted(
+                    (k, v) for k, v in kwargs.items() if k not in ("db", "request")
+                )
+            )
+            now = time.monotonic()
+            with self._lock:
+                entry = self._entries.get(key)
+                generation = self._generation
+            if entry is not None and entry[0] > now:
+                _, body, media_type, etag = entry
+                response = Response(content=body, media_type=media_type)
+            else:
+                response = handler(**kwargs)
+                if response.status_code != 200:
+                    return response
+                etag = body_etag(response.body)
+                with self._lock:
+                    if generation == self._generation:
+                        if len(self._entries) >= self.max_size:
+                            self._entries.pop(next(iter(self._entries)), None)
+                        self._entries[key] = (
+                            now + self.ttl_seconds,
+                            response.body,
+                            response.media_type,
+                            etag,
+                        )
+
+            headers = {"ETag": etag}
+            if self.cache_control is not None:
+                headers["Cache-Control"] = self.cache_control
+            request = kwargs.get("request")
+            if request is not None and etag_matches(request, etag):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+            return response
+
+        return wrapper
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
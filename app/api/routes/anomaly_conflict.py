@@ -3,8 +3,10 @@ Anomaly and Conflict API routes.
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from app.api.responses import ResponseCache, adapter_json_response
 from app.db.deps import get_db
 from app.schemas.anomaly_conflict import (
     AnomalyRead,
@@ -23,6 +25,12 @@ from app.models.conflict import ConflictStatus
 
 router = APIRouter(prefix="/issues", tags=["issues"])
 
+_ANOMALY_LIST = TypeAdapter(List[AnomalyRead])
+_CONFLICT_LIST = TypeAdapter(List[ConflictRead])
+
+# Dashboard list reads; cleared by every anomaly/conflict mutation below
+issues_cache = ResponseCache(ttl_seconds=3)
+
 
 # ============================================================================
 # ANOMALY ENDPOINTS
@@ -43,6 +51,7 @@ def create_anomaly(anomaly_data: AnomalyCreate, db: Session = Depends(get_db)):
         reading_id=anomaly_data.reading_id,
         severity=anomaly_data.severity,
     )
+    issues_cache.clear()
     return anomaly
 
 
@@ -60,28 +69,40 @@ def get_anomaly(anomaly_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/anomalies", response_model=List[AnomalyRead])
+@issues_cache
 def list_anomalies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all anomalies (newest first)"""
     service = AnomalyService(db)
-    return service.list_anomalies(skip, limit)
+    return adapter_json_response(_ANOMALY_LIST, service.list_anomalies(skip, limit))
 
 
 @router.get("/anomalies/status/{status}", response_model=List[AnomalyRead])
-def get_anomalies_by_status(status: AnomalyStatus, db: Session = Depends(get_db)):
+@issues_cache
+def get_anomalies_by_status(
+    status: AnomalyStatus,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
     """Get anomalies filtered by status"""
     service = AnomalyService(db)
-    return service.list_anomalies_by_status(status)
+    return adapter_json_response(
+        _ANOMALY_LIST, service.list_anomalies_by_status(status, skip, limit)
+    )
 
 
 @router.get(
     "/anomalies/assignment/{meter_assignment_id}", response_model=List[AnomalyRead]
 )
 def get_anomalies_by_assignment(
-    meter_assignment_id: int, db: Session = Depends(get_db)
+    meter_assignment_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
 ):
     """Get anomalies for a meter assignment"""
     service = AnomalyService(db)
-    return service.list_anomalies_by_assignment(meter_assignment_id)
+    return service.list_anomalies_by_assignment(meter_assignment_id, skip, limit)
 
 
 @router.post("/anomalies/{anomaly_id}/acknowledge", response_model=AnomalyRead)
@@ -93,6 +114,7 @@ def acknowledge_anomaly(
     anomaly, error = service.acknowledge_anomaly(anomaly_id, ack_data.acknowledged_by)
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    issues_cache.clear()
     return anomaly
 
 
@@ -107,6 +129,7 @@ def resolve_anomaly(
     )
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    issues_cache.clear()
     return anomaly
 
 
@@ -129,6 +152,7 @@ def create_conflict(conflict_data: ConflictCreate, db: Session = Depends(get_db)
         reading_id=conflict_data.reading_id,
         severity=conflict_data.severity.value,
     )
+    issues_cache.clear()
     return conflict
 
 
@@ -146,35 +170,52 @@ def get_conflict(conflict_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/conflicts", response_model=List[ConflictRead])
+@issues_cache
 def list_conflicts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all conflicts (newest first)"""
     service = ConflictService(db)
-    return service.list_conflicts(skip, limit)
+    return adapter_json_response(_CONFLICT_LIST, service.list_conflicts(skip, limit))
 
 
 @router.get("/conflicts/status/{status}", response_model=List[ConflictRead])
-def get_conflicts_by_status(status: ConflictStatus, db: Session = Depends(get_db)):
+@issues_cache
+def get_conflicts_by_status(
+    status: ConflictStatus,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
     """Get conflicts filtered by status"""
     service = ConflictService(db)
-    return service.list_conflicts_by_status(status)
+    return adapter_json_response(
+        _CONFLICT_LIST, service.list_conflicts_by_status(status, skip, limit)
+    )
 
 
 @router.get(
     "/conflicts/assignment/{meter_assignment_id}", response_model=List[ConflictRead]
 )
 def get_conflicts_by_assignment(
-    meter_assignment_id: int, db: Session = Depends(get_db)
+    meter_assignment_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
 ):
     """Get conflicts for a meter assignment"""
     service = ConflictService(db)
-    return service.list_conflicts_by_assignment(meter_assignment_id)
+    return service.list_conflicts_by_assignment(meter_assignment_id, skip, limit)
 
 
 @router.get("/conflicts/admin/{admin_id}", response_model=List[ConflictRead])
-def get_conflicts_by_admin(admin_id: str, db: Session = Depends(get_db)):
+def get_conflicts_by_admin(
+    admin_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
     """Get conflicts assigned to an admin"""
     service = ConflictService(db)
-    return service.list_conflicts_by_admin(admin_id)
+    return service.list_conflicts_by_admin(admin_id, skip, limit)
 
 
 @router.post("/conflicts/{conflict_id}/assign", response_model=ConflictRead)
@@ -186,6 +227,7 @@ def assign_conflict(
     conflict, error = service.assign_conflict(conflict_id, assign_data.assigned_to)
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    issues_cache.clear()
     return conflict
 
 
@@ -200,6 +242,7 @@ def resolve_conflict(
     )
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    issues_cache.clear()
     return conflict
 
 
@@ -210,4 +253,5 @@ def archive_conflict(conflict_id: int, db: Session = Depends(get_db)):
     conflict, error = service.archive_conflict(conflict_id)
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    issues_cache.clear()
     return conflict
@@ -2,13 +2,25 @@
 Archive API routes - manage data archival for old cycles (≥36 months).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from app.api.responses import ResponseCache, clear_response_caches
 from app.db.deps import get_db
 from app.services.archive_service import ArchiveService
 
 router = APIRouter(prefix="/archive", tags=["archive"])
 
+# Archive statistics change rarely; serve them from memory for a minute.
+# Any cycle write clears the "cycles" topic, this cache included.
+STATISTICS_CACHE_TTL_SECONDS = 60
+statistics_cache = ResponseCache(
+    ttl_seconds=STATISTICS_CACHE_TTL_SECONDS,
+    topic="cycles",
+    cache_control=f"max-age={STATISTICS_CACHE_TTL_SECONDS}",
+)
+
 
 @router.get("/eligible-cycles")
 def get_eligible_cycles(
@@ -20,23 +32,31 @@ def get_eligible_cycles(
     """
     Get list of cycles eligible for archiving (≥cutoff_months old).
     Only CLOSED cycles are eligible.
+
+    Streamed as it is read from the database; eligible_count is written
+    after the cycles array once every row has been counted.
     """
     service = ArchiveService(db)
-    cycles = service.get_archivable_cycles(cutoff_months)
-
-    return {
-        "cutoff_months": cutoff_months,
-        "eligible_count": len(cycles),
-        "cycles": [
-            {
-                "cycle_id": c.id,
-                "start_date": c.start_date.strftime("%Y-%m-%d"),
-                "end_date": c.end_date.strftime("%Y-%m-%d"),
-                "status": c.status,
-            }
-            for c in cycles
-        ],
-    }
+    cycles = service.iter_archivable_cycles(cutoff_months)
+
+    def generate():
+        yield b'{"cutoff_months":%d,"cycles":[' % cutoff_months
+        count = 0
+        for c in cycles:
+            row = json.dumps(
+                {
+                    "cycle_id": c.id,
+                    "start_date": c.start_date.isoformat(),
+                    "end_date": c.end_date.isoformat(),
+                    "status": c.status,
+                },
+                separators=(",", ":"),
+            ).encode("utf-8")
+            yield row if count == 0 else b"," + row
+            count += 1
+        yield b'],"eligible_count":%d}' % count
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @router.post("/cycle/{cycle_id}")
@@ -47,6 +67,8 @@ def archive_cycle(cycle_id: int, db: Session = Depends(get_db)):
     """
     service = ArchiveService(db)
     success, error = service.archive_cycle(cycle_id)
+    if success:
+        clear_response_caches("cycles")
 
     if not success:
         raise HTTPException(status_code=400, detail=error)
@@ -75,17 +97,25 @@ def archive_old_cycles(
     """
     service = ArchiveService(db)
     results = service.archive_old_cycles(cutoff_months, dry_run)
+    if not dry_run:
+        clear_response_caches("cycles")
 
     return results
 
 
 @router.get("/statistics")
-def get_archive_statistics(db: Session = Depends(get_db)):
+@statistics_cache
+def get_archive_statistics(request: Request, db: Session = Depends(get_db)):
     """
     Get statistics about archived data.
     Shows: total cycles, archived cycles, active cycles, date ranges.
+
+    Cached for STATISTICS_CACHE_TTL_SECONDS and tagged with an ETag, so
+    dashboards polling with If-None-Match get a bodyless 304.
     """
     service = ArchiveService(db)
     stats = service.get_archive_statistics()
-
-    return stats
+    return Response(
+        content=json.dumps(stats, separators=(",", ":")).encode("utf-8"),
+        media_type="application/json",
+    )
@@ -2,7 +2,9 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, Query, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from app.api.responses import ResponseCache, adapter_json_response
 from app.db.deps import get_db
 from app.services.audit_log_service import AuditLogService
 from app.schemas.audit_log import AuditLogResponse
@@ -10,8 +12,14 @@ from app.models.audit_log import AuditAction
 
 router = APIRouter(prefix="/audit-logs", tags=["audit-logs"])
 
+_AUDIT_LOG_LIST = TypeAdapter(List[AuditLogResponse])
+
+# Audit logs are append-only; a few seconds of staleness is acceptable
+audit_log_cache = ResponseCache(ttl_seconds=3)
+
 
 @router.get("/", response_model=List[AuditLogResponse])
+@audit_log_cache
 def get_audit_logs(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
@@ -22,7 +30,7 @@ def get_audit_logs(
     Sorted by timestamp descending (newest first).
     """
     service = AuditLogService(db)
-    return service.get_all_logs(skip, limit)
+    return adapter_json_response(_AUDIT_LOG_LIST, service.get_all_logs(skip, limit))
 
 
 @router.get("/{audit_log_id}", response_model=AuditLogResponse)
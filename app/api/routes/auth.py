@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from typing import Optional
 
 from app.db.deps import get_db
-from app.api.dependencies import get_current_admin
+from app.api.dependencies import AdminClaims, get_current_admin_claims
+from app.api.responses import adapter_json_response
 from app.models.auth import AdminUser, CollectorUser
 from app.schemas.auth import (
     AdminRegisterRequest,
@@ -21,14 +23,14 @@ from app.services.auth_service import (
     hash_password,
     verify_password,
     create_access_token,
-    decode_admin_token,
-    decode_collector_token,
     generate_random_password,
 )
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 admin_router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 
+_COLLECTOR_LIST = TypeAdapter(CollectorListResponse)
+
 
 # ============ Admin Routes ============
 
@@ -37,16 +39,7 @@ admin_router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 def register_admin(request: AdminRegisterRequest, db: Session = Depends(get_db)):
     """Register a new admin account"""
 
-    # Check if username already exists
-    existing_admin = (
-        db.query(AdminUser).filter(AdminUser.username == request.username).first()
-    )
-
-    if existing_admin:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists"
-        )
-
+    # Username uniqueness is enforced by the unique constraint (IntegrityError)
     try:
         # Create new admin
         new_admin = AdminUser(
@@ -78,8 +71,7 @@ def register_admin(request: AdminRegisterRequest, db: Session = Depends(get_db))
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to create admin account",
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists"
         )
     except Exception as e:
         db.rollback()
@@ -92,7 +84,16 @@ def register_admin(request: AdminRegisterRequest, db: Session = Depends(get_db))
 def login_admin(request: AdminLoginRequest, db: Session = Depends(get_db)):
     """Admin login"""
 
-    admin = db.query(AdminUser).filter(AdminUser.username == request.username).first()
+    admin = (
+        db.query(
+            AdminUser.id,
+            AdminUser.username,
+            AdminUser.password_hash,
+            AdminUser.company_name,
+        )
+        .filter(AdminUser.username == request.username)
+        .first()
+    )
 
     if not admin:
         raise HTTPException(
@@ -126,7 +127,7 @@ def login_admin(request: AdminLoginRequest, db: Session = Depends(get_db)):
 @admin_router.post("/collectors", response_model=CollectorResponse)
 def create_collector(
     request: CollectorCreateRequest,
-    current_admin: AdminUser = Depends(get_current_admin),
+    current_admin: AdminClaims = Depends(get_current_admin_claims),
     db: Session = Depends(get_db),
 ):
     """Create a new collector (admin only)"""
@@ -153,17 +154,33 @@ def create_collector(
 
 @admin_router.get("/collectors", response_model=CollectorListResponse)
 def list_collectors(
-    current_admin: AdminUser = Depends(get_current_admin),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_admin: AdminClaims = Depends(get_current_admin_claims),
     db: Session = Depends(get_db),
 ):
-    """Get all collectors for the current admin"""
-    collectors = (
-        db.query(CollectorUser).filter(CollectorUser.admin_id == current_admin.id).all()
+    """Get collectors for the current admin (total counts all of them)"""
+    total = db.scalar(
+        select(func.count())
+        .select_from(CollectorUser)
+        .where(CollectorUser.admin_id == current_admin.id)
     )
-
-    return CollectorListResponse(
-        total=len(collectors),
-        collectors=[CollectorResponse.model_validate(c) for c in collectors],
+    # Plain column rows: the adapter reads them by attribute, no ORM instances
+    collectors = db.execute(
+        select(
+            CollectorUser.id,
+            CollectorUser.name,
+            CollectorUser.is_active,
+            CollectorUser.created_at,
+        )
+        .where(CollectorUser.admin_id == current_admin.id)
+        .order_by(CollectorUser.id)
+        .offset(skip)
+        .limit(limit)
+    ).all()
+
+    return adapter_json_response(
+        _COLLECTOR_LIST, {"total": total, "collectors": collectors}
     )
 
 
@@ -172,7 +189,7 @@ def list_collectors(
 )
 def delete_collector(
     collector_id: int,
-    current_admin: AdminUser = Depends(get_current_admin),
+    current_admin: AdminClaims = Depends(get_current_admin_claims),
     db: Session = Depends(get_db),
 ):
     """Delete a collector (admin only)"""
@@ -200,7 +217,7 @@ def delete_collector(
 )
 def reset_collector_password(
     collector_id: int,
-    current_admin: AdminUser = Depends(get_current_admin),
+    current_admin: AdminClaims = Depends(get_current_admin_claims),
     db: Session = Depends(get_db),
 ):
     """Reset a collector's password (generates new password, admin only)"""
@@ -240,7 +257,15 @@ def login_collector(request: CollectorLoginRequest, db: Session = Depends(get_db
     """Collector login with name and password"""
 
     collector = (
-        db.query(CollectorUser).filter(CollectorUser.name == request.name).first()
+        db.query(
+            CollectorUser.id,
+            CollectorUser.admin_id,
+            CollectorUser.name,
+            CollectorUser.password_hash,
+            CollectorUser.is_active,
+        )
+        .filter(CollectorUser.name == request.name)
+        .first()
     )
 
     if not collector:
@@ -3,10 +3,13 @@ Billing API routes - ledger entries, payments, and penalties.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from app.api.responses import adapter_json_response, etag_json_response
 from app.db.deps import get_db
 from app.schemas.ledger_payment import (
+    BalanceRead,
     LedgerEntryCreate,
     LedgerEntryRead,
     PaymentCreate,
@@ -22,6 +25,13 @@ from app.models.ledger_entry import LedgerEntryType
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
+_LEDGER_ENTRY = TypeAdapter(LedgerEntryRead)
+_LEDGER_ENTRY_LIST = TypeAdapter(List[LedgerEntryRead])
+_PAYMENT = TypeAdapter(PaymentRead)
+_PAYMENT_LIST = TypeAdapter(List[PaymentRead])
+_PENALTY = TypeAdapter(PenaltyRead)
+_PENALTY_LIST = TypeAdapter(List[PenaltyRead])
+
 
 # ---------------------------------------------------------------------------
 # Ledger endpoints
@@ -48,7 +58,9 @@ def create_ledger_entry(entry_data: LedgerEntryCreate, db: Session = Depends(get
 
 
 @router.get("/ledger/{entry_id}", response_model=LedgerEntryRead)
-def get_ledger_entry(entry_id: int, db: Session = Depends(get_db)):
+def get_ledger_entry(
+    entry_id: int, request: Request, db: Session = Depends(get_db)
+):
     service = LedgerService(db)
     entry = service.get_entry(entry_id)
     if not entry:
@@ -56,7 +68,7 @@ def get_ledger_entry(entry_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ledger entry {entry_id} not found",
         )
-    return entry
+    return etag_json_response(request, _LEDGER_ENTRY, entry)
 
 
 @router.get("/ledger", response_model=List[LedgerEntryRead])
@@ -69,10 +81,12 @@ def list_ledger_entries(
 ):
     service = LedgerService(db)
     if meter_assignment_id is not None:
-        return service.list_entries_by_assignment(meter_assignment_id)
-    if cycle_id is not None:
-        return service.list_entries_by_cycle(cycle_id)
-    return service.list_entries(skip, limit)
+        entries = service.list_entries_by_assignment(meter_assignment_id, skip, limit)
+    elif cycle_id is not None:
+        entries = service.list_entries_by_cycle(cycle_id, skip, limit)
+    else:
+        entries = service.list_entries(skip, limit)
+    return adapter_json_response(_LEDGER_ENTRY_LIST, entries)
 
 
 # ---------------------------------------------------------------------------
@@ -100,7 +114,7 @@ def create_payment(payment_data: PaymentCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/payments/{payment_id}", response_model=PaymentRead)
-def get_payment(payment_id: int, db: Session = Depends(get_db)):
+def get_payment(payment_id: int, request: Request, db: Session = Depends(get_db)):
     service = PaymentService(db)
     payment = service.get_payment(payment_id)
     if not payment:
@@ -108,29 +122,39 @@ def get_payment(payment_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Payment {payment_id} not found",
         )
-    return payment
+    return etag_json_response(request, _PAYMENT, payment)
 
 
 @router.get("/payments", response_model=List[PaymentRead])
 def list_payments(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     service = PaymentService(db)
-    return service.list_payments(skip, limit)
+    return adapter_json_response(_PAYMENT_LIST, service.list_payments(skip, limit))
 
 
 @router.get(
     "/payments/assignment/{meter_assignment_id}", response_model=List[PaymentRead]
 )
 def list_payments_by_assignment(
-    meter_assignment_id: int, db: Session = Depends(get_db)
+    meter_assignment_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
 ):
     service = PaymentService(db)
-    return service.list_payments_by_assignment(meter_assignment_id)
+    return adapter_json_response(
+        _PAYMENT_LIST,
+        service.list_payments_by_assignment(meter_assignment_id, skip, limit),
+    )
 
 
 @router.get("/payments/client/{client_id}", response_model=List[PaymentRead])
-def list_payments_by_client(client_id: int, db: Session = Depends(get_db)):
+def list_payments_by_client(
+    client_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+):
     service = PaymentService(db)
-    return service.list_payments_by_client(client_id)
+    return adapter_json_response(
+        _PAYMENT_LIST, service.list_payments_by_client(client_id, skip, limit)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -157,7 +181,7 @@ def create_penalty(penalty_data: PenaltyCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/penalties/{penalty_id}", response_model=PenaltyRead)
-def get_penalty(penalty_id: int, db: Session = Depends(get_db)):
+def get_penalty(penalty_id: int, request: Request, db: Session = Depends(get_db)):
     service = PenaltyService(db)
     penalty = service.get_penalty(penalty_id)
     if not penalty:
@@ -165,23 +189,29 @@ def get_penalty(penalty_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Penalty {penalty_id} not found",
         )
-    return penalty
+    return etag_json_response(request, _PENALTY, penalty)
 
 
 @router.get("/penalties", response_model=List[PenaltyRead])
 def list_penalties(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     service = PenaltyService(db)
-    return service.list_penalties(skip, limit)
+    return adapter_json_response(_PENALTY_LIST, service.list_penalties(skip, limit))
 
 
 @router.get(
     "/penalties/assignment/{meter_assignment_id}", response_model=List[PenaltyRead]
 )
 def list_penalties_by_assignment(
-    meter_assignment_id: int, db: Session = Depends(get_db)
+    meter_assignment_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
 ):
     service = PenaltyService(db)
-    return service.list_penalties_by_assignment(meter_assignment_id)
+    return adapter_json_response(
+        _PENALTY_LIST,
+        service.list_penalties_by_assignment(meter_assignment_id, skip, limit),
+    )
 
 
 @router.post("/penalties/{penalty_id}/waive", response_model=PenaltyRead)
@@ -227,7 +257,7 @@ def allocate_payment_fifo(
     }
 
 
-@router.get("/balance/{meter_assignment_id}")
+@router.get("/balance/{meter_assignment_id}", response_model=BalanceRead)
 def get_balance(meter_assignment_id: int, db: Session = Depends(get_db)):
     """
     Compute net balance for a meter assignment.
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.api.dependencies import get_current_admin
+from app.api.responses import (
+    adapter_json_response,
+    clear_response_caches,
+    etag_json_response,
+)
 from app.db.deps import get_db
 from app.schemas.client import ClientCreate, ClientRead, ClientUpdate
 from app.services.client_service import ClientService
@@ -10,6 +16,9 @@ from app.services.client_service import ClientService
 
 router = APIRouter(prefix="/clients", tags=["clients"])
 
+_CLIENT = TypeAdapter(ClientRead)
+_CLIENT_LIST = TypeAdapter(list[ClientRead])
+
 
 @router.post("/", response_model=ClientRead, status_code=status.HTTP_201_CREATED)
 def create_client(
@@ -20,7 +29,11 @@ def create_client(
     """Create a new client (admin only)"""
     try:
         service = ClientService(db)
-        return service.create(payload)
+        client = service.create(payload)
+        # Creating a client also creates (or reassigns) its meter, and may
+        # record its baseline reading
+        clear_response_caches("meters", "assignments", "readings")
+        return client
     except IntegrityError as e:
         db.rollback()
         # Extract the constraint name from the error
@@ -54,14 +67,14 @@ def create_client(
 
 
 @router.get("/{client_id}", response_model=ClientRead)
-def get_client(client_id: int, db: Session = Depends(get_db)):
+def get_client(client_id: int, request: Request, db: Session = Depends(get_db)):
     service = ClientService(db)
     client = service.get(client_id)
     if client is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
         )
-    return client
+    return etag_json_response(request, _CLIENT, client)
 
 
 @router.get("/", response_model=list[ClientRead])
@@ -71,7 +84,7 @@ def list_clients(
     db: Session = Depends(get_db),
 ):
     service = ClientService(db)
-    return service.list(skip=skip, limit=limit)
+    return adapter_json_response(_CLIENT_LIST, service.list(skip=skip, limit=limit))
 
 
 @router.patch("/{client_id}", response_model=ClientRead)
@@ -93,4 +106,5 @@ def delete_client(client_id: int, db: Session = Depends(get_db)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
         )
+    clear_response_caches("assignments")
     return None
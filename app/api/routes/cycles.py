@@ -5,9 +5,15 @@ Cycle API routes - billing cycle management endpoints.
 from typing import List
 from datetime import date
 from decimal import Decimal
-from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import BaseModel, TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
+from app.api.responses import (
+    ResponseCache,
+    adapter_json_response,
+    clear_response_caches,
+    etag_json_response,
+)
 from app.db.deps import get_db
 from app.schemas.cycle import CycleCreate, CycleRead, CycleUpdate
 from app.services.cycle_service import CycleService
@@ -46,6 +52,14 @@ class OverrideTargetDateRequest(BaseModel):
 
 router = APIRouter(prefix="/cycles", tags=["cycles"])
 
+_CYCLE = TypeAdapter(CycleRead)
+_CYCLE_LIST = TypeAdapter(List[CycleRead])
+
+# Cycle reads are polled by dashboards and mobile clients but change rarely;
+# every route below that mutates a cycle clears the "cycles" topic, which
+# takes this cache and the archive statistics with it.
+cycles_cache = ResponseCache(ttl_seconds=30, topic="cycles")
+
 
 @router.post("/", response_model=CycleRead, status_code=status.HTTP_201_CREATED)
 def create_cycle(cycle_data: CycleCreate, db: Session = Depends(get_db)):
@@ -61,6 +75,7 @@ def create_cycle(cycle_data: CycleCreate, db: Session = Depends(get_db)):
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    clear_response_caches("cycles")
     return cycle
 
 
@@ -97,6 +112,9 @@ def schedule_cycles(request: ScheduleCyclesRequest, db: Session = Depends(get_db
         submission_window_days=request.submission_window_days,
         adjust_to_working_day=request.adjust_to_working_day,
     )
+    # Cycles accepted before a rejected one are committed even on a 400
+    if cycles:
+        clear_response_caches("cycles")
 
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
@@ -105,7 +123,7 @@ def schedule_cycles(request: ScheduleCyclesRequest, db: Session = Depends(get_db
 
 
 @router.get("/{cycle_id}", response_model=CycleRead)
-def get_cycle(cycle_id: int, db: Session = Depends(get_db)):
+def get_cycle(cycle_id: int, request: Request, db: Session = Depends(get_db)):
     """Get cycle by ID"""
     service = CycleService(db)
     cycle = service.get_cycle(cycle_id)
@@ -115,24 +133,36 @@ def get_cycle(cycle_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Cycle {cycle_id} not found"
         )
 
-    return cycle
+    return etag_json_response(request, _CYCLE, cycle)
 
 
 @router.get("/", response_model=List[CycleRead])
+@cycles_cache
 def list_cycles(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all cycles (ordered by start_date descending)"""
     service = CycleService(db)
-    return service.list_cycles(skip=skip, limit=limit)
+    return adapter_json_response(
+        _CYCLE_LIST, service.list_cycles(skip=skip, limit=limit)
+    )
 
 
 @router.get("/status/{status}", response_model=List[CycleRead])
-def get_cycles_by_status(status: CycleStatus, db: Session = Depends(get_db)):
-    """Get cycles filtered by status"""
+@cycles_cache
+def get_cycles_by_status(
+    status: CycleStatus,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+):
+    """Get cycles filtered by status (ordered by start_date descending)"""
     service = CycleService(db)
-    return service.get_cycles_by_status(status)
+    return adapter_json_response(
+        _CYCLE_LIST, service.get_cycles_by_status(status, skip, limit)
+    )
 
 
 @router.get("/open/current", response_model=CycleRead)
+@cycles_cache
 def get_open_cycle(db: Session = Depends(get_db)):
     """Get the currently open cycle for reading submissions"""
     service = CycleService(db)
@@ -143,10 +173,11 @@ def get_open_cycle(db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="No open cycle currently"
         )
 
-    return cycle
+    return adapter_json_response(_CYCLE, cycle)
 
 
 @router.get("/date/{check_date}", response_model=CycleRead)
+@cycles_cache
 def get_cycle_for_date(check_date: date, db: Session = Depends(get_db)):
     """Get the cycle that contains a given date"""
     service = CycleService(db)
@@ -158,7 +189,7 @@ def get_cycle_for_date(check_date: date, db: Session = Depends(get_db)):
             detail=f"No cycle found for date {check_date}",
         )
 
-    return cycle
+    return adapter_json_response(_CYCLE, cycle)
 
 
 @router.post("/{cycle_id}/override-target-date", response_model=CycleRead)
@@ -195,6 +226,7 @@ def override_target_date(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    clear_response_caches("cycles")
     return cycle
 
 
@@ -212,6 +244,7 @@ def auto_transition_on_deadline(cycle_id: int, db: Session = Depends(get_db)):
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    clear_response_caches("cycles")
     return {
         "id": cycle.id,
         "status": cycle.status,
@@ -226,10 +259,11 @@ def auto_transition_overdue(db: Session = Depends(get_db)):
     Intended for a scheduled job (cron/k8s CronJob/etc.).
     """
     service = CycleService(db)
-    transitioned, count = service.auto_transition_overdue()
+    updated_ids, count = service.auto_transition_overdue()
+    clear_response_caches("cycles")
     return {
         "updated_count": count,
-        "updated_ids": [c.id for c in transitioned],
+        "updated_ids": updated_ids,
         "message": f"Auto-transitioned {count} overdue cycles to PENDING_REVIEW",
     }
 
@@ -289,4 +323,5 @@ def transition_cycle_status(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    clear_response_caches("cycles")
     return cycle
@@ -1,16 +1,63 @@
 """
 Export API routes - generate CSV reports for cycles, ledgers, and payments.
+
+CSV bodies are streamed in chunks while the query is still being read, so
+large exports never sit in memory as one string. The db session stays open
+until the stream finishes (yield dependencies exit after the response).
+
+The annual ledger can also be generated as a background job that writes to
+a temp file; clients poll the job URL and download the file when it is done.
 """
 
-from datetime import datetime
+import os
+import re
+import tempfile
+import uuid
+from datetime import date, datetime, time
+from pathlib import Path
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.deps import get_db
 from app.services.export_service import ExportService
 
 router = APIRouter(prefix="/exports", tags=["exports"])
 
+# Background export jobs: <job_id>.part while writing, <job_id>.csv when done,
+# <job_id>.error on failure. Files live on local disk, shared by every worker
+# in the container, and are removed after EXPORT_JOB_TTL_SECONDS.
+EXPORT_JOB_DIR = Path(tempfile.gettempdir()) / "aquabill-exports"
+EXPORT_JOB_TTL_SECONDS = 3600
+_JOB_ID = re.compile(r"^(\d{4})-[0-9a-f]{32}$")
+
+
+def _job_path(job_id: str, suffix: str) -> Path:
+    return EXPORT_JOB_DIR / f"{job_id}{suffix}"
+
+
+def _purge_expired_jobs() -> None:
+    """Delete job files older than EXPORT_JOB_TTL_SECONDS"""
+    cutoff = datetime.now().timestamp() - EXPORT_JOB_TTL_SECONDS
+    for path in EXPORT_JOB_DIR.glob("*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _run_annual_ledger_job(bind, year: int, job_id: str) -> None:
+    """Write the annual ledger CSV for a job using its own session"""
+    part = _job_path(job_id, ".part")
+    try:
+        with Session(bind=bind) as db, open(part, "w", newline="") as out:
+            ExportService(db).write_annual_ledger_csv(year, out)
+        os.replace(part, _job_path(job_id, ".csv"))
+    except Exception as e:
+        part.unlink(missing_ok=True)
+        _job_path(job_id, ".error").write_text(str(e) or type(e).__name__)
+
 
 @router.get("/cycle/{cycle_id}/readings")
 def export_cycle_readings(cycle_id: int, db: Session = Depends(get_db)):
@@ -20,9 +67,9 @@ def export_cycle_readings(cycle_id: int, db: Session = Depends(get_db)):
     """
     service = ExportService(db)
     try:
-        csv_data = service.export_cycle_readings_csv(cycle_id)
-        return Response(
-            content=csv_data,
+        chunks = service.iter_cycle_readings_csv(cycle_id)
+        return StreamingResponse(
+            chunks,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=cycle_{cycle_id}_readings.csv"
@@ -40,9 +87,9 @@ def export_cycle_charges(cycle_id: int, db: Session = Depends(get_db)):
     """
     service = ExportService(db)
     try:
-        csv_data = service.export_cycle_charges_csv(cycle_id)
-        return Response(
-            content=csv_data,
+        chunks = service.iter_cycle_charges_csv(cycle_id)
+        return StreamingResponse(
+            chunks,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=cycle_{cycle_id}_charges.csv"
@@ -62,9 +109,9 @@ def export_annual_ledger(year: int, db: Session = Depends(get_db)):
     """
     service = ExportService(db)
     try:
-        csv_data = service.export_annual_ledger_csv(year)
-        return Response(
-            content=csv_data,
+        chunks = service.iter_annual_ledger_csv(year)
+        return StreamingResponse(
+            chunks,
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename=ledger_{year}.csv"},
         )
@@ -72,10 +119,68 @@ def export_annual_ledger(year: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.post("/annual-ledger/{year}/jobs", status_code=status.HTTP_202_ACCEPTED)
+def enqueue_annual_ledger_export(
+    year: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+):
+    """
+    Generate the annual ledger CSV in the background.
+
+    Returns a job id immediately; poll GET /exports/jobs/{job_id} until it
+    returns the file (202 while the export is still being written).
+    """
+    try:
+        ExportService(db).check_annual_ledger_year(year)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    EXPORT_JOB_DIR.mkdir(parents=True, exist_ok=True)
+    _purge_expired_jobs()
+
+    job_id = f"{year:04d}-{uuid.uuid4().hex}"
+    _job_path(job_id, ".part").touch()
+    background_tasks.add_task(_run_annual_ledger_job, db.get_bind(), year, job_id)
+    return {
+        "job_id": job_id,
+        "status": "pending",
+        "status_url": f"/api/v1/exports/jobs/{job_id}",
+    }
+
+
+@router.get("/jobs/{job_id}")
+def get_export_job(job_id: str):
+    """
+    Download a finished background export.
+
+    202 while the job is running, 500 if it failed, 404 for unknown or
+    expired jobs.
+    """
+    match = _JOB_ID.match(job_id)
+    if not match:
+        raise HTTPException(status_code=404, detail=f"Export job {job_id} not found")
+
+    done = _job_path(job_id, ".csv")
+    if done.exists():
+        return FileResponse(
+            done, media_type="text/csv", filename=f"ledger_{match.group(1)}.csv"
+        )
+    error = _job_path(job_id, ".error")
+    if error.exists():
+        raise HTTPException(
+            status_code=500, detail=f"Export job failed: {error.read_text()}"
+        )
+    if _job_path(job_id, ".part").exists():
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": job_id, "status": "pending"},
+        )
+    raise HTTPException(status_code=404, detail=f"Export job {job_id} not found")
+
+
 @router.get("/payments")
 def export_payments(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     db: Session = Depends(get_db),
 ):
     """
@@ -83,24 +188,24 @@ def export_payments(
 
     Query params:
     - start_date: YYYY-MM-DD (optional)
-    - end_date: YYYY-MM-DD (optional)
+    - end_date: YYYY-MM-DD (optional, inclusive)
 
     Example: GET /exports/payments?start_date=2026-01-01&end_date=2026-01-31
     """
     service = ExportService(db)
 
-    # Parse dates
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+    # Dates are validated by FastAPI (422 on bad input); end_date covers the whole day
+    start_dt = datetime.combine(start_date, time.min) if start_date else None
+    end_dt = datetime.combine(end_date, time.max) if end_date else None
 
-    csv_data = service.export_payments_csv(start_dt, end_dt)
+    chunks = service.iter_payments_csv(start_dt, end_dt)
 
     filename = "payments"
     if start_date and end_date:
-        filename = f"payments_{start_date}_to_{end_date}"
+        filename = f"payments_{start_date.isoformat()}_to_{end_date.isoformat()}"
 
-    return Response(
-        content=csv_data,
+    return StreamingResponse(
+        chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}.csv"},
     )
@@ -113,11 +218,11 @@ def export_client_balances(db: Session = Depends(get_db)):
     Includes: client name, meter, debits, credits, net balance breakdown.
     """
     service = ExportService(db)
-    csv_data = service.export_client_balances_csv()
+    chunks = service.iter_client_balances_csv()
 
     timestamp = datetime.now().strftime("%Y%m%d")
-    return Response(
-        content=csv_data,
+    return StreamingResponse(
+        chunks,
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename=client_balances_{timestamp}.csv"
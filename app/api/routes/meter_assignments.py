@@ -1,8 +1,13 @@
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.api.responses import (
+    ResponseCache,
+    adapter_json_response,
+    clear_response_caches,
+)
 from app.db.deps import get_db
 from app.schemas.meter_assignment import (
     MeterAssignmentCreate,
@@ -23,6 +28,11 @@ class AssignMeterRequest(BaseModel):
 
 router = APIRouter(prefix="/meter-assignments", tags=["meter-assignments"])
 
+_ASSIGNMENT_LIST = TypeAdapter(list[MeterAssignmentRead])
+
+# Active assignment pages, cleared by every route that changes assignments
+assignments_cache = ResponseCache(ttl_seconds=60, topic="assignments")
+
 
 @router.post(
     "/assign", response_model=MeterAssignmentRead, status_code=status.HTTP_201_CREATED
@@ -43,6 +53,8 @@ def assign_meter_to_client(payload: AssignMeterRequest, db: Session = Depends(ge
     )
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+    assignments_cache.clear()
+    clear_response_caches("readings")
     return assignment
 
 
@@ -76,19 +88,22 @@ def get_baseline_reading(assignment_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[MeterAssignmentRead])
+@assignments_cache
 def list_active_assignments(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
 ):
     service = MeterAssignmentService(db)
-    return service.list_active(skip=skip, limit=limit)
+    return adapter_json_response(
+        _ASSIGNMENT_LIST, service.list_active(skip=skip, limit=limit)
+    )
 
 
 @router.get("/client/{client_id}", response_model=list[MeterAssignmentRead])
 def list_client_assignments(client_id: int, db: Session = Depends(get_db)):
     service = MeterAssignmentService(db)
-    return service.list_by_client(client_id)
+    return adapter_json_response(_ASSIGNMENT_LIST, service.list_by_client(client_id))
 
 
 @router.get("/meter/{meter_id}/active", response_model=MeterAssignmentRead | None)
@@ -105,6 +120,7 @@ def close_assignment(assignment_id: int, end_date: date, db: Session = Depends(g
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found"
         )
+    assignments_cache.clear()
     return assignment
 
 
@@ -118,4 +134,5 @@ def update_assignment(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Assignment not found"
         )
+    assignments_cache.clear()
     return assignment
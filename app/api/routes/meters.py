@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.api.responses import ResponseCache, adapter_json_response
 from app.db.deps import get_db
 from app.schemas.meter import MeterCreate, MeterRead, MeterUpdate
 from app.services.meter_service import MeterService
@@ -8,11 +10,18 @@ from app.services.meter_service import MeterService
 
 router = APIRouter(prefix="/meters", tags=["meters"])
 
+_METER_LIST = TypeAdapter(list[MeterRead])
+
+# Meter list pages, cleared by every route that creates or removes meters
+meters_cache = ResponseCache(ttl_seconds=60, topic="meters")
+
 
 @router.post("/", response_model=MeterRead, status_code=status.HTTP_201_CREATED)
 def create_meter(payload: MeterCreate, db: Session = Depends(get_db)):
     service = MeterService(db)
-    return service.create(payload)
+    meter = service.create(payload)
+    meters_cache.clear()
+    return meter
 
 
 @router.get("/{meter_id}", response_model=MeterRead)
@@ -27,13 +36,14 @@ def get_meter(meter_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[MeterRead])
+@meters_cache
 def list_meters(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
 ):
     service = MeterService(db)
-    return service.list(skip=skip, limit=limit)
+    return adapter_json_response(_METER_LIST, service.list(skip=skip, limit=limit))
 
 
 @router.patch("/{meter_id}", response_model=MeterRead)
@@ -44,6 +54,7 @@ def update_meter(meter_id: int, payload: MeterUpdate, db: Session = Depends(get_
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Meter not found"
         )
+    meters_cache.clear()
     return meter
 
 
@@ -55,4 +66,5 @@ def delete_meter(meter_id: int, db: Session = Depends(get_db)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Meter not found"
         )
+    meters_cache.clear()
     return None
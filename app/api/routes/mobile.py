@@ -3,25 +3,53 @@ Mobile API routes - bootstrap, incremental updates, and mobile reading submissio
 """
 
 from datetime import datetime
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from typing import List, Literal, Optional
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.api.responses import (
+    ResponseCache,
+    adapter_json_response,
+    clear_response_caches,
+    etag_matches,
+)
 from app.db.deps import get_db
-from app.services.mobile_service import MobileService
+from app.services.mobile_service import MobileService, decode_sync_cursor
 from app.schemas.mobile import (
     MobileBootstrapResponse,
     MobileUpdatesResponse,
     MobileReadingSubmit,
     MobileReadingResponse,
+    MobileBatchReadingResult,
     MobileConflictDetail,
 )
 from app.core.mobile_auth import require_mobile_auth
 
 router = APIRouter(prefix="/mobile", tags=["mobile"])
 
+_BOOTSTRAP = TypeAdapter(MobileBootstrapResponse)
+
+# Bootstrap snapshots are cached with the last_sync taken alongside them, so
+# anything written after the snapshot is still returned by the client's next
+# /updates call; the TTL alone bounds staleness.
+bootstrap_cache = ResponseCache(ttl_seconds=30)
+
+# Most readings accepted by one POST /mobile/readings/batch call
+READING_BATCH_LIMIT = 500
+
 
 @router.get("/bootstrap", response_model=MobileBootstrapResponse)
+@bootstrap_cache
 def get_bootstrap(
     collector_id: str = Depends(require_mobile_auth),
     db: Session = Depends(get_db),
@@ -41,16 +69,24 @@ def get_bootstrap(
     Use this on first app launch or when full resync is needed.
     """
     service = MobileService(db)
-    return service.get_bootstrap()
+    return adapter_json_response(_BOOTSTRAP, service.get_bootstrap())
 
 
 @router.get("/updates", response_model=MobileUpdatesResponse)
 def get_updates(
+    request: Request,
+    response: Response,
     since: datetime = Query(
         ...,
         description="Last sync timestamp (ISO8601). Returns changes since this time.",
         examples=["2026-01-20T10:30:00Z"],
     ),
+    after: Optional[str] = Query(
+        None, description="next_cursor from the previous page (paged sync only)"
+    ),
+    page_size: Optional[int] = Query(
+        None, ge=1, le=1000, description="Readings per page; enables paged sync"
+    ),
     collector_id: str = Depends(require_mobile_auth),
     db: Session = Depends(get_db),
 ):
@@ -68,9 +104,29 @@ def get_updates(
     1. Apply updates (server-wins merge)
     2. Process tombstones (mark local cycles read-only, assignments inactive)
     3. Store new last_sync timestamp for next call
+
+    Paged sync: pass page_size, then repeat the call with the same since and
+    after=next_cursor until next_cursor is null. Only the first page carries
+    non-reading entities and tombstones; store that page's last_sync.
+
+    Responses carry an ETag; send it back as If-None-Match with the same
+    query to get a bodyless 304 when nothing in the delta has changed.
     """
+    cursor = None
+    if after is not None:
+        cursor = decode_sync_cursor(after)
+        if cursor is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
     service = MobileService(db)
-    return service.get_updates(since=since)
+    etag = '"' + service.get_updates_version(since, cursor, page_size) + '"'
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return service.get_updates(since=since, after=cursor, page_size=page_size)
 
 
 @router.post(
@@ -105,17 +161,11 @@ def submit_mobile_reading(
     3. Display in conflicts UI for user resolution
     """
     service = MobileService(db)
-    reading, error = service.submit_mobile_reading(payload)
+    reading, error, existing = service.submit_mobile_reading(payload)
 
     if error:
-        # Check if this is a conflict scenario (duplicate with different value)
-        if "duplicate" in error.lower() or "already exists" in error.lower():
-            # Try to fetch existing reading for conflict detail
-            existing = service.reading_repo.get_by_assignment_and_cycle(
-                meter_assignment_id=payload.meter_assignment_id,
-                cycle_id=payload.cycle_id,
-            )
-
+        # Conflict: a reading already exists for this assignment and cycle
+        if existing is not None:
             conflict_detail = MobileConflictDetail(
                 conflict_reason=error,
                 server_reading=existing,
@@ -126,7 +176,7 @@ def submit_mobile_reading(
                 status_code=status.HTTP_409_CONFLICT,
                 detail={
                     "message": "Conflict detected",
-                    "conflict": conflict_detail.model_dump(),
+                    "conflict": conflict_detail.model_dump(mode="json"),
                 },
             )
 
@@ -134,6 +184,7 @@ def submit_mobile_reading(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
     # Success response
+    clear_response_caches("readings")
     return MobileReadingResponse(
         id=reading.id,
         meter_assignment_id=reading.meter_assignment_id,
@@ -146,13 +197,66 @@ def submit_mobile_reading(
     )
 
 
+@router.post("/readings/batch", response_model=List[MobileBatchReadingResult])
+def submit_mobile_readings_batch(
+    payloads: List[MobileReadingSubmit] = Body(
+        ..., min_length=1, max_length=READING_BATCH_LIMIT
+    ),
+    collector_id: str = Depends(require_mobile_auth),
+    db: Session = Depends(get_db),
+):
+    """
+    Submit readings queued offline on the mobile app in one call.
+
+    Requires: Authorization: Bearer <token>
+
+    Accepts an array of up to 500 readings in the same shape as
+    POST /mobile/readings. Each reading is validated with the same rules;
+    accepted readings are inserted together.
+
+    Returns one result per submitted reading, in order:
+    - PENDING: Reading created and queued for approval (reading_id set)
+    - CONFLICT: A reading already exists for the assignment and cycle
+      (server_reading holds it); also used for a repeat within the batch
+    - REJECTED: Any other validation failure (message explains why)
+
+    The call itself answers 200 even when some readings are not accepted.
+    """
+    service = MobileService(db)
+    outcomes = service.submit_mobile_readings(payloads)
+    clear_response_caches("readings")
+    results = []
+    for index, (reading, error, existing) in enumerate(outcomes):
+        if reading is not None:
+            results.append(
+                MobileBatchReadingResult(
+                    index=index,
+                    status="PENDING",
+                    reading_id=reading.id,
+                    message="Reading submitted successfully and queued for approval.",
+                )
+            )
+        elif existing is not None:
+            results.append(
+                MobileBatchReadingResult(
+                    index=index,
+                    status="CONFLICT",
+                    message=error,
+                    server_reading=existing,
+                )
+            )
+        else:
+            results.append(
+                MobileBatchReadingResult(index=index, status="REJECTED", message=error)
+            )
+    return results
+
+
 @router.post("/conflicts/{conflict_id}/resolve", status_code=status.HTTP_200_OK)
 def resolve_mobile_conflict(
     conflict_id: int,
-    resolution: str = Query(
-        ...,
-        description="Resolution action: 'accept_server' or 'resubmit'",
-        pattern="^(accept_server|resubmit)$",
+    resolution: Literal["accept_server", "resubmit"] = Query(
+        ..., description="Resolution action: 'accept_server' or 'resubmit'"
     ),
     collector_id: str = Depends(require_mobile_auth),
     db: Session = Depends(get_db),
@@ -2,14 +2,25 @@
 Reading API routes - meter reading submission and approval endpoints.
 """
 
-from typing import List
+from typing import List, Optional
 from decimal import Decimal
-from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from pydantic import BaseModel, Field, TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
+from app.api.responses import (
+    ResponseCache,
+    adapter_json_response,
+    streaming_json_response,
+    streaming_ndjson_response,
+)
 from app.db.deps import get_db
 from app.services.reading_service import ReadingService
-from app.schemas.reading import ReadingCreate, ReadingRead, ReadingApprove
+from app.schemas.reading import (
+    MeterValue,
+    ReadingCreate,
+    ReadingRead,
+    ReadingApprove,
+)
 
 
 # Request schemas
@@ -18,9 +29,7 @@ class SubmitReadingRequest(BaseModel):
 
     meter_assignment_id: int = Field(..., description="Meter assignment ID")
     cycle_id: int = Field(..., description="Billing cycle ID")
-    absolute_value: Decimal = Field(
-        ..., ge=0, decimal_places=4, description="Meter reading in m³"
-    )
+    absolute_value: MeterValue = Field(..., description="Meter reading in m³")
     submitted_by: str = Field(
         ..., min_length=1, max_length=100, description="User submitting reading"
     )
@@ -73,6 +82,15 @@ class VerifyRolloverRequest(BaseModel):
 
 router = APIRouter(prefix="/readings", tags=["readings"])
 
+_READING_LIST = TypeAdapter(List[ReadingRead])
+_READING = TypeAdapter(ReadingRead)
+
+# Review queues and reading pages are polled by dashboards; every route that
+# writes a reading (here, in mobile sync and at meter assignment) clears it.
+# The streamed by-assignment/by-cycle lists are not cached: holding their
+# whole body would undo the streaming.
+readings_cache = ResponseCache(ttl_seconds=10, topic="readings")
+
 
 @router.post("/submit", response_model=ReadingRead, status_code=status.HTTP_201_CREATED)
 def submit_reading(request: SubmitReadingRequest, db: Session = Depends(get_db)):
@@ -103,11 +121,13 @@ def submit_reading(request: SubmitReadingRequest, db: Session = Depends(get_db))
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    readings_cache.clear()
     return reading
 
 
 @router.get("/pending", response_model=List[ReadingRead])
-def get_pending_readings(db: Session = Depends(get_db)):
+@readings_cache
+def get_pending_readings(request: Request, db: Session = Depends(get_db)):
     """
     Get all unapproved readings waiting for admin review.
 
@@ -115,11 +135,29 @@ def get_pending_readings(db: Session = Depends(get_db)):
     - List of readings with is_approved=False, ready for approval/rejection
     """
     service = ReadingService(db)
-    return service.get_pending_readings()
+    return adapter_json_response(_READING_LIST, service.get_pending_readings())
+
+
+@router.get("/stream")
+def stream_all_readings(
+    after_id: Optional[int] = Query(
+        None, ge=1, description="Resume below this id after a dropped stream"
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Export every reading as NDJSON, one ReadingRead object per line (newest first).
+
+    Rows are read and encoded in batches as the body is sent, so memory does
+    not grow with the table.
+    """
+    service = ReadingService(db)
+    return streaming_ndjson_response(_READING, service.iter_readings(after_id))
 
 
 @router.get("/{reading_id}", response_model=ReadingRead)
-def get_reading(reading_id: int, db: Session = Depends(get_db)):
+@readings_cache
+def get_reading(reading_id: int, request: Request, db: Session = Depends(get_db)):
     """Get a specific reading by ID"""
     service = ReadingService(db)
     reading = service.get_reading(reading_id)
@@ -130,21 +168,31 @@ def get_reading(reading_id: int, db: Session = Depends(get_db)):
             detail=f"Reading {reading_id} not found",
         )
 
-    return reading
+    return adapter_json_response(_READING, reading)
 
 
 @router.get("/assignment/{meter_assignment_id}", response_model=List[ReadingRead])
 def get_readings_by_assignment(meter_assignment_id: int, db: Session = Depends(get_db)):
-    """Get all readings for a specific meter assignment"""
+    """
+    Get all readings for a specific meter assignment.
+
+    Unpaginated, so the array is streamed as rows are read from the database.
+    """
     service = ReadingService(db)
-    return service.get_readings_by_assignment(meter_assignment_id)
+    return streaming_json_response(
+        _READING, service.iter_readings_by_assignment(meter_assignment_id)
+    )
 
 
 @router.get("/cycle/{cycle_id}", response_model=List[ReadingRead])
 def get_readings_by_cycle(cycle_id: int, db: Session = Depends(get_db)):
-    """Get all readings submitted for a specific billing cycle"""
+    """
+    Get all readings submitted for a specific billing cycle.
+
+    Unpaginated, so the array is streamed as rows are read from the database.
+    """
     service = ReadingService(db)
-    return service.get_readings_by_cycle(cycle_id)
+    return streaming_json_response(_READING, service.iter_readings_by_cycle(cycle_id))
 
 
 @router.get("/{reading_id}/consumption")
@@ -204,6 +252,7 @@ def approve_reading(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    readings_cache.clear()
     return reading
 
 
@@ -233,6 +282,7 @@ def reject_reading(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    readings_cache.clear()
     return {
         "id": reading.id,
         "status": "rejected",
@@ -242,14 +292,20 @@ def reject_reading(
 
 
 @router.get("/", response_model=List[ReadingRead])
+@readings_cache
 def list_all_readings(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(
+        None, ge=1, description="Last id of the previous page; ignores skip"
+    ),
     db: Session = Depends(get_db),
 ):
     """List all readings with pagination (newest first)"""
     service = ReadingService(db)
-    return service.list_readings(skip=skip, limit=limit)
+    readings = service.list_readings(skip=skip, limit=limit, after_id=after_id)
+    return adapter_json_response(_READING_LIST, readings)
 
 
 @router.post(
@@ -288,6 +344,7 @@ def verify_rollover(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    readings_cache.clear()
     return reading
 
 
@@ -312,6 +369,7 @@ def reject_rollover(
     if error:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
+    readings_cache.clear()
     return {
         "id": reading.id,
         "status": "rollover_rejected",
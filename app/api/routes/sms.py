@@ -1,8 +1,21 @@
 """SMS API routes"""
 
+import asyncio
+from anyio import to_thread
 from typing import List, Dict, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, Header, BackgroundTasks
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from app.api.responses import ResponseCache, adapter_json_response
 from app.db.deps import get_db
 from app.services.sms_service import SMSService
 from app.schemas.sms import SMSMessageCreate, SMSMessageResponse
@@ -12,85 +25,140 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_SMS = TypeAdapter(SMSMessageResponse)
+_SMS_LIST = TypeAdapter(List[SMSMessageResponse])
+
+# SMS queues are polled by dashboards and the retry scheduler; every route
+# below that queues, sends or updates an SMS clears this cache.
+sms_cache = ResponseCache(ttl_seconds=10)
+
+# Keyset paging for the list routes: pass the last id of the previous page
+AFTER_ID_DESCRIPTION = "Last id of the previous page; pages by id and ignores skip"
+
+# Most SMS accepted by one POST /sms/bulk call
+SMS_BULK_LIMIT = 500
+
+# Gateway calls in flight at once while draining the retry queue
+SMS_RETRY_CONCURRENCY = 10
+
 
 @router.post("/", response_model=SMSMessageResponse)
 def queue_sms(sms: SMSMessageCreate, db: Session = Depends(get_db)):
     """Queue new SMS for sending (with idempotency)"""
     service = SMSService(db)
 
-    # Check idempotency to prevent duplicates
-    existing = service.check_idempotency(sms.idempotency_key)
-    if existing:
-        return existing
+    # The unique idempotency_key index rejects duplicates; the existing SMS
+    # is returned instead
+    queued, created = service.queue_sms_once(sms)
+    if created:
+        sms_cache.clear()
+    return queued
+
+
+@router.post("/bulk", response_model=List[SMSMessageResponse])
+def queue_sms_bulk(
+    smss: List[SMSMessageCreate] = Body(..., min_length=1, max_length=SMS_BULK_LIMIT),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue many SMS in one insert (e.g. a cycle's balance alerts).
 
-    return service.queue_sms(sms)
+    Idempotent per message like POST /sms/: keys already queued are skipped
+    and the existing SMS is returned in their place, in request order.
+    """
+    service = SMSService(db)
+    queued, created = service.queue_sms_bulk(smss)
+    if created:
+        sms_cache.clear()
+    return adapter_json_response(_SMS_LIST, queued)
 
 
 @router.get("/", response_model=List[SMSMessageResponse])
+@sms_cache
 def get_all_sms(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=1, description=AFTER_ID_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get all SMS messages"""
     service = SMSService(db)
-    return service.get_all_sms(skip, limit)
+    sms_list = service.get_all_sms(skip, limit, after_id)
+    return adapter_json_response(_SMS_LIST, sms_list)
 
 
 @router.get("/pending", response_model=List[SMSMessageResponse])
+@sms_cache
 def get_pending_sms(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=1, description=AFTER_ID_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get pending SMS (not yet sent)"""
     service = SMSService(db)
-    return service.get_pending_sms(skip, limit)
+    sms_list = service.get_pending_sms(skip, limit, after_id)
+    return adapter_json_response(_SMS_LIST, sms_list)
 
 
 @router.get("/retry-scheduled", response_model=List[SMSMessageResponse])
+@sms_cache
 def get_retry_scheduled(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=1, description=AFTER_ID_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get SMS ready for retry (for scheduler)"""
     service = SMSService(db)
-    return service.get_retry_scheduled(skip, limit)
+    sms_list = service.get_retry_scheduled(skip, limit, after_id)
+    return adapter_json_response(_SMS_LIST, sms_list)
 
 
 @router.get("/client/{client_id}", response_model=List[SMSMessageResponse])
+@sms_cache
 def get_sms_by_client(
     client_id: int,
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=1, description=AFTER_ID_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get SMS messages for specific client"""
     service = SMSService(db)
-    return service.get_sms_by_client(client_id, skip, limit)
+    sms_list = service.get_sms_by_client(client_id, skip, limit, after_id)
+    return adapter_json_response(_SMS_LIST, sms_list)
 
 
 @router.get("/phone/{phone_number}", response_model=List[SMSMessageResponse])
+@sms_cache
 def get_sms_by_phone(
     phone_number: str,
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=1, description=AFTER_ID_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """Get SMS messages for specific phone number"""
     service = SMSService(db)
-    return service.get_sms_by_phone(phone_number, skip, limit)
+    sms_list = service.get_sms_by_phone(phone_number, skip, limit, after_id)
+    return adapter_json_response(_SMS_LIST, sms_list)
 
 
 @router.get("/{sms_id}", response_model=SMSMessageResponse)
-def get_sms(sms_id: int, db: Session = Depends(get_db)):
+@sms_cache
+def get_sms(sms_id: int, request: Request, db: Session = Depends(get_db)):
     """Get specific SMS by ID"""
     service = SMSService(db)
     sms = service.get_sms(sms_id)
     if not sms:
         raise HTTPException(status_code=404, detail="SMS not found")
-    return sms
+    return adapter_json_response(_SMS, sms)
 
 
 @router.post("/{sms_id}/send")
@@ -100,16 +168,16 @@ async def send_sms(sms_id: int, db: Session = Depends(get_db)):
     Records delivery attempt in history.
     """
     service = SMSService(db)
-    success, error = await service.send_sms(sms_id)
+    success, error, sms_status = await service.send_sms(sms_id)
+    sms_cache.clear()
 
     if not success:
         raise HTTPException(status_code=400, detail=error or "Failed to send SMS")
 
-    sms = service.get_sms(sms_id)
     return {
         "success": True,
         "sms_id": sms_id,
-        "status": sms.status if sms else "SENT",
+        "status": sms_status,
         "message": "SMS sent successfully",
     }
 
@@ -124,24 +192,39 @@ async def process_retry_queue(
     SCHEDULER: Call this endpoint every 5-10 minutes.
     """
     service = SMSService(db)
-    retry_sms = service.get_retry_scheduled(skip=0, limit=limit)
+    retry_sms = await to_thread.run_sync(service.get_retry_scheduled, 0, limit)
+    # Ids up front: each send commits, which expires the listed rows
+    sms_ids = [sms.id for sms in retry_sms]
+
+    # Gateway calls overlap; SMSService runs each send's DB work in a worker
+    # thread under its own lock, so the shared session is used by one at a time
+    semaphore = asyncio.Semaphore(SMS_RETRY_CONCURRENCY)
+
+    async def send(sms_id: int):
+        async with semaphore:
+            return await service.send_sms(sms_id)
+
+    outcomes = await asyncio.gather(
+        *(send(sms_id) for sms_id in sms_ids), return_exceptions=True
+    )
 
     results = {"processed": 0, "successful": 0, "failed": 0, "errors": []}
 
-    for sms in retry_sms:
+    for sms_id, outcome in zip(sms_ids, outcomes):
         results["processed"] += 1
-        try:
-            success, error = await service.send_sms(sms.id)
-            if success:
-                results["successful"] += 1
-            else:
-                results["failed"] += 1
-                results["errors"].append({"sms_id": sms.id, "error": error})
-        except Exception as e:
+        if isinstance(outcome, Exception):
+            results["failed"] += 1
+            results["errors"].append({"sms_id": sms_id, "error": str(outcome)})
+            logger.error(f"Error sending SMS {sms_id}: {str(outcome)}")
+            continue
+        success, error, _ = outcome
+        if success:
+            results["successful"] += 1
+        else:
             results["failed"] += 1
-            results["errors"].append({"sms_id": sms.id, "error": str(e)})
-            logger.error(f"Error sending SMS {sms.id}: {str(e)}")
+            results["errors"].append({"sms_id": sms_id, "error": error})
 
+    sms_cache.clear()
     return results
 
 
@@ -152,6 +235,7 @@ def record_sent(sms_id: int, gateway_reference: str, db: Session = Depends(get_d
     sms = service.record_sent(sms_id, gateway_reference)
     if not sms:
         raise HTTPException(status_code=404, detail="SMS not found")
+    sms_cache.clear()
     return sms
 
 
@@ -162,6 +246,7 @@ def record_failed(sms_id: int, error_reason: str, db: Session = Depends(get_db))
     sms = service.record_failed(sms_id, error_reason)
     if not sms:
         raise HTTPException(status_code=404, detail="SMS not found")
+    sms_cache.clear()
     return sms
 
 
@@ -198,6 +283,7 @@ def process_textbee_callback(
             status_code=404,
             detail=f"SMS with gateway reference '{gateway_reference}' not found",
         )
+    sms_cache.clear()
 
     return {
         "success": True,
@@ -6,10 +6,54 @@ No hardcoding needed - handles variable holidays like Easter automatically.
 """
 
 from datetime import date
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import holidays as holidays_lib
 
 
+# Per-year holiday dates and names, filled at import for the years the app
+# actually asks about; other years are loaded on first use by _load_year.
+_HOLIDAY_SETS: Dict[int, FrozenSet[date]] = {}
+_HOLIDAY_NAMES: Dict[int, Dict[date, str]] = {}
+
+
+def _load_year(year: int) -> FrozenSet[date]:
+    """Build one year's Tanzania holidays into the module-level tables"""
+    names = dict(holidays_lib.Tanzania(years=year))
+    _HOLIDAY_NAMES[year] = names
+    holiday_set = _HOLIDAY_SETS[year] = frozenset(names)
+    return holiday_set
+
+
+def _tz_holiday_set(year: int) -> FrozenSet[date]:
+    """One year's holiday dates as a plain set, for cheap membership checks"""
+    holiday_set = _HOLIDAY_SETS.get(year)
+    if holiday_set is None:
+        holiday_set = _load_year(year)
+    return holiday_set
+
+
+def _tz_holiday_names(year: int) -> Dict[date, str]:
+    """One year's holiday names keyed by date"""
+    names = _HOLIDAY_NAMES.get(year)
+    if names is None:
+        _load_year(year)
+        names = _HOLIDAY_NAMES[year]
+    return names
+
+
+_this_year = date.today().year
+for _year in range(_this_year - 1, _this_year + 4):
+    _load_year(_year)
+del _this_year, _year
+
+
+@lru_cache(maxsize=16)
+def _sorted_holidays(years: Tuple[int, ...]) -> Tuple[date, ...]:
+    """Sorted, de-duplicated holiday dates across years"""
+    return tuple(sorted(set().union(*(_tz_holiday_set(year) for year in years))))
+
+
 def get_holidays(year: Optional[int] = None) -> List[date]:
     """
     Get the holiday list for Tanzania and a specific year.
@@ -27,24 +71,15 @@ def get_holidays(year: Optional[int] = None) -> List[date]:
         >>> get_holidays()  # Tanzania, 2024-2026
         >>> get_holidays(2026)  # Tanzania, just 2026
     """
-    holiday_list = []
-    
     if year is None:
         # Get holidays for current year and next 2 years for future-proofing
-        import datetime
-        current_year = datetime.date.today().year
-        years = [current_year, current_year + 1, current_year + 2]
+        current_year = date.today().year
+        years = (current_year, current_year + 1, current_year + 2)
     else:
-        years = [year]
-    
-    # Create a Tanzania holidays instance for the specified years
-    tz_holidays = holidays_lib.Tanzania(years=years)
-    
-    # Extract all holiday dates
-    holiday_list = list(tz_holidays.keys())
-    
-    # Remove duplicates and sort
-    return sorted(list(set(holiday_list)))
+        years = (year,)
+
+    # Fresh list per call; the cached tuple is shared
+    return list(_sorted_holidays(years))
 
 
 def is_holiday(check_date: date) -> bool:
@@ -61,8 +96,7 @@ def is_holiday(check_date: date) -> bool:
         >>> is_holiday(date(2026, 1, 1))  # New Year - True
         >>> is_holiday(date(2026, 1, 5))  # Random weekday - False
     """
-    tz_holidays = holidays_lib.Tanzania(years=check_date.year)
-    return check_date in tz_holidays
+    return check_date in _tz_holiday_set(check_date.year)
 
 
 def get_holiday_name(check_date: date) -> Optional[str]:
@@ -79,5 +113,4 @@ def get_holiday_name(check_date: date) -> Optional[str]:
         >>> get_holiday_name(date(2026, 1, 1))  # 'New Year's Day'
         >>> get_holiday_name(date(2026, 1, 5))  # None
     """
-    tz_holidays = holidays_lib.Tanzania(years=check_date.year)
-    return tz_holidays.get(check_date)
+    return _tz_holiday_names(check_date.year).get(check_date)
@@ -10,19 +10,252 @@ Usage:
     )
     def approve_reading(...):
         ...
+
+Entries are handed to AuditLogWriter, which inserts them from a background
+thread in batches, so the decorated call does not wait on an audit commit.
 """
 
+import atexit
 import functools
-import json
-from typing import Callable, Optional, Any, Dict
-from sqlalchemy.orm import Session
-from app.models.audit_log import AuditAction
+import inspect
+import queue
+import re
+import string
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional, Any, Dict, List, Tuple
+from anyio import to_thread
+from pydantic_core import to_jsonable_python
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.audit_log import AuditAction, AuditLog
 from app.schemas.audit_log import AuditLogCreate
-from app.repositories.audit_log import AuditLogRepository
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Pending entries held in memory; when full, submit() writes inline instead
+AUDIT_QUEUE_SIZE = 10_000
+# Most entries inserted by one statement
+AUDIT_BATCH_SIZE = 200
+# How long a batch waits to fill before it is flushed anyway (seconds)
+AUDIT_FLUSH_INTERVAL = 0.05
+
+
+class AuditLogWriter:
+    """
+    Batches audit log inserts on a daemon thread.
+
+    submit() queues an entry and returns at once; the writer thread flushes
+    up to AUDIT_BATCH_SIZE entries per INSERT and commit, whenever a batch
+    fills or AUDIT_FLUSH_INTERVAL passes, using its own session so request
+    sessions are never held. The timestamp is taken at submit time.
+
+    A failed batch is retried row by row; a row that still fails is logged
+    in full. Queued entries are flushed by the app lifespan and at
+    interpreter exit, but are lost if the process is killed before then.
+    """
+
+    _instance: Optional["AuditLogWriter"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def instance(cls) -> "AuditLogWriter":
+        """The process-wide writer, started on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    # Exits that skip the lifespan (scripts, workers) still flush
+                    atexit.register(cls._instance.flush)
+        return cls._instance
+
+    def submit(self, entry: AuditLogCreate) -> None:
+        """Queue an entry; if the queue is full, write it inline rather than drop it"""
+        row = entry.model_dump()
+        row["timestamp"] = datetime.utcnow()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("Audit log queue full; writing entry inline")
+            self._write([row])
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, rows: List[Dict]) -> None:
+        """
+        Insert rows in one statement. If that fails (one bad row, a dropped
+        connection), each row is retried in its own transaction so the rest
+        still land; a row that fails again is logged with its contents.
+        """
+        error = self._insert(rows)
+        if error is None:
+            return
+        logger.warning(
+            f"Audit batch of {len(rows)} entries failed ({error}); "
+            "retrying one at a time"
+        )
+        for row in rows:
+            error = self._insert([row])
+            if error is not None:
+                logger.error(f"Failed to write audit log entry {row!r}: {error}")
+
+    def _insert(self, rows: List[Dict]) -> Optional[Exception]:
+        # Table-level insert: the schema's "metadata" field is the column name
+        db = self._session_factory()
+        try:
+            db.execute(insert(AuditLog.__table__), rows)
+            db.commit()
+            return None
+        except Exception as e:
+            db.rollback()
+            return e
+        finally:
+            db.close()
+
+
+def flush_audit_log() -> None:
+    """Write out pending audit entries (called on application shutdown)"""
+    if AuditLogWriter._instance is not None:
+        AuditLogWriter._instance.flush()
+
+
+def _template_fields(template: Optional[str]) -> Tuple[str, ...]:
+    """Argument names a description template refers to ({meter_id}, {reading.id})"""
+    if not template:
+        return ()
+    names = (
+        re.split(r"[.\[]", field_name, maxsplit=1)[0]
+        for _, field_name, _, _ in string.Formatter().parse(template)
+        if field_name
+    )
+    return tuple(dict.fromkeys(names))
+
+
+class _AuditSpec:
+    """
+    One decorator application's settings, with per-call constants derived once.
+
+    build() turns a decorated call's result and kwargs into an audit entry.
+    """
+
+    __slots__ = (
+        "action",
+        "entity_type",
+        "get_entity_id",
+        "description_template",
+        "get_metadata",
+        "admin_username_key",
+        "template_fields",
+        "entity_id_key",
+        "default_prefix",
+    )
+
+    def __init__(
+        self,
+        action: AuditAction,
+        entity_type: str,
+        get_entity_id: Optional[Callable[[Any], int]],
+        description_template: Optional[str],
+        get_metadata: Optional[Callable[[Any], Dict]],
+        admin_username_key: str,
+    ):
+        self.action = action
+        self.entity_type = entity_type
+        self.get_entity_id = get_entity_id
+        self.description_template = description_template
+        self.get_metadata = get_metadata
+        self.admin_username_key = admin_username_key
+        self.template_fields = _template_fields(description_template)
+        self.entity_id_key = f"{entity_type}_id"
+        self.default_prefix = f"{action.value} on {entity_type} "
+
+    def build(self, result: Any, kwargs: Dict) -> Optional[AuditLogCreate]:
+        """The audit entry for a decorated call, or None without an entity id"""
+        # Extract admin username
+        admin_username = kwargs.get(self.admin_username_key, "system")
+
+        # Extract entity_id
+        entity_id = None
+        if self.get_entity_id:
+            try:
+                entity_id = self.get_entity_id(result)
+            except Exception as e:
+                logger.warning(f"Failed to extract entity_id: {e}")
+
+        # If entity_id not from result, try from kwargs
+        if entity_id is None:
+            entity_id = kwargs.get(self.entity_id_key)
+
+        if not entity_id:
+            return None
+
+        # Generate description; template_fields was parsed once at decoration,
+        # so a missing argument is a branch rather than a caught KeyError
+        description = self.default_prefix + str(entity_id)
+        if self.description_template:
+            format_kwargs = {
+                k: kwargs[k] for k in self.template_fields if k in kwargs
+            }
+            if len(format_kwargs) == len(self.template_fields):
+                try:
+                    description = self.description_template.format_map(
+                        format_kwargs
+                    )
+                except Exception:
+                    pass
+
+        # Extract metadata; the JSON column encodes it, so only make the
+        # values JSON-safe (Decimal, datetime, ...) here
+        metadata = None
+        if self.get_metadata:
+            try:
+                metadata = to_jsonable_python(self.get_metadata(result))
+            except Exception as e:
+                logger.warning(f"Failed to extract metadata: {e}")
+
+        return AuditLogCreate(
+            admin_username=admin_username,
+            action=self.action,
+            entity_type=self.entity_type,
+            entity_id=entity_id,
+            description=description,
+            metadata=metadata,
+        )
+
+
+def _undecorated(func: Callable) -> Callable:
+    return func
+
 
 def audit_log(
     action: AuditAction,
@@ -35,6 +268,9 @@ def audit_log(
     """
     Decorator to automatically log admin actions to audit trail.
 
+    Works on plain and async functions; which wrapper to use is decided
+    once, when the decorator is applied.
+
     Args:
         action: The AuditAction enum value
         entity_type: Type of entity (e.g., "reading", "cycle", "payment")
@@ -54,71 +290,47 @@ def audit_log(
             ...
     """
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Execute the actual function
-            result = func(*args, **kwargs)
-
-            # Extract admin username
-            admin_username = kwargs.get(admin_username_key, "system")
+    if not settings.audit_enabled:
+        # Decided at import: disabled auditing leaves functions unwrapped
+        return _undecorated
 
-            # Extract entity_id
-            entity_id = None
-            if get_entity_id:
-                try:
-                    entity_id = get_entity_id(result)
-                except Exception as e:
-                    logger.warning(f"Failed to extract entity_id: {e}")
+    spec = _AuditSpec(
+        action,
+        entity_type,
+        get_entity_id,
+        description_template,
+        get_metadata,
+        admin_username_key,
+    )
 
-            # If entity_id not from result, try from kwargs
-            if entity_id is None and f"{entity_type}_id" in kwargs:
-                entity_id = kwargs[f"{entity_type}_id"]
+    def entry_for(result: Any, kwargs: Dict) -> Optional[AuditLogCreate]:
+        try:
+            return spec.build(result, kwargs)
+        except Exception as e:
+            # Don't fail the original operation if audit logging fails
+            logger.error(f"Failed to create audit log: {e}")
+            return None
 
-            # Generate description
-            if description_template:
-                try:
-                    description = description_template.format(**kwargs)
-                except Exception:
-                    description = f"{action.value} on {entity_type} {entity_id}"
-            else:
-                description = f"{action.value} on {entity_type} {entity_id}"
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
 
-            # Extract metadata
-            metadata = None
-            if get_metadata:
-                try:
-                    metadata_dict = get_metadata(result)
-                    metadata = json.dumps(metadata_dict)
-                except Exception as e:
-                    logger.warning(f"Failed to extract metadata: {e}")
-
-            # Get DB session from args/kwargs
-            db: Optional[Session] = None
-            for arg in args:
-                if isinstance(arg, Session):
-                    db = arg
-                    break
-            if not db:
-                db = kwargs.get("db")
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                entry = entry_for(result, kwargs)
+                if entry is not None:
+                    # Off the event loop: a full queue falls back to an inline write
+                    await to_thread.run_sync(AuditLogWriter.instance().submit, entry)
+                return result
 
-            # Log to audit trail
-            if db and entity_id:
-                try:
-                    audit_repo = AuditLogRepository(db)
-                    audit_entry = AuditLogCreate(
-                        admin_username=admin_username,
-                        action=action,
-                        entity_type=entity_type,
-                        entity_id=entity_id,
-                        description=description,
-                        metadata=metadata,
-                    )
-                    audit_repo.create(audit_entry)
-                except Exception as e:
-                    # Don't fail the original operation if audit logging fails
-                    logger.error(f"Failed to create audit log: {e}")
+            return async_wrapper
 
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            entry = entry_for(result, kwargs)
+            if entry is not None:
+                AuditLogWriter.instance().submit(entry)
             return result
 
         return wrapper
@@ -126,85 +338,5 @@ def audit_log(
     return decorator
 
 
-def audit_log_async(
-    action: AuditAction,
-    entity_type: str,
-    get_entity_id: Optional[Callable[[Any], int]] = None,
-    description_template: Optional[str] = None,
-    get_metadata: Optional[Callable[[Any], Dict]] = None,
-    admin_username_key: str = "admin_username",
-):
-    """
-    Async version of audit_log decorator for async functions.
-    """
-
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Execute the actual function
-            result = await func(*args, **kwargs)
-
-            # Extract admin username
-            admin_username = kwargs.get(admin_username_key, "system")
-
-            # Extract entity_id
-            entity_id = None
-            if get_entity_id:
-                try:
-                    entity_id = get_entity_id(result)
-                except Exception as e:
-                    logger.warning(f"Failed to extract entity_id: {e}")
-
-            # If entity_id not from result, try from kwargs
-            if entity_id is None and f"{entity_type}_id" in kwargs:
-                entity_id = kwargs[f"{entity_type}_id"]
-
-            # Generate description
-            if description_template:
-                try:
-                    description = description_template.format(**kwargs)
-                except Exception:
-                    description = f"{action.value} on {entity_type} {entity_id}"
-            else:
-                description = f"{action.value} on {entity_type} {entity_id}"
-
-            # Extract metadata
-            metadata = None
-            if get_metadata:
-                try:
-                    metadata_dict = get_metadata(result)
-                    metadata = json.dumps(metadata_dict)
-                except Exception as e:
-                    logger.warning(f"Failed to extract metadata: {e}")
-
-            # Get DB session from args/kwargs
-            db: Optional[Session] = None
-            for arg in args:
-                if isinstance(arg, Session):
-                    db = arg
-                    break
-            if not db:
-                db = kwargs.get("db")
-
-            # Log to audit trail
-            if db and entity_id:
-                try:
-                    audit_repo = AuditLogRepository(db)
-                    audit_entry = AuditLogCreate(
-                        admin_username=admin_username,
-                        action=action,
-                        entity_type=entity_type,
-                        entity_id=entity_id,
-                        description=description,
-                        metadata=metadata,
-                    )
-                    audit_repo.create(audit_entry)
-                except Exception as e:
-                    # Don't fail the original operation if audit logging fails
-                    logger.error(f"Failed to create audit log: {e}")
-
-            return result
-
-        return wrapper
-
-    return decorator
+# audit_log handles coroutine functions itself; kept for existing imports
+audit_log_async = audit_log
@@ -5,6 +5,25 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     database_url: str = Field(..., min_length=1, description="PostgreSQL URL")
 
+    # Connection pool sizing (ignored for SQLite)
+    db_pool_size: int = Field(default=20, ge=1, description="Persistent pool size")
+    db_max_overflow: int = Field(
+        default=40, ge=0, description="Extra connections allowed under burst"
+    )
+    db_pool_timeout: int = Field(
+        default=5, ge=1, description="Seconds to wait for a free connection"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, ge=-1, description="Recycle connections after N seconds"
+    )
+    db_pool_prewarm: int = Field(
+        default=5, ge=0, description="Connections opened at startup (<= pool size)"
+    )
+    db_external_pooler: bool = Field(
+        default=False,
+        description="Behind PgBouncer (transaction mode): skip app-side pooling",
+    )
+
     # SMS Gateway (Africa's Talking) Configuration
     sms_gateway_url: str = Field(
         default="https://api.africastalking.com/version1/messaging",
@@ -14,6 +33,11 @@ class Settings(BaseSettings):
     sms_username: str = Field(default="", description="Africa's Talking username")
     sms_sender_id: str = Field(default="", description="SMS sender ID (optional)")
 
+    audit_enabled: bool = Field(
+        default=True,
+        description="Audit-log decorated admin actions (off: decorators are no-ops)",
+    )
+
     submission_window_days: int = Field(
         default=5, ge=1, description="Target date window tolerance"
     )
@@ -14,6 +14,8 @@ class MobileAuthMiddleware:
     For MVP, we verify a collector token is provided.
     """
 
+    __slots__ = ("expected_token",)
+
     def __init__(self, token: Optional[str] = None):
         """
         Initialize with optional expected token.
@@ -42,6 +44,8 @@ class MobileAuthMiddleware:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # "Bearer <token>" split on any whitespace, so leading spaces and tab
+        # separators are accepted and a token containing whitespace is not
         parts = auth_header.split()
         if len(parts) != 2 or parts[0].lower() != "bearer":
             raise HTTPException(
@@ -63,15 +67,21 @@ class MobileAuthMiddleware:
         return token
 
 
-def require_mobile_auth(request: Request) -> str:
+# Holds no per-request state, so one instance serves every request
+_default_auth = MobileAuthMiddleware()
+
+
+async def require_mobile_auth(request: Request) -> str:
     """
     Dependency for FastAPI routes that require mobile authentication.
     Returns the collector token/ID from Authorization header.
 
+    Declared async because it only parses a header: FastAPI then runs it on
+    the event loop instead of spending a threadpool hop on it.
+
     Usage:
         @router.post("/readings")
         def submit_reading(collector_id: str = Depends(require_mobile_auth)):
             ...
     """
-    middleware = MobileAuthMiddleware()
-    return middleware.validate(request)
+    return _default_auth.validate(request)
@@ -1,7 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, future=True)
+
+def _engine_options(database_url: str) -> dict:
+    """Pool options for the engine; SQLite keeps SQLAlchemy's defaults"""
+    if database_url.startswith("sqlite"):
+        return {}
+    if settings.db_external_pooler:
+        # PgBouncer already pools server connections; a second pool here
+        # would only hold idle client connections open per worker
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+engine = create_engine(
+    settings.database_url, future=True, **_engine_options(settings.database_url)
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+
+def warm_pool() -> int:
+    """
+    Establish up to db_pool_prewarm pooled connections before serving.
+
+    The connections are opened in parallel and all held at once, so each is
+    a distinct connection, then returned to the pool with TCP, TLS and auth
+    already done. A failure is left for the first request to surface.
+    Returns how many were opened.
+    """
+    if not isinstance(engine.pool, QueuePool):
+        return 0
+    count = min(settings.db_pool_prewarm, engine.pool.size())
+    if not count:
+        return 0
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        attempts = [executor.submit(engine.connect) for _ in range(count)]
+    opened = 0
+    for attempt in attempts:
+        if attempt.exception() is None:
+            attempt.result().close()
+            opened += 1
+    return opened
@@ -1,21 +1,55 @@
+from contextlib import asynccontextmanager
+from importlib import import_module
+
+from anyio import to_thread
 from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+
+from app.core.audit_decorator import flush_audit_log
+from app.core.config import settings
+from app.db.session import warm_pool
+from app.services.africastalking_client import close_http_client
+
+# (module, router attribute, prefix, tags). Routers are imported when the
+# app is built: OpenAPI and route matching need every route up front, so
+# this table is the one place a route module is listed.
+_ROUTES = (
+    ("app.api.routes.health", "router", "/api/v1", None),
+    ("app.api.routes.clients", "router", "/api/v1", None),
+    ("app.api.routes.meters", "router", "/api/v1", None),
+    ("app.api.routes.meter_assignments", "router", "/api/v1", None),
+    ("app.api.routes.cycles", "router", "/api/v1", None),
+    ("app.api.routes.readings", "router", "/api/v1", None),
+    ("app.api.routes.anomaly_conflict", "router", "/api/v1", None),
+    ("app.api.routes.billing", "router", "/api/v1", None),
+    ("app.api.routes.audit_logs", "router", "/api/v1", None),
+    ("app.api.routes.sms", "router", "/api/v1/sms", ["sms"]),
+    ("app.api.routes.exports", "router", "/api/v1", None),
+    ("app.api.routes.archive", "router", "/api/v1", None),
+    ("app.api.routes.mobile", "router", "/api/v1", None),
+    ("app.api.routes.auth", "router", "", None),
+    ("app.api.routes.auth", "admin_router", "", None),
+)
+
 
-from app.api.routes.health import router as health_router
-from app.api.routes.clients import router as clients_router
-from app.api.routes.meters import router as meters_router
-from app.api.routes.meter_assignments import router as meter_assignments_router
-from app.api.routes.cycles import router as cycles_router
-from app.api.routes.readings import router as readings_router
-from app.api.routes.anomaly_conflict import router as anomaly_conflict_router
-from app.api.routes.billing import router as billing_router
-from app.api.routes.audit_logs import router as audit_logs_router
-from app.api.routes.sms import router as sms_router
-from app.api.routes.exports import router as exports_router
-from app.api.routes.archive import router as archive_router
-from app.api.routes.mobile import router as mobile_router
-from app.api.routes.auth import router as auth_router, admin_router as admin_auth_router
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync routes run in anyio's threadpool (40 threads by default); match
+    # it to the DB pool so blocking requests can use every connection
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.db_pool_size + settings.db_max_overflow
+    )
+    await to_thread.run_sync(warm_pool)
+    yield
+    await close_http_client()
+    await to_thread.run_sync(flush_audit_log)
 
-app = FastAPI(title="AquaBill API", version="0.1.0")
+
+app = FastAPI(title="AquaBill API", version="0.1.0", lifespan=lifespan)
+
+# CSV exports and JSON lists compress well; small bodies are sent as-is.
+# Streamed exports are compressed chunk by chunk, never buffered whole.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.get("/")
@@ -28,18 +62,10 @@ def favicon():
     return Response(status_code=204)
 
 
-app.include_router(health_router, prefix="/api/v1")
-app.include_router(clients_router, prefix="/api/v1")
-app.include_router(meters_router, prefix="/api/v1")
-app.include_router(meter_assignments_router, prefix="/api/v1")
-app.include_router(cycles_router, prefix="/api/v1")
-app.include_router(readings_router, prefix="/api/v1")
-app.include_router(anomaly_conflict_router, prefix="/api/v1")
-app.include_router(billing_router, prefix="/api/v1")
-app.include_router(audit_logs_router, prefix="/api/v1")
-app.include_router(sms_router, prefix="/api/v1/sms", tags=["sms"])
-app.include_router(exports_router, prefix="/api/v1")
-app.include_router(archive_router, prefix="/api/v1")
-app.include_router(mobile_router, prefix="/api/v1")
-app.include_router(auth_router)
-app.include_router(admin_auth_router)
+def _register_routes(app: FastAPI) -> None:
+    for module_name, attribute, prefix, tags in _ROUTES:
+        router = getattr(import_module(module_name), attribute)
+        app.include_router(router, prefix=prefix, tags=tags)
+
+
+_register_routes(app)
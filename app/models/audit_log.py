@@ -1,7 +1,8 @@
 """Audit log model for tracking all admin actions - immutable append-only log"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, Enum as SQLEnum
+from sqlalchemy import JSON, Column, Integer, String, DateTime, Text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 import enum
@@ -78,9 +79,11 @@ class AuditLog(Base):
 
     # Additional context
     description = Column(Text, nullable=False)  # Human-readable description
+    # Structured context as JSONB on PostgreSQL, JSON elsewhere (the attribute
+    # is renamed because "metadata" is reserved on declarative models)
     metadata_json = Column(
-        "metadata", Text, nullable=True
-    )  # JSON string with additional context (rename attr to avoid reserved name)
+        "metadata", JSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )
 
     # IP address for security auditing
     ip_address = Column(String(45), nullable=True)  # IPv6 max length
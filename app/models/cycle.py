@@ -4,7 +4,7 @@ Cycle model - represents billing periods with state machine.
 
 import enum
 from datetime import date
-from sqlalchemy import Column, Integer, Date, String, CheckConstraint, func
+from sqlalchemy import Column, Integer, Date, String, CheckConstraint, Index, func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -94,4 +94,6 @@ class Cycle(Base):
             "status IN ('OPEN', 'PENDING_REVIEW', 'APPROVED', 'CLOSED', 'ARCHIVED')",
             name="ck_cycle_status_valid",
         ),
+        # get_by_date: start_date <= d AND end_date >= d
+        Index("ix_cycles_date_range", "start_date", "end_date"),
     )
@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -76,4 +77,9 @@ class LedgerEntry(Base):
             "entry_type IN ('CHARGE', 'ADJUSTMENT', 'PAYMENT', 'PENALTY')",
             name="ck_ledger_type_valid",
         ),
+        # Filtered list routes order by created_at within one assignment/cycle
+        Index(
+            "ix_ledger_entries_assignment_created", "meter_assignment_id", "created_at"
+        ),
+        Index("ix_ledger_entries_cycle_created", "cycle_id", "created_at"),
     )
@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -64,4 +65,7 @@ class Payment(Base):
 
     __table_args__ = (
         CheckConstraint("amount >= 0", name="ck_payment_amount_non_negative"),
+        # Filtered list routes order by received_at within one assignment/client
+        Index("ix_payments_assignment_received", "meter_assignment_id", "received_at"),
+        Index("ix_payments_client_received", "client_id", "received_at"),
     )
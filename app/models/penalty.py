@@ -11,6 +11,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     CheckConstraint,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship
@@ -77,4 +78,5 @@ class Penalty(Base):
             "(status = 'WAIVED' AND waived_at IS NOT NULL AND waived_by IS NOT NULL)",
             name="ck_penalty_waive_consistency",
         ),
+        Index("ix_penalties_assignment_created", "meter_assignment_id", "created_at"),
     )
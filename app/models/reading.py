@@ -15,7 +15,9 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     CheckConstraint,
+    Index,
     func,
+    text,
 )
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -118,4 +120,13 @@ class Reading(Base):
             "(approved = false AND approved_at IS NULL AND approved_by IS NULL)",
             name="ck_reading_approval_consistency",
         ),
+        # Keyset pages of /mobile/updates: ORDER BY updated_at, id
+        Index("ix_readings_updated_id", "updated_at", "id"),
+        # Admin review queue (GET /readings/pending): only unapproved rows
+        Index(
+            "ix_readings_pending",
+            "submitted_at",
+            postgresql_where=text("approved = false"),
+            sqlite_where=text("approved = false"),
+        ),
     )
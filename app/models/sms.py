@@ -11,7 +11,9 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     NUMERIC,
+    Index,
     func,
+    text,
 )
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -39,6 +41,14 @@ class SMSDeliveryStatus(str, enum.Enum):
     RETRY_SCHEDULED = "RETRY_SCHEDULED"  # Waiting for retry window
 
 
+# Delay before each retry, indexed by retry_count: immediate, 30min, 4hr
+RETRY_DELAYS = (
+    timedelta(minutes=0),  # Immediate (before processing delay)
+    timedelta(minutes=30),  # 30 minutes
+    timedelta(hours=4),  # 4 hours
+)
+
+
 class SMSMessage(Base):
     """
     SMS messages to be sent.
@@ -112,6 +122,27 @@ class SMSMessage(Base):
         "SMSDeliveryHistory", back_populates="sms_message", cascade="all, delete-orphan"
     )
 
+    # Partial indexes over the small slices the queue routes scan; the
+    # repository filters repeat these predicates so the planner can use them
+    __table_args__ = (
+        Index(
+            "ix_sms_pending",
+            "id",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "ix_sms_retry",
+            "next_retry_at",
+            postgresql_where=text(
+                "status IN ('PENDING', 'FAILED') AND retry_count < max_retries"
+            ),
+            sqlite_where=text(
+                "status IN ('PENDING', 'FAILED') AND retry_count < max_retries"
+            ),
+        ),
+    )
+
     def should_retry(self) -> bool:
         """Check if SMS should be retried based on attempt count and time windows"""
         if self.status == SMSStatus.FAILED or self.retry_count >= self.max_retries:
@@ -122,13 +153,8 @@ class SMSMessage(Base):
 
     def calculate_next_retry(self):
         """Calculate when next retry should happen: immediate(0), 30min(1), 4hr(2)"""
-        retry_delays = [
-            timedelta(minutes=0),  # Immediate (before processing delay)
-            timedelta(minutes=30),  # 30 minutes
-            timedelta(hours=4),  # 4 hours
-        ]
-        if self.retry_count < len(retry_delays):
-            self.next_retry_at = datetime.utcnow() + retry_delays[self.retry_count]
+        if self.retry_count < len(RETRY_DELAYS):
+            self.next_retry_at = datetime.utcnow() + RETRY_DELAYS[self.retry_count]
 
     def __repr__(self):
         return f"<SMSMessage(id={self.id}, to={self.phone_number}, status={self.status}, retries={self.retry_count}/{self.max_retries})>"
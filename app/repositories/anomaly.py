@@ -3,15 +3,17 @@ Anomaly repository - data access layer for billing anomalies.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from app.models.anomaly import Anomaly, AnomalyType, AnomalyStatus
 
 
 class AnomalyRepository:
     """Repository for anomaly database operations"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -38,44 +40,63 @@ class AnomalyRepository:
         self.db.refresh(anomaly)
         return anomaly
 
+    def add_many(self, rows: List[dict]) -> None:
+        """Stage several anomalies in the session; the caller commits"""
+        self.db.add_all([Anomaly(**row) for row in rows])
+
     def get(self, anomaly_id: int) -> Optional[Anomaly]:
         """Get anomaly by ID"""
         return self.db.query(Anomaly).filter(Anomaly.id == anomaly_id).first()
 
     def list(self, skip: int = 0, limit: int = 100) -> List[Anomaly]:
         """List all anomalies (newest first)"""
+        # Read schemas expose no relationships; refuse lazy loads so a schema
+        # change cannot silently turn this page into one query per row
         return (
             self.db.query(Anomaly)
+            .options(raiseload("*"))
             .order_by(desc(Anomaly.created_at))
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-    def list_by_status(self, status: AnomalyStatus) -> List[Anomaly]:
+    def list_by_status(
+        self, status: AnomalyStatus, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get anomalies with specific status"""
         return (
             self.db.query(Anomaly)
             .filter(Anomaly.status == status.value)
             .order_by(desc(Anomaly.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_assignment(self, meter_assignment_id: int) -> List[Anomaly]:
+    def list_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get all anomalies for a meter assignment"""
         return (
             self.db.query(Anomaly)
             .filter(Anomaly.meter_assignment_id == meter_assignment_id)
             .order_by(desc(Anomaly.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_cycle(self, cycle_id: int) -> List[Anomaly]:
+    def list_by_cycle(
+        self, cycle_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get all anomalies for a cycle"""
         return (
             self.db.query(Anomaly)
             .filter(Anomaly.cycle_id == cycle_id)
             .order_by(desc(Anomaly.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -124,3 +145,19 @@ class AnomalyRepository:
             )
             .first()
         )
+
+    def assignments_with_unacknowledged_threshold_alert(
+        self, meter_assignment_ids: Iterable[int]
+    ) -> Set[int]:
+        """Which of the given assignments already have a DETECTED threshold alert"""
+        rows = (
+            self.db.query(Anomaly.meter_assignment_id)
+            .filter(
+                Anomaly.meter_assignment_id.in_(set(meter_assignment_ids)),
+                Anomaly.anomaly_type == AnomalyType.METER_ROLLOVER_THRESHOLD.value,
+                Anomaly.status == AnomalyStatus.DETECTED.value,
+            )
+            .distinct()
+            .all()
+        )
+        return {row.meter_assignment_id for row in rows}
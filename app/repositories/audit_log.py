@@ -15,6 +15,8 @@ class AuditLogRepository:
     NO update() or delete() methods - audit logs are immutable.
     """
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -23,7 +25,9 @@ class AuditLogRepository:
         Create a new audit log entry.
         This is the ONLY write operation allowed on audit logs.
         """
-        db_audit_log = AuditLog(**audit_log.model_dump())
+        data = audit_log.model_dump()
+        data["metadata_json"] = data.pop("metadata")
+        db_audit_log = AuditLog(**data)
         self.db.add(db_audit_log)
         self.db.commit()
         self.db.refresh(db_audit_log)
@@ -5,6 +5,8 @@ from app.schemas.client import ClientCreate, ClientUpdate
 
 
 class ClientRepository:
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -5,13 +5,15 @@ Conflict repository - data access layer for billing conflicts.
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from app.models.conflict import Conflict, ConflictType, ConflictStatus
 
 
 class ConflictRepository:
     """Repository for conflict database operations"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -44,38 +46,53 @@ class ConflictRepository:
 
     def list(self, skip: int = 0, limit: int = 100) -> List[Conflict]:
         """List all conflicts (newest first)"""
+        # Read schemas expose no relationships; refuse lazy loads so a schema
+        # change cannot silently turn this page into one query per row
         return (
             self.db.query(Conflict)
+            .options(raiseload("*"))
             .order_by(desc(Conflict.created_at))
             .offset(skip)
             .limit(limit)
             .all()
         )
 
-    def list_by_status(self, status: ConflictStatus) -> List[Conflict]:
+    def list_by_status(
+        self, status: ConflictStatus, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get conflicts with specific status"""
         return (
             self.db.query(Conflict)
             .filter(Conflict.status == status.value)
             .order_by(desc(Conflict.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_assignment(self, meter_assignment_id: int) -> List[Conflict]:
+    def list_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get all conflicts for a meter assignment"""
         return (
             self.db.query(Conflict)
             .filter(Conflict.meter_assignment_id == meter_assignment_id)
             .order_by(desc(Conflict.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_admin(self, admin_id: str) -> List[Conflict]:
+    def list_by_admin(
+        self, admin_id: str, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get conflicts assigned to a specific admin"""
         return (
             self.db.query(Conflict)
             .filter(Conflict.assigned_to == admin_id)
             .order_by(Conflict.severity.desc())
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -3,8 +3,8 @@ Cycle repository - data access layer for billing cycles.
 """
 
 from datetime import date
-from typing import List, Optional
-from sqlalchemy import and_, or_
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import Row, and_, insert, or_, select, update
 from sqlalchemy.orm import Session
 from app.models.cycle import Cycle, CycleStatus
 
@@ -12,6 +12,8 @@ from app.models.cycle import Cycle, CycleStatus
 class CycleRepository:
     """Repository for cycle database operations"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -36,6 +38,29 @@ class CycleRepository:
         self.db.refresh(cycle)
         return cycle
 
+    def create_many(self, rows: List[Dict]) -> List[Row]:
+        """
+        Insert several cycles with one INSERT ... RETURNING and one commit.
+
+        Returns plain rows in input order, so reading them after the commit
+        needs no refresh query.
+        """
+        if not rows:
+            return []
+        table = Cycle.__table__
+        result = self.db.execute(
+            insert(table).returning(*table.c, sort_by_parameter_order=True),
+            [{**row, "status": row["status"].value} for row in rows],
+        )
+        cycles = result.all()
+        self.db.commit()
+        return cycles
+
+    def get_many(self, cycle_ids: Iterable[int]) -> Dict[int, Cycle]:
+        """Get cycles by ID in one query, keyed by id"""
+        cycles = self.db.query(Cycle).filter(Cycle.id.in_(set(cycle_ids))).all()
+        return {cycle.id: cycle for cycle in cycles}
+
     def get(self, cycle_id: int) -> Optional[Cycle]:
         """Get cycle by ID"""
         return self.db.query(Cycle).filter(Cycle.id == cycle_id).first()
@@ -50,9 +75,18 @@ class CycleRepository:
             .all()
         )
 
-    def get_by_status(self, status: CycleStatus) -> List[Cycle]:
-        """Get all cycles with a specific status"""
-        return self.db.query(Cycle).filter(Cycle.status == status.value).all()
+    def get_by_status(
+        self, status: CycleStatus, skip: int = 0, limit: int = 100
+    ) -> List[Cycle]:
+        """Get cycles with a specific status ordered by start_date descending"""
+        return (
+            self.db.query(Cycle)
+            .filter(Cycle.status == status.value)
+            .order_by(Cycle.start_date.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def get_open_cycle(self) -> Optional[Cycle]:
         """Get the currently open cycle (should be at most one)"""
@@ -88,6 +122,14 @@ class CycleRepository:
 
         return query.all()
 
+    def get_in_range(self, start_date: date, end_date: date) -> List[Cycle]:
+        """Get cycles sharing at least one day with [start_date, end_date]"""
+        return (
+            self.db.query(Cycle)
+            .filter(Cycle.start_date <= end_date, Cycle.end_date >= start_date)
+            .all()
+        )
+
     def get_open_past_deadline(self, today: date) -> List[Cycle]:
         """Get OPEN cycles whose submission deadline (target_date) has passed."""
         return (
@@ -97,6 +139,31 @@ class CycleRepository:
             .all()
         )
 
+    def transition_open_past_deadline(
+        self, today: date, new_status: CycleStatus
+    ) -> List[int]:
+        """
+        Move every OPEN cycle past its target_date to new_status in one UPDATE.
+
+        Rows another scheduler run has already locked are skipped rather than
+        waited on. Returns the ids of the cycles that were updated.
+        """
+        overdue = (
+            select(Cycle.id)
+            .where(Cycle.status == CycleStatus.OPEN.value, Cycle.target_date < today)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Cycle)
+            .where(Cycle.id.in_(overdue))
+            .values(status=new_status.value)
+            .returning(Cycle.id)
+            .execution_options(synchronize_session=False)
+        )
+        ids = list(self.db.execute(stmt).scalars())
+        self.db.commit()
+        return ids
+
     def update_status(self, cycle_id: int, new_status: CycleStatus) -> Optional[Cycle]:
         """Update cycle status"""
         cycle = self.get(cycle_id)
@@ -2,8 +2,8 @@
 Ledger entry repository - data access for financial ledger.
 """
 
-from typing import List, Optional
-from sqlalchemy import desc
+from typing import Dict, List, Optional, Set
+from sqlalchemy import Row, desc, insert
 from sqlalchemy.orm import Session
 from app.models.ledger_entry import LedgerEntry, LedgerEntryType
 
@@ -11,6 +11,8 @@ from app.models.ledger_entry import LedgerEntry, LedgerEntryType
 class LedgerEntryRepository:
     """Repository for ledger entries"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -38,6 +40,25 @@ class LedgerEntryRepository:
         self.db.refresh(entry)
         return entry
 
+    def create_many(self, rows: List[Dict]) -> List[Row]:
+        """
+        Insert several entries in one transaction.
+
+        A single bulk INSERT ... RETURNING hands back the new rows (ids and
+        server defaults included). They are plain rows rather than ORM
+        instances, so reading them after the commit needs no refresh query.
+        """
+        if not rows:
+            return []
+        table = LedgerEntry.__table__
+        result = self.db.execute(
+            insert(table).returning(*table.c, sort_by_parameter_order=True),
+            [{**row, "entry_type": row["entry_type"].value} for row in rows],
+        )
+        entries = result.all()
+        self.db.commit()
+        return entries
+
     def get(self, entry_id: int) -> Optional[LedgerEntry]:
         return self.db.query(LedgerEntry).filter(LedgerEntry.id == entry_id).first()
 
@@ -50,19 +71,27 @@ class LedgerEntryRepository:
             .all()
         )
 
-    def list_by_assignment(self, meter_assignment_id: int) -> List[LedgerEntry]:
+    def list_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: Optional[int] = None
+    ) -> List[LedgerEntry]:
         return (
             self.db.query(LedgerEntry)
             .filter(LedgerEntry.meter_assignment_id == meter_assignment_id)
             .order_by(desc(LedgerEntry.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_cycle(self, cycle_id: int) -> List[LedgerEntry]:
+    def list_by_cycle(
+        self, cycle_id: int, skip: int = 0, limit: Optional[int] = None
+    ) -> List[LedgerEntry]:
         return (
             self.db.query(LedgerEntry)
             .filter(LedgerEntry.cycle_id == cycle_id)
             .order_by(desc(LedgerEntry.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -80,6 +109,19 @@ class LedgerEntryRepository:
             .first()
         )
 
+    def get_charged_assignment_ids(self, cycle_id: int) -> Set[int]:
+        """Return assignment ids that already have a CHARGE in the cycle."""
+        rows = (
+            self.db.query(LedgerEntry.meter_assignment_id)
+            .filter(
+                LedgerEntry.cycle_id == cycle_id,
+                LedgerEntry.entry_type == LedgerEntryType.CHARGE.value,
+            )
+            .distinct()
+            .all()
+        )
+        return {row.meter_assignment_id for row in rows}
+
     def get_unpaid_charges_by_assignment(
         self, meter_assignment_id: int
     ) -> List[LedgerEntry]:
@@ -5,6 +5,8 @@ from app.schemas.meter import MeterCreate, MeterUpdate
 
 
 class MeterRepository:
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -1,11 +1,14 @@
 from datetime import date
-from sqlalchemy.orm import Session
+from typing import Iterable
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.models.meter_assignment import MeterAssignment, AssignmentStatus
 from app.schemas.meter_assignment import MeterAssignmentCreate, MeterAssignmentUpdate
 
 
 class MeterAssignmentRepository:
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -24,6 +27,18 @@ class MeterAssignmentRepository:
     def get(self, assignment_id: int) -> MeterAssignment | None:
         return self.db.get(MeterAssignment, assignment_id)
 
+    def get_many_with_meter(
+        self, assignment_ids: Iterable[int]
+    ) -> dict[int, MeterAssignment]:
+        """Get assignments by ID in one query (meter joined), keyed by id"""
+        assignments = (
+            self.db.query(MeterAssignment)
+            .options(joinedload(MeterAssignment.meter))
+            .filter(MeterAssignment.id.in_(set(assignment_ids)))
+            .all()
+        )
+        return {assignment.id: assignment for assignment in assignments}
+
     def get_active_by_meter(self, meter_id: int) -> MeterAssignment | None:
         return (
             self.db.query(MeterAssignment)
@@ -34,9 +49,13 @@ class MeterAssignmentRepository:
             .first()
         )
 
+    # List queries feed id-only schemas; raiseload makes a relationship access
+    # on their rows (an N+1) fail loudly instead of querying per row.
+
     def list_by_client(self, client_id: int) -> list[MeterAssignment]:
         return (
             self.db.query(MeterAssignment)
+            .options(raiseload("*"))
             .filter(MeterAssignment.client_id == client_id)
             .order_by(MeterAssignment.start_date.desc())
             .all()
@@ -45,7 +64,9 @@ class MeterAssignmentRepository:
     def list_active(self, skip: int = 0, limit: int = 50) -> list[MeterAssignment]:
         return (
             self.db.query(MeterAssignment)
+            .options(raiseload("*"))
             .filter(MeterAssignment.status == AssignmentStatus.ACTIVE)
+            .order_by(MeterAssignment.id)
             .offset(skip)
             .limit(limit)
             .all()
@@ -11,6 +11,8 @@ from app.models.payment import Payment
 class PaymentRepository:
     """Repository for payments"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -52,18 +54,26 @@ class PaymentRepository:
             .all()
         )
 
-    def list_by_client(self, client_id: int) -> List[Payment]:
+    def list_by_client(
+        self, client_id: int, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Payment]:
         return (
             self.db.query(Payment)
             .filter(Payment.client_id == client_id)
             .order_by(desc(Payment.received_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def list_by_assignment(self, meter_assignment_id: int) -> List[Payment]:
+    def list_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Payment]:
         return (
             self.db.query(Payment)
             .filter(Payment.meter_assignment_id == meter_assignment_id)
             .order_by(desc(Payment.received_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
@@ -12,6 +12,8 @@ from app.models.penalty import Penalty, PenaltyStatus
 class PenaltyRepository:
     """Repository for penalties"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -49,11 +51,15 @@ class PenaltyRepository:
             .all()
         )
 
-    def list_by_assignment(self, meter_assignment_id: int) -> List[Penalty]:
+    def list_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: Optional[int] = None
+    ) -> List[Penalty]:
         return (
             self.db.query(Penalty)
             .filter(Penalty.meter_assignment_id == meter_assignment_id)
             .order_by(desc(Penalty.created_at))
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -4,15 +4,32 @@ Reading repository - data access layer for meter readings.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import (
+    Row,
+    and_,
+    column,
+    desc,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    values,
+)
+from sqlalchemy.orm import Session, raiseload
 from app.models.reading import Reading, ReadingType
 
+# Rows fetched per round trip by the iter_* methods
+READING_YIELD_PER = 500
+
 
 class ReadingRepository:
     """Repository for reading database operations"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -39,26 +56,133 @@ class ReadingRepository:
         self.db.refresh(reading)
         return reading
 
+    def create_unless_in_cycle(
+        self,
+        meter_assignment_id: int,
+        cycle_id: int,
+        absolute_value: Decimal,
+        reading_type: ReadingType,
+        submitted_by: str,
+        submission_notes: Optional[str] = None,
+    ) -> Optional[Reading]:
+        """
+        Create a reading unless the assignment already has one in the cycle.
+
+        The duplicate check and the insert are one INSERT ... SELECT ...
+        WHERE NOT EXISTS statement. Returns None when a reading already exists.
+        """
+        values = {
+            "meter_assignment_id": meter_assignment_id,
+            "cycle_id": cycle_id,
+            "absolute_value": absolute_value,
+            "type": reading_type.value,
+            "submitted_by": submitted_by,
+            "submission_notes": submission_notes,
+        }
+        already_in_cycle = exists().where(
+            Reading.meter_assignment_id == meter_assignment_id,
+            Reading.cycle_id == cycle_id,
+        )
+        source = select(
+            *(
+                literal(value, type_=Reading.__table__.c[name].type)
+                for name, value in values.items()
+            )
+        ).where(~already_in_cycle)
+        reading = self.db.scalars(
+            insert(Reading).from_select(list(values), source).returning(Reading)
+        ).one_or_none()
+        self.db.commit()
+        return reading
+
+    def insert_many(self, rows: List[Dict]) -> List[Optional[Row]]:
+        """
+        Insert several readings with one statement and no commit.
+
+        Like create_unless_in_cycle for many rows: one INSERT ... SELECT over
+        a VALUES list, where each row carries its own NOT EXISTS guard. Rows
+        must be for distinct (assignment, cycle) pairs and share one set of
+        keys. Returns plain rows in input order, so they stay readable after
+        the caller commits, with None for each row skipped because its
+        assignment already had a reading in the cycle.
+        """
+        if not rows:
+            return []
+        table = Reading.__table__
+        names = list(rows[0])
+        columns = [column(name, table.c[name].type) for name in names]
+        incoming = (
+            values(*columns, name="incoming")
+            .data([tuple(row[name] for name in names) for row in rows])
+            .cte()
+        )
+        already_in_cycle = exists().where(
+            table.c.meter_assignment_id == incoming.c.meter_assignment_id,
+            table.c.cycle_id == incoming.c.cycle_id,
+        )
+        result = self.db.execute(
+            insert(table)
+            .from_select(names, select(*incoming.c).where(~already_in_cycle))
+            .returning(*table.c)
+        )
+        inserted = {(row.meter_assignment_id, row.cycle_id): row for row in result}
+        return [
+            inserted.get((row["meter_assignment_id"], row["cycle_id"]))
+            for row in rows
+        ]
+
     def get(self, reading_id: int) -> Optional[Reading]:
         """Get reading by ID"""
         return self.db.query(Reading).filter(Reading.id == reading_id).first()
 
-    def list(self, skip: int = 0, limit: int = 100) -> List[Reading]:
-        """List all readings (newest first)"""
+    def get_for_update(self, reading_id: int) -> Optional[Reading]:
+        """
+        Get a reading and row-lock it until the session commits.
+
+        Admin actions load through this so two concurrent clicks on the same
+        reading run one after the other: the second waits for the first to
+        commit and then sees its result (e.g. already approved).
+        """
         return (
             self.db.query(Reading)
-            .order_by(desc(Reading.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .filter(Reading.id == reading_id)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+
+    # The list methods below back list endpoints whose schemas only read
+    # columns; raiseload turns an accidental relationship access (an N+1 per
+    # row) into an error instead of a silent query.
+
+    def list(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reading]:
+        """
+        List all readings (newest first).
+
+        With after_id the page starts below that id (an index seek on the
+        primary key) and skip is ignored; otherwise it falls back to OFFSET.
+        """
+        query = (
+            self.db.query(Reading)
+            .options(raiseload("*"))
+            .order_by(desc(Reading.id))
         )
+        if after_id is not None:
+            query = query.filter(Reading.id < after_id)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
     def get_by_assignment(
         self, meter_assignment_id: int, approved_only: bool = False
     ) -> List[Reading]:
         """Get all readings for a meter assignment, ordered by submitted_at"""
-        query = self.db.query(Reading).filter(
-            Reading.meter_assignment_id == meter_assignment_id
+        query = (
+            self.db.query(Reading)
+            .options(raiseload("*"))
+            .filter(Reading.meter_assignment_id == meter_assignment_id)
         )
 
         if approved_only:
@@ -68,13 +192,44 @@ class ReadingRepository:
 
     def get_by_cycle(self, cycle_id: int, approved_only: bool = False) -> List[Reading]:
         """Get all readings for a cycle"""
-        query = self.db.query(Reading).filter(Reading.cycle_id == cycle_id)
+        query = (
+            self.db.query(Reading)
+            .options(raiseload("*"))
+            .filter(Reading.cycle_id == cycle_id)
+        )
 
         if approved_only:
             query = query.filter(Reading.is_approved == True)
 
         return query.order_by(Reading.submitted_at).all()
 
+    def iter_by_assignment(self, meter_assignment_id: int) -> Iterator[Reading]:
+        """get_by_assignment, fetched READING_YIELD_PER rows at a time"""
+        return iter(
+            self.db.query(Reading)
+            .options(raiseload("*"))
+            .filter(Reading.meter_assignment_id == meter_assignment_id)
+            .order_by(Reading.submitted_at)
+            .yield_per(READING_YIELD_PER)
+        )
+
+    def iter_by_cycle(self, cycle_id: int) -> Iterator[Reading]:
+        """get_by_cycle, fetched READING_YIELD_PER rows at a time"""
+        return iter(
+            self.db.query(Reading)
+            .options(raiseload("*"))
+            .filter(Reading.cycle_id == cycle_id)
+            .order_by(Reading.submitted_at)
+            .yield_per(READING_YIELD_PER)
+        )
+
+    def iter_all(self, after_id: Optional[int] = None) -> Iterator[Reading]:
+        """list() without a limit (newest first), READING_YIELD_PER rows at a time"""
+        query = self.db.query(Reading).options(raiseload("*"))
+        if after_id is not None:
+            query = query.filter(Reading.id < after_id)
+        return iter(query.order_by(desc(Reading.id)).yield_per(READING_YIELD_PER))
+
     def get_by_assignment_and_cycle(
         self, meter_assignment_id: int, cycle_id: int
     ) -> Optional[Reading]:
@@ -103,6 +258,75 @@ class ReadingRepository:
             .first()
         )
 
+    def assignments_with_baseline(self, assignment_ids: Iterable[int]) -> Set[int]:
+        """Which of the given assignments have a baseline reading"""
+        rows = self.db.execute(
+            select(Reading.meter_assignment_id)
+            .where(
+                Reading.meter_assignment_id.in_(set(assignment_ids)),
+                Reading.type == ReadingType.BASELINE.value,
+            )
+            .distinct()
+        )
+        return set(rows.scalars())
+
+    def get_by_assignments_and_cycles(
+        self, pairs: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Row]:
+        """
+        Existing readings for (assignment, cycle) pairs in one query.
+
+        Returns plain rows keyed by pair, one per pair.
+        """
+        pairs = set(pairs)
+        if not pairs:
+            return {}
+        table = Reading.__table__
+        rows = self.db.execute(
+            select(*table.c)
+            .where(
+                table.c.meter_assignment_id.in_({a for a, _ in pairs}),
+                table.c.cycle_id.in_({c for _, c in pairs}),
+            )
+            .order_by(table.c.id)
+        )
+        found: Dict[Tuple[int, int], Row] = {}
+        for row in rows:
+            pair = (row.meter_assignment_id, row.cycle_id)
+            if pair in pairs:
+                found.setdefault(pair, row)
+        return found
+
+    def latest_approved_values(
+        self, assignment_ids: Iterable[int]
+    ) -> Dict[int, Decimal]:
+        """absolute_value of each assignment's latest approved reading"""
+        latest = (
+            select(
+                Reading.meter_assignment_id,
+                func.max(Reading.submitted_at).label("submitted_at"),
+            )
+            .where(
+                Reading.meter_assignment_id.in_(set(assignment_ids)),
+                Reading.approved == True,
+            )
+            .group_by(Reading.meter_assignment_id)
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(Reading.meter_assignment_id, Reading.absolute_value)
+            .join(
+                latest,
+                and_(
+                    Reading.meter_assignment_id == latest.c.meter_assignment_id,
+                    Reading.submitted_at == latest.c.submitted_at,
+                ),
+            )
+            .where(Reading.approved == True)
+            .order_by(Reading.id)
+        )
+        return {row.meter_assignment_id: row.absolute_value for row in rows}
+
     def get_latest_approved(
         self, meter_assignment_id: int, exclude_id: Optional[int] = None
     ) -> Optional[Reading]:
@@ -124,8 +348,10 @@ class ReadingRepository:
 
     def get_pending(self) -> List[Reading]:
         """Get all unapproved readings (for admin review)"""
+        # Backs GET /readings/pending, which only reads columns (see list())
         return (
             self.db.query(Reading)
+            .options(raiseload("*"))
             .filter(Reading.approved == False)
             .order_by(Reading.submitted_at)
             .all()
@@ -177,6 +403,31 @@ class ReadingRepository:
             .all()
         )
 
+    def sum_billable_consumption_by_cycle(self, cycle_id: int) -> Dict[int, Decimal]:
+        """
+        Total approved consumption per meter assignment for a cycle.
+
+        Readings without consumption, with an unresolved rollover or with a
+        negative value are excluded. Aggregated in SQL so only one row per
+        assignment comes back.
+        """
+        rows = (
+            self.db.query(
+                Reading.meter_assignment_id,
+                func.sum(Reading.consumption).label("total"),
+            )
+            .filter(
+                Reading.cycle_id == cycle_id,
+                Reading.approved == True,
+                Reading.consumption.isnot(None),
+                Reading.consumption >= 0,
+                or_(Reading.has_rollover == False, Reading.has_rollover.is_(None)),
+            )
+            .group_by(Reading.meter_assignment_id)
+            .all()
+        )
+        return {row.meter_assignment_id: Decimal(row.total) for row in rows}
+
     def approve(
         self,
         reading_id: int,
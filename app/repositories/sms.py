@@ -1,103 +1,242 @@
 """SMS repository"""
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Set, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from app.models.sms import SMSMessage, SMSDeliveryHistory, SMSStatus
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session, raiseload, selectinload
+from sqlalchemy import and_, case, cast, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.sms import RETRY_DELAYS, SMSMessage, SMSDeliveryHistory, SMSStatus
 from app.schemas.sms import SMSMessageCreate, SMSMessageUpdate
 
 
 class SMSRepository:
     """Repository for SMS operations"""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
     def create(self, sms: SMSMessageCreate) -> SMSMessage:
         """Create new SMS message"""
-        db_sms = SMSMessage(**sms.model_dump())
+        data = sms.model_dump()
+        # The mapped attribute is metadata_json (Base.metadata is reserved)
+        data["metadata_json"] = data.pop("metadata")
+        # Column defaults only apply at INSERT; calculate_next_retry needs them now
+        db_sms = SMSMessage(**data, status=SMSStatus.PENDING, retry_count=0)
         db_sms.calculate_next_retry()
         self.db.add(db_sms)
         self.db.commit()
         self.db.refresh(db_sms)
         return db_sms
 
+    def create_unless_duplicate(self, sms: SMSMessageCreate) -> Tuple[SMSMessage, bool]:
+        """
+        Create an SMS, or return the one already queued under its idempotency key.
+
+        The unique index on idempotency_key does the duplicate check, so a new
+        SMS costs one INSERT. Returns (sms, created).
+        """
+        try:
+            return self.create(sms), True
+        except IntegrityError:
+            self.db.rollback()
+            existing = self.get_by_idempotency_key(sms.idempotency_key)
+            if existing is None:
+                raise
+            return existing, False
+
+    def create_many_unless_duplicate(
+        self, smss: Sequence[SMSMessageCreate]
+    ) -> Tuple[List[SMSMessage], Set[str]]:
+        """
+        Create many SMS in one INSERT ... ON CONFLICT (idempotency_key) DO NOTHING.
+
+        Returns every requested SMS in input order (existing ones for keys
+        already queued, one SMS per repeated key) and the idempotency keys
+        that were actually inserted.
+        """
+        if not smss:
+            return [], set()
+        now = datetime.utcnow()
+        rows = {}
+        for sms in smss:
+            rows.setdefault(
+                sms.idempotency_key,
+                {
+                    **sms.model_dump(),
+                    "status": SMSStatus.PENDING,
+                    "retry_count": 0,
+                    # calculate_next_retry for a fresh SMS
+                    "next_retry_at": now + RETRY_DELAYS[0],
+                },
+            )
+
+        # Table-level insert: the schema's "metadata" field is the column name
+        table = SMSMessage.__table__
+        dialect = self.db.get_bind().dialect.name
+        dialect_insert = (
+            postgresql_insert if dialect == "postgresql" else sqlite_insert
+        )
+        stmt = (
+            dialect_insert(table)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(table.c.idempotency_key)
+        )
+        created = set(self.db.execute(stmt).scalars())
+        self.db.commit()
+
+        by_key = {
+            sms.idempotency_key: sms
+            for sms in self._list_query().filter(
+                SMSMessage.idempotency_key.in_(list(rows))
+            )
+        }
+        return [by_key[sms.idempotency_key] for sms in smss], created
+
     def get_by_id(self, sms_id: int) -> Optional[SMSMessage]:
         """Get SMS by ID"""
         return self.db.query(SMSMessage).filter(SMSMessage.id == sms_id).first()
 
+    def get_by_gateway_reference_for_update(
+        self, gateway_reference: str
+    ) -> Optional[SMSMessage]:
+        """Get SMS by gateway reference, row-locked until the session commits"""
+        return (
+            self.db.query(SMSMessage)
+            .filter(SMSMessage.gateway_reference == gateway_reference)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+
     def get_by_idempotency_key(self, key: str) -> Optional[SMSMessage]:
         """Get SMS by idempotency key (prevent duplicates)"""
         return (
             self.db.query(SMSMessage).filter(SMSMessage.idempotency_key == key).first()
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[SMSMessage]:
+    def _list_query(self) -> Query:
+        """
+        SMS query for the list endpoints.
+
+        SMSMessageResponse serializes delivery_history, so it is loaded for
+        the whole page in one extra IN query; any other relationship access
+        raises instead of issuing a query per row.
+        """
+        return self.db.query(SMSMessage).options(
+            selectinload(SMSMessage.delivery_history), raiseload("*")
+        )
+
+    @staticmethod
+    def _page(
+        query: Query,
+        skip: int,
+        limit: int,
+        after_id: Optional[int],
+        oldest_first: bool = False,
+    ) -> List[SMSMessage]:
+        """
+        One page of SMS, newest first unless oldest_first.
+
+        With after_id, the page starts after that id in the list's order
+        (an index seek on the primary key) and skip is ignored; otherwise
+        it falls back to OFFSET.
+        """
+        if oldest_first:
+            query = query.order_by(SMSMessage.id)
+            if after_id is not None:
+                query = query.filter(SMSMessage.id > after_id)
+        else:
+            query = query.order_by(SMSMessage.id.desc())
+            if after_id is not None:
+                query = query.filter(SMSMessage.id < after_id)
+        if after_id is None:
+            query = query.offset(skip)
+        return query.limit(limit).all()
+
+    def get_all(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
         """Get all SMS messages with pagination"""
-        return self.db.query(SMSMessage).offset(skip).limit(limit).all()
+        return self._page(self._list_query(), skip, limit, after_id)
 
     def get_by_status(
-        self, status: SMSStatus, skip: int = 0, limit: int = 100
+        self,
+        status: SMSStatus,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[SMSMessage]:
         """Get SMS messages by status"""
-        return (
-            self.db.query(SMSMessage)
-            .filter(SMSMessage.status == status)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self._page(
+            self._list_query().filter(SMSMessage.status == status),
+            skip,
+            limit,
+            after_id,
         )
 
-    def get_pending(self, skip: int = 0, limit: int = 100) -> List[SMSMessage]:
+    def get_pending(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
         """Get pending SMS (not yet sent)"""
-        return (
-            self.db.query(SMSMessage)
-            .filter(SMSMessage.status == SMSStatus.PENDING)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self._page(
+            self._list_query().filter(SMSMessage.status == SMSStatus.PENDING),
+            skip,
+            limit,
+            after_id,
         )
 
-    def get_retry_scheduled(self, skip: int = 0, limit: int = 100) -> List[SMSMessage]:
-        """Get SMS ready for retry"""
+    def get_retry_scheduled(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
+        """Get SMS ready for retry (oldest first, so none is starved)"""
         now = datetime.utcnow()
-        return (
-            self.db.query(SMSMessage)
-            .filter(
+        return self._page(
+            self._list_query().filter(
                 and_(
                     SMSMessage.status.in_([SMSStatus.PENDING, SMSStatus.FAILED]),
                     SMSMessage.next_retry_at <= now,
                     SMSMessage.retry_count < SMSMessage.max_retries,
                 )
-            )
-            .offset(skip)
-            .limit(limit)
-            .all()
+            ),
+            skip,
+            limit,
+            after_id,
+            oldest_first=True,
         )
 
     def get_by_client(
-        self, client_id: int, skip: int = 0, limit: int = 100
+        self,
+        client_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[SMSMessage]:
         """Get SMS messages for specific client"""
-        return (
-            self.db.query(SMSMessage)
-            .filter(SMSMessage.client_id == client_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self._page(
+            self._list_query().filter(SMSMessage.client_id == client_id),
+            skip,
+            limit,
+            after_id,
         )
 
     def get_by_phone(
-        self, phone_number: str, skip: int = 0, limit: int = 100
+        self,
+        phone_number: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[SMSMessage]:
         """Get SMS messages for specific phone number"""
-        return (
-            self.db.query(SMSMessage)
-            .filter(SMSMessage.phone_number == phone_number)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self._page(
+            self._list_query().filter(SMSMessage.phone_number == phone_number),
+            skip,
+            limit,
+            after_id,
         )
 
     def update(self, sms_id: int, sms_update: SMSMessageUpdate) -> Optional[SMSMessage]:
@@ -112,6 +251,66 @@ class SMSRepository:
             self.db.refresh(db_sms)
         return db_sms
 
+    def mark_sent(self, sms_id: int, gateway_reference: str) -> Optional[SMSMessage]:
+        """
+        Mark an SMS sent to the gateway in one UPDATE ... RETURNING.
+
+        Returns None if the SMS does not exist. Does not commit, so the caller
+        can read the returned row before its attributes expire.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            update(SMSMessage)
+            .where(SMSMessage.id == sms_id)
+            .values(
+                status=SMSStatus.SENT,
+                gateway_reference=gateway_reference,
+                last_attempt_at=now,
+                sent_at=now,
+                retry_count=SMSMessage.retry_count + 1,
+            )
+            .returning(SMSMessage)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def mark_failed(self, sms_id: int, error_reason: str) -> Optional[SMSMessage]:
+        """
+        Record a failed send in one UPDATE ... RETURNING.
+
+        Mirrors SMSMessage.calculate_next_retry in SQL: with retries left the
+        SMS goes back to PENDING with its next retry scheduled, otherwise it
+        is FAILED. Returns None if the SMS does not exist. Does not commit.
+        """
+        now = datetime.utcnow()
+        status_type = SMSMessage.status.type
+        retrying = SMSMessage.retry_count < SMSMessage.max_retries
+        next_retry_at = case(
+            *(
+                (SMSMessage.retry_count == attempt, now + delay)
+                for attempt, delay in enumerate(RETRY_DELAYS)
+            ),
+            else_=SMSMessage.next_retry_at,
+        )
+        stmt = (
+            update(SMSMessage)
+            .where(SMSMessage.id == sms_id)
+            .values(
+                last_attempt_at=now,
+                error_reason=error_reason,
+                status=case(
+                    (retrying, cast(SMSStatus.PENDING, status_type)),
+                    else_=cast(SMSStatus.FAILED, status_type),
+                ),
+                next_retry_at=case(
+                    (retrying, next_retry_at), else_=SMSMessage.next_retry_at
+                ),
+            )
+            .returning(SMSMessage)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
     def add_delivery_history(
         self,
         sms_id: int,
@@ -1,8 +1,8 @@
 """Audit log schemas"""
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.models.audit_log import AuditAction
 
 
@@ -17,8 +17,11 @@ class AuditLogBase(BaseModel):
     entity_type: str = Field(..., max_length=50, description="Type of entity affected")
     entity_id: int = Field(..., description="ID of affected entity")
     description: str = Field(..., description="Human-readable description of action")
-    metadata: Optional[str] = Field(
-        None, description="JSON metadata with additional context"
+    # ORM rows expose the column as metadata_json (Base.metadata is taken)
+    metadata: Optional[Dict[str, Any]] = Field(
+        None,
+        validation_alias=AliasChoices("metadata_json", "metadata"),
+        description="JSON metadata with additional context",
     )
     ip_address: Optional[str] = Field(
         None, max_length=45, description="IP address of admin"
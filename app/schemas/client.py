@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from decimal import Decimal
+from app.schemas.reading import MeterValue
 
 
 class ClientBase(BaseModel):
@@ -10,7 +10,8 @@ class ClientBase(BaseModel):
     phone_number: str = Field(min_length=1, max_length=20)
     client_code: str | None = Field(default=None, max_length=50)
     meter_serial_number: str = Field(min_length=1, max_length=50)
-    initial_meter_reading: Decimal = Field(decimal_places=4)
+    # Becomes the baseline reading, so it is validated like one
+    initial_meter_reading: MeterValue
 
 
 class ClientCreate(ClientBase):
@@ -43,6 +43,26 @@ class LedgerEntryRead(LedgerEntryBase):
         from_attributes = True
 
 
+class BalanceBreakdown(BaseModel):
+    """Per-type totals behind a balance"""
+
+    charges: float
+    penalties: float
+    payments: float
+    adjustments_debit: float
+    adjustments_credit: float
+
+
+class BalanceRead(BaseModel):
+    """Net balance summary for a meter assignment"""
+
+    meter_assignment_id: int
+    total_debits: float
+    total_credits: float
+    net_balance: float
+    breakdown: BalanceBreakdown
+
+
 # ============================================================================
 # Payment Schemas
 # ============================================================================
@@ -10,7 +10,7 @@ from app.schemas.client import ClientRead
 from app.schemas.meter import MeterRead
 from app.schemas.meter_assignment import MeterAssignmentRead
 from app.schemas.cycle import CycleRead
-from app.schemas.reading import ReadingRead
+from app.schemas.reading import MeterValue, ReadingRead
 
 
 class MobileReadingSubmit(BaseModel):
@@ -18,9 +18,7 @@ class MobileReadingSubmit(BaseModel):
 
     meter_assignment_id: int = Field(..., description="Meter assignment ID")
     cycle_id: int = Field(..., description="Billing cycle ID")
-    absolute_value: Decimal = Field(
-        ..., ge=0, decimal_places=4, description="Meter reading in m³"
-    )
+    absolute_value: MeterValue = Field(..., description="Meter reading in m³")
     submitted_by: str = Field(
         ..., min_length=1, max_length=100, description="Collector ID/username"
     )
@@ -60,6 +58,18 @@ class MobileReadingResponse(BaseModel):
         from_attributes = True
 
 
+class MobileBatchReadingResult(BaseModel):
+    """Outcome of one reading in a batch submission"""
+
+    index: int = Field(description="Position of the reading in the submitted array")
+    status: str = Field(description="PENDING, CONFLICT, REJECTED")
+    reading_id: Optional[int] = None
+    message: Optional[str] = None
+    server_reading: Optional[ReadingRead] = Field(
+        default=None, description="Reading already in the cycle (CONFLICT only)"
+    )
+
+
 class MobileConflictDetail(BaseModel):
     """Conflict response with server reading snapshot"""
 
@@ -98,3 +108,6 @@ class MobileUpdatesResponse(BaseModel):
     meters: List[MeterRead] = []
     tombstones: List[TombstoneRecord] = []
     last_sync: datetime = Field(description="Server timestamp for this delta")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Pass as `after` to fetch the next page of readings"
+    )
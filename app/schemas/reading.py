@@ -4,15 +4,19 @@ Reading schemas for API request/response validation.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Optional
 from pydantic import BaseModel, Field, field_validator
 from app.models.reading import ReadingType
 
+# Meter reading in m³; mirrors readings.absolute_value NUMERIC(9,4) and its
+# ck_reading_value_non_negative constraint so bad values fail validation
+MeterValue = Annotated[Decimal, Field(ge=0, max_digits=9, decimal_places=4)]
+
 
 class ReadingBase(BaseModel):
     """Base reading attributes"""
 
-    absolute_value: Decimal = Field(ge=0, decimal_places=4, max_digits=9)
+    absolute_value: MeterValue
     type: ReadingType = ReadingType.NORMAL
     submitted_by: str = Field(min_length=1, max_length=100)
     submission_notes: Optional[str] = Field(None, max_length=500)
@@ -12,6 +12,31 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+GATEWAY_TIMEOUT = 30.0
+
+# One pooled client per process: keep-alive connections to the gateway are
+# reused across sends instead of paying a TCP/TLS handshake per SMS.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared gateway HTTP client, created on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=GATEWAY_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class AfricasTalkingClient:
     """Client for Africa's Talking SMS Gateway API"""
@@ -21,7 +46,7 @@ class AfricasTalkingClient:
         self.api_key = settings.sms_gateway_key
         self.username = settings.sms_username  # Africa's Talking username
         self.sender_id = settings.sms_sender_id or None  # Optional sender ID
-        self.timeout = 30.0
+        self.timeout = GATEWAY_TIMEOUT
 
     async def send_sms(
         self, phone_number: str, message: str, idempotency_key: Optional[str] = None
@@ -62,60 +87,60 @@ class AfricasTalkingClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Sending SMS to {normalized_phone} via Africa's Talking")
-                
-                response = await client.post(
-                    self.api_url,
-                    data=payload,
-                    headers=headers,
-                )
+            client = get_http_client()
+            logger.info(f"Sending SMS to {normalized_phone} via Africa's Talking")
+            
+            response = await client.post(
+                self.api_url,
+                data=payload,
+                headers=headers,
+            )
 
-                response_data = response.json()
+            response_data = response.json()
+            
+            # Africa's Talking returns:
+            # {
+            #   "SMSMessageData": {
+            #     "Message": "Sent to 1/1 Total Cost: TZS 20",
+            #     "Recipients": [{
+            #       "statusCode": 101,  # 101 = Processed, 102 = Failed
+            #       "number": "+255700000000",
+            #       "status": "Success",
+            #       "cost": "TZS 20",
+            #       "messageId": "ATXid_xxxx"
+            #     }]
+            #   }
+            # }
+
+            if response.status_code == 201:
+                sms_data = response_data.get("SMSMessageData", {})
+                recipients = sms_data.get("Recipients", [])
                 
-                # Africa's Talking returns:
-                # {
-                #   "SMSMessageData": {
-                #     "Message": "Sent to 1/1 Total Cost: TZS 20",
-                #     "Recipients": [{
-                #       "statusCode": 101,  # 101 = Processed, 102 = Failed
-                #       "number": "+255700000000",
-                #       "status": "Success",
-                #       "cost": "TZS 20",
-                #       "messageId": "ATXid_xxxx"
-                #     }]
-                #   }
-                # }
-
-                if response.status_code == 201:
-                    sms_data = response_data.get("SMSMessageData", {})
-                    recipients = sms_data.get("Recipients", [])
+                if recipients and len(recipients) > 0:
+                    recipient = recipients[0]
+                    status_code = recipient.get("statusCode")
                     
-                    if recipients and len(recipients) > 0:
-                        recipient = recipients[0]
-                        status_code = recipient.get("statusCode")
+                    # Status code 101 or 102 (processed)
+                    if status_code in [101, 102]:
+                        message_id = recipient.get("messageId")
+                        status = recipient.get("status", "Unknown")
                         
-                        # Status code 101 or 102 (processed)
-                        if status_code in [101, 102]:
-                            message_id = recipient.get("messageId")
-                            status = recipient.get("status", "Unknown")
-                            
-                            logger.info(
-                                f"SMS sent successfully to {normalized_phone}. "
-                                f"MessageId: {message_id}, Status: {status}"
-                            )
-                            return True, message_id, response_data
-                        else:
-                            error_msg = recipient.get("status", "Unknown error")
-                            logger.error(f"Africa's Talking API error: {error_msg}")
-                            return False, None, response_data
+                        logger.info(
+                            f"SMS sent successfully to {normalized_phone}. "
+                            f"MessageId: {message_id}, Status: {status}"
+                        )
+                        return True, message_id, response_data
                     else:
-                        logger.error("Africa's Talking API returned no recipients")
+                        error_msg = recipient.get("status", "Unknown error")
+                        logger.error(f"Africa's Talking API error: {error_msg}")
                         return False, None, response_data
                 else:
-                    error_msg = response_data.get("message", "Unknown error")
-                    logger.error(f"Africa's Talking API error: {error_msg}")
+                    logger.error("Africa's Talking API returned no recipients")
                     return False, None, response_data
+            else:
+                error_msg = response_data.get("message", "Unknown error")
+                logger.error(f"Africa's Talking API error: {error_msg}")
+                return False, None, response_data
 
         except httpx.TimeoutException:
             logger.error("Africa's Talking API timeout")
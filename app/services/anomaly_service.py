@@ -9,9 +9,24 @@ from app.models.anomaly import Anomaly, AnomalyStatus, AnomalyType
 from app.repositories.anomaly import AnomalyRepository
 
 
+# Readings at or above this raise a METER_ROLLOVER_THRESHOLD alert
+ROLLOVER_THRESHOLD = Decimal("90000.0000")
+
+
+def rollover_threshold_description(meter_serial: str, absolute_value: Decimal) -> str:
+    """Description of a METER_ROLLOVER_THRESHOLD alert"""
+    return (
+        f"Meter {meter_serial} has reached rollover threshold alert at {absolute_value:.4f} m³ "
+        f"(threshold: 90,000.0000). Meter approaching maximum capacity. "
+        f"Admin acknowledgment required to confirm awareness and plan for meter replacement."
+    )
+
+
 class AnomalyService:
     """Service layer for anomaly operations"""
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: Session):
         self.repository = AnomalyRepository(db)
 
@@ -42,17 +57,23 @@ class AnomalyService:
         """List all anomalies"""
         return self.repository.list(skip, limit)
 
-    def list_anomalies_by_status(self, status: AnomalyStatus) -> List[Anomaly]:
+    def list_anomalies_by_status(
+        self, status: AnomalyStatus, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get anomalies with specific status"""
-        return self.repository.list_by_status(status)
+        return self.repository.list_by_status(status, skip, limit)
 
-    def list_anomalies_by_assignment(self, meter_assignment_id: int) -> List[Anomaly]:
+    def list_anomalies_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get anomalies for a meter assignment"""
-        return self.repository.list_by_assignment(meter_assignment_id)
+        return self.repository.list_by_assignment(meter_assignment_id, skip, limit)
 
-    def list_anomalies_by_cycle(self, cycle_id: int) -> List[Anomaly]:
+    def list_anomalies_by_cycle(
+        self, cycle_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Anomaly]:
         """Get anomalies for a cycle"""
-        return self.repository.list_by_cycle(cycle_id)
+        return self.repository.list_by_cycle(cycle_id, skip, limit)
 
     def acknowledge_anomaly(
         self, anomaly_id: int, acknowledged_by: str
@@ -218,14 +239,9 @@ class AnomalyService:
         Returns:
             Created anomaly record with CRITICAL severity
         """
-        description = (
-            f"Meter {meter_serial} has reached rollover threshold alert at {absolute_value:.4f} m³ "
-            f"(threshold: 90,000.0000). Meter approaching maximum capacity. "
-            f"Admin acknowledgment required to confirm awareness and plan for meter replacement."
-        )
         return self.create_anomaly(
             anomaly_type=AnomalyType.METER_ROLLOVER_THRESHOLD.value,
-            description=description,
+            description=rollover_threshold_description(meter_serial, absolute_value),
             meter_assignment_id=meter_assignment_id,
             cycle_id=cycle_id,
             reading_id=reading_id,
@@ -239,7 +255,7 @@ class AnomalyService:
         reading_id: int,
         meter_serial: str,
         absolute_value: Decimal,
-        threshold: Decimal = Decimal("90000.0000"),
+        threshold: Decimal = ROLLOVER_THRESHOLD,
     ) -> Optional[Anomaly]:
         """
         Check if reading exceeds rollover threshold and log alert if needed.
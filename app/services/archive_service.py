@@ -3,9 +3,9 @@ Archive service - move old data (≥36 months) to read-only archive tables.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Row, and_, select
 from app.models.cycle import Cycle
 from app.models.reading import Reading
 from app.models.ledger_entry import LedgerEntry
@@ -18,29 +18,46 @@ logger = logging.getLogger(__name__)
 class ArchiveService:
     """Service for archiving old data"""
 
+    __slots__ = ("db", "cycle_repo")
+
     def __init__(self, db: Session):
         self.db = db
         self.cycle_repo = CycleRepository(db)
 
+    @staticmethod
+    def _archivable_filter(cutoff_months: int):
+        """Filter for CLOSED/ARCHIVED cycles that ended ≥cutoff_months ago"""
+        cutoff_date = datetime.utcnow() - timedelta(days=cutoff_months * 30)
+        return and_(
+            Cycle.end_date <= cutoff_date,
+            Cycle.status.in_(["CLOSED", "ARCHIVED"]),
+        )
+
     def get_archivable_cycles(self, cutoff_months: int = 36) -> List[Cycle]:
         """
         Get cycles that are ≥cutoff_months old and eligible for archiving.
         Only CLOSED or ARCHIVED cycles are archivable.
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=cutoff_months * 30)
-
-        cycles = (
-            self.db.query(Cycle)
-            .filter(
-                and_(
-                    Cycle.end_date <= cutoff_date,
-                    Cycle.status.in_(["CLOSED", "ARCHIVED"]),
-                )
-            )
-            .all()
+        return (
+            self.db.query(Cycle).filter(self._archivable_filter(cutoff_months)).all()
         )
 
-        return cycles
+    def iter_archivable_cycles(
+        self, cutoff_months: int = 36, batch_size: int = 500
+    ) -> Iterator[Row]:
+        """
+        Same cycles as get_archivable_cycles, fetched batch_size rows at a time
+        so callers can stream them without holding the full result in memory.
+
+        Yields lightweight (id, start_date, end_date, status) rows rather than
+        ORM instances.
+        """
+        stmt = (
+            select(Cycle.id, Cycle.start_date, Cycle.end_date, Cycle.status)
+            .where(self._archivable_filter(cutoff_months))
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(self.db.execute(stmt))
 
     def archive_cycle(self, cycle_id: int) -> Tuple[bool, Optional[str]]:
         """
@@ -107,8 +124,8 @@ class ArchiveService:
             results["would_archive"] = [
                 {
                     "cycle_id": c.id,
-                    "start_date": c.start_date.strftime("%Y-%m-%d"),
-                    "end_date": c.end_date.strftime("%Y-%m-%d"),
+                    "start_date": c.start_date.isoformat(),
+                    "end_date": c.end_date.isoformat(),
                     "status": c.status,
                 }
                 for c in archivable
@@ -144,9 +161,9 @@ class ArchiveService:
             "archived_cycles": archived_cycles,
             "active_cycles": total_cycles - archived_cycles,
             "oldest_cycle_date": (
-                oldest_cycle.start_date.strftime("%Y-%m-%d") if oldest_cycle else None
+                oldest_cycle.start_date.isoformat() if oldest_cycle else None
             ),
             "newest_cycle_date": (
-                newest_cycle.start_date.strftime("%Y-%m-%d") if newest_cycle else None
+                newest_cycle.start_date.isoformat() if newest_cycle else None
             ),
         }
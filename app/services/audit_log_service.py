@@ -4,12 +4,14 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.repositories.audit_log import AuditLogRepository
 from app.schemas.audit_log import AuditLogCreate, AuditLogResponse
-from app.models.audit_log import AuditAction
+from app.models.audit_log import AuditAction, AuditLog
 
 
 class AuditLogService:
     """Service for audit log operations"""
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: Session):
         self.repository = AuditLogRepository(db)
 
@@ -28,30 +30,27 @@ class AuditLogService:
             return AuditLogResponse.model_validate(db_audit_log)
         return None
 
-    def get_all_logs(self, skip: int = 0, limit: int = 100) -> List[AuditLogResponse]:
+    # List methods return ORM rows; the route's response_model validates
+    # them once instead of building each AuditLogResponse twice.
+
+    def get_all_logs(self, skip: int = 0, limit: int = 100) -> List[AuditLog]:
         """Get all audit logs with pagination"""
-        db_audit_logs = self.repository.get_all(skip, limit)
-        return [AuditLogResponse.model_validate(log) for log in db_audit_logs]
+        return self.repository.get_all(skip, limit)
 
     def get_logs_by_admin(
         self, admin_username: str, skip: int = 0, limit: int = 100
-    ) -> List[AuditLogResponse]:
+    ) -> List[AuditLog]:
         """Get audit logs for specific admin"""
-        db_audit_logs = self.repository.get_by_admin(admin_username, skip, limit)
-        return [AuditLogResponse.model_validate(log) for log in db_audit_logs]
+        return self.repository.get_by_admin(admin_username, skip, limit)
 
     def get_logs_by_action(
         self, action: AuditAction, skip: int = 0, limit: int = 100
-    ) -> List[AuditLogResponse]:
+    ) -> List[AuditLog]:
         """Get audit logs by action type"""
-        db_audit_logs = self.repository.get_by_action(action, skip, limit)
-        return [AuditLogResponse.model_validate(log) for log in db_audit_logs]
+        return self.repository.get_by_action(action, skip, limit)
 
     def get_logs_by_entity(
         self, entity_type: str, entity_id: int, skip: int = 0, limit: int = 100
-    ) -> List[AuditLogResponse]:
+    ) -> List[AuditLog]:
         """Get audit logs for specific entity (e.g., all logs for reading #123)"""
-        db_audit_logs = self.repository.get_by_entity(
-            entity_type, entity_id, skip, limit
-        )
-        return [AuditLogResponse.model_validate(log) for log in db_audit_logs]
+        return self.repository.get_by_entity(entity_type, entity_id, skip, limit)
@@ -1,22 +1,33 @@
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 import bcrypt
 from jose import JWTError, jwt
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import os
 import secrets
-import string
+import threading
+import time
 
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 30
 
+# bcrypt work factor for new hashes; existing hashes keep the cost they were
+# created with. Each +1 doubles hash/verify time (12 is ~250ms per login).
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Verified token cache (blake2b(token) -> (valid_until, payload))
+TOKEN_CACHE_TTL_SECONDS = 30.0
+TOKEN_CACHE_MAX_SIZE = 50_000
+_token_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+_token_cache_lock = threading.Lock()
+
 
 def generate_random_password(length: int = 12) -> str:
-    """Generate a random password with uppercase, lowercase, digits, and special chars"""
-    characters = string.ascii_letters + string.digits + "!@#$%^&*"
-    password = "".join(secrets.choice(characters) for _ in range(length))
-    return password
+    """Generate a random URL-safe password (letters, digits, '-' and '_')"""
+    # Each random byte yields 4/3 base64 characters; trim to the exact length
+    return secrets.token_urlsafe(length * 3 // 4 + 1)[:length]
 
 
 def hash_password(password: str) -> str:
@@ -27,7 +38,7 @@ def hash_password(password: str) -> str:
     password_bytes = password.strip().encode("utf-8")
     if len(password_bytes) > 72:
         raise ValueError(f"Password too long: {len(password_bytes)} bytes")
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     return bcrypt.hashpw(password_bytes, salt).decode("utf-8")
 
 
@@ -56,18 +67,58 @@ def create_access_token(
 
 
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
-    """Decode JWT token and return payload"""
+    """
+    Decode JWT token and return payload.
+
+    Verified payloads are cached briefly, keyed by a digest of the token, so
+    a client repeating the same bearer token skips signature verification.
+    Cached entries never outlive the token's own exp claim.
+    """
+    key = blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            valid_until, payload = entry
+            if valid_until > now:
+                # Callers get their own copy; the cached dict stays pristine
+                return dict(payload)
+            _token_cache.pop(key, None)
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
 
+    valid_until = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        valid_until = min(valid_until, exp)
+    with _token_cache_lock:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[key] = (valid_until, dict(payload))
+    return payload
+
+
+def clear_token_cache() -> None:
+    """Forget all verified tokens (e.g. after rotating SECRET_KEY)"""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def decode_admin_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Decode admin token and return its full payload"""
+    payload = decode_token(token)
+    if payload and payload.get("type") == "admin" and payload.get("admin_id"):
+        return payload
+    return None
+
 
 def decode_admin_token(token: str) -> Optional[int]:
     """Decode admin token and return admin_id"""
-    payload = decode_token(token)
-    if payload and payload.get("type") == "admin":
+    payload = decode_admin_claims(token)
+    if payload:
         return payload.get("admin_id")
     return None
 
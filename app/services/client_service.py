@@ -25,6 +25,8 @@ from app.services.cycle_service import CycleService
 
 
 class ClientService:
+    __slots__ = ("db", "repo")
+
     def __init__(self, db: Session):
         self.db = db
         self.repo = ClientRepository(db)
@@ -11,6 +11,8 @@ from app.repositories.conflict import ConflictRepository
 class ConflictService:
     """Service layer for conflict operations"""
 
+    __slots__ = ("repository",)
+
     def __init__(self, db: Session):
         self.repository = ConflictRepository(db)
 
@@ -41,17 +43,23 @@ class ConflictService:
         """List all conflicts"""
         return self.repository.list(skip, limit)
 
-    def list_conflicts_by_status(self, status: ConflictStatus) -> List[Conflict]:
+    def list_conflicts_by_status(
+        self, status: ConflictStatus, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get conflicts with specific status"""
-        return self.repository.list_by_status(status)
+        return self.repository.list_by_status(status, skip, limit)
 
-    def list_conflicts_by_assignment(self, meter_assignment_id: int) -> List[Conflict]:
+    def list_conflicts_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get conflicts for a meter assignment"""
-        return self.repository.list_by_assignment(meter_assignment_id)
+        return self.repository.list_by_assignment(meter_assignment_id, skip, limit)
 
-    def list_conflicts_by_admin(self, admin_id: str) -> List[Conflict]:
+    def list_conflicts_by_admin(
+        self, admin_id: str, skip: int = 0, limit: int = 100
+    ) -> List[Conflict]:
         """Get conflicts assigned to a specific admin"""
-        return self.repository.list_by_admin(admin_id)
+        return self.repository.list_by_admin(admin_id, skip, limit)
 
     def assign_conflict(
         self, conflict_id: int, assigned_to: str
@@ -5,6 +5,7 @@ Cycle service - business logic for billing cycle management.
 from datetime import date, datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
 from typing import List, Optional, Tuple, Dict
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 from app.models.cycle import Cycle, CycleStatus
 from app.repositories.cycle import CycleRepository
@@ -17,6 +18,15 @@ from app.schemas.audit_log import AuditLogCreate
 from app.utils.working_days import adjust_target_date_to_working_day
 
 
+def _ranges_overlap(start_a: date, end_a: date, start_b: date, end_b: date) -> bool:
+    """Same overlap rule as CycleRepository.get_overlapping, in Python"""
+    return (
+        (start_a <= start_b < end_a)
+        or (start_a < end_b <= end_a)
+        or (start_a >= start_b and end_a <= end_b)
+    )
+
+
 class CycleService:
     """
     Service layer for cycle operations with business rule enforcement.
@@ -29,6 +39,14 @@ class CycleService:
     5. Auto-transition to PENDING_REVIEW when reading window closes
     """
 
+    __slots__ = (
+        "repository",
+        "db",
+        "reading_repository",
+        "ledger_repository",
+        "audit_log_repository",
+    )
+
     def __init__(self, db: Session):
         self.repository = CycleRepository(db)
         self.db = db
@@ -94,9 +112,11 @@ class CycleService:
         """List all cycles"""
         return self.repository.list(skip, limit)
 
-    def get_cycles_by_status(self, status: CycleStatus) -> List[Cycle]:
+    def get_cycles_by_status(
+        self, status: CycleStatus, skip: int = 0, limit: int = 100
+    ) -> List[Cycle]:
         """Get cycles filtered by status"""
-        return self.repository.get_by_status(status)
+        return self.repository.get_by_status(status, skip, limit)
 
     def get_open_cycle(self) -> Optional[Cycle]:
         """Get the currently open cycle for reading submissions"""
@@ -113,7 +133,7 @@ class CycleService:
         cycle_length_days: int,
         submission_window_days: int,
         adjust_to_working_day: bool = True,
-    ) -> Tuple[List[Cycle], Optional[str]]:
+    ) -> Tuple[List[Row], Optional[str]]:
         """
         Batch create multiple cycles on schedule in Tanzania.
 
@@ -135,14 +155,16 @@ class CycleService:
             Admin can manually override this when creating cycles.
 
         Returns:
-            (list of created cycles, error message if any failed)
-        """
-        created_cycles = []
-        errors = []
+            (rows of the created cycles, error message if any failed)
 
+        The same checks as create_cycle run in Python against one range query
+        and one open-cycle lookup, and the accepted cycles are inserted in a
+        single statement.
+        """
+        planned = []
         current_start = start_date
 
-        for i in range(num_cycles):
+        for _ in range(num_cycles):
             # Calculate dates for this cycle
             cycle_start = current_start
             cycle_end = current_start + timedelta(days=cycle_length_days - 1)
@@ -164,23 +186,60 @@ class CycleService:
             else:
                 proposed_date = None  # Adjustment not requested
 
-            # Create cycle (all scheduled cycles start in OPEN state)
-            cycle, error = self.create_cycle(
-                start_date=cycle_start,
-                end_date=cycle_end,
-                target_date=submission_deadline,
-                status=CycleStatus.OPEN,
-                proposed_target_date=proposed_date,
+            # All scheduled cycles start in OPEN state
+            planned.append(
+                {
+                    "start_date": cycle_start,
+                    "end_date": cycle_end,
+                    "target_date": submission_deadline,
+                    "proposed_target_date": proposed_date,
+                    "status": CycleStatus.OPEN,
+                }
             )
 
-            if error:
-                errors.append(f"Cycle {i+1}: {error}")
-            else:
-                created_cycles.append(cycle)
-
             # Move to next cycle start date
             current_start = cycle_end + timedelta(days=1)
 
+        if not planned:
+            return [], None
+
+        existing = self.repository.get_in_range(
+            planned[0]["start_date"], planned[-1]["end_date"]
+        )
+        open_cycle = self.repository.get_open_cycle()
+
+        # Per planned cycle: overlap message, or None if blocked by the OPEN rule
+        rejected: Dict[int, Optional[str]] = {}
+        accepted = []
+        for i, row in enumerate(planned):
+            overlapping = [
+                str(c.id)
+                for c in existing
+                if _ranges_overlap(
+                    c.start_date, c.end_date, row["start_date"], row["end_date"]
+                )
+            ]
+            if overlapping:
+                rejected[i] = (
+                    "Date range overlaps with existing cycle(s): "
+                    f"{', '.join(overlapping)}"
+                )
+            elif open_cycle is not None or accepted:
+                rejected[i] = None
+            else:
+                accepted.append(row)
+
+        created_cycles = self.repository.create_many(accepted)
+
+        open_id = open_cycle.id if open_cycle is not None else None
+        if open_id is None and created_cycles:
+            open_id = created_cycles[0].id
+        open_error = (
+            f"Cycle {open_id} is already OPEN. Close it before opening a new cycle."
+        )
+        errors = [
+            f"Cycle {i+1}: {message or open_error}" for i, message in rejected.items()
+        ]
         error_message = " | ".join(errors) if errors else None
         return created_cycles, error_message
 
@@ -213,19 +272,13 @@ class CycleService:
         updated = self.repository.update_status(cycle_id, CycleStatus.PENDING_REVIEW)
         return updated, None
 
-    def auto_transition_overdue(self) -> Tuple[List[Cycle], int]:
+    def auto_transition_overdue(self) -> Tuple[List[int], int]:
         """Transition all OPEN cycles past target_date to PENDING_REVIEW.
-        Returns (list of updated cycles, count)."""
-        today = date.today()
-        overdue_cycles = self.repository.get_open_past_deadline(today)
-        transitioned = []
-        for cycle in overdue_cycles:
-            updated = self.repository.update_status(
-                cycle.id, CycleStatus.PENDING_REVIEW
-            )
-            if updated:
-                transitioned.append(updated)
-        return transitioned, len(transitioned)
+        Returns (list of updated cycle ids, count)."""
+        ids = self.repository.transition_open_past_deadline(
+            date.today(), CycleStatus.PENDING_REVIEW
+        )
+        return ids, len(ids)
 
     def generate_cycle_charges(
         self, cycle_id: int, rate_per_m3: Decimal, created_by: str = "system"
@@ -245,24 +298,16 @@ class CycleService:
                 "error": f"Cycle {cycle_id} must be PENDING_REVIEW or APPROVED to generate charges (current: {cycle.status})"
             }
 
-        approved_readings = self.reading_repository.get_approved_by_cycle(cycle_id)
+        # Consumption per meter assignment, summed in the database (unresolved
+        # rollovers are excluded to avoid billing errors)
+        consumption_map = self.reading_repository.sum_billable_consumption_by_cycle(
+            cycle_id
+        )
 
-        # Sum consumption per meter assignment
-        consumption_map: Dict[int, Decimal] = {}
-        for r in approved_readings:
-            if r.consumption is None:
-                continue
-            if r.has_rollover:
-                # Skip unresolved rollovers to avoid billing errors
-                continue
-            consumption = Decimal(r.consumption)
-            if consumption < 0:
-                continue
-            consumption_map[r.meter_assignment_id] = (
-                consumption_map.get(r.meter_assignment_id, Decimal(0)) + consumption
-            )
+        # One query for the idempotency check instead of one per assignment
+        already_charged = self.ledger_repository.get_charged_assignment_ids(cycle_id)
 
-        created_entries = []
+        new_rows = []
         skipped = {"existing": 0, "zero_amount": 0}
 
         for assignment_id, total_m3 in consumption_map.items():
@@ -271,10 +316,7 @@ class CycleService:
                 continue
 
             # Idempotency: skip if a CHARGE already exists for this assignment+cycle
-            existing = self.ledger_repository.get_charge_for_assignment_cycle(
-                assignment_id, cycle_id
-            )
-            if existing:
+            if assignment_id in already_charged:
                 skipped["existing"] += 1
                 continue
 
@@ -285,16 +327,19 @@ class CycleService:
                 f"Cycle {cycle_id} charge: {total_m3} m3 @ {rate_per_m3} per m3"
             )
 
-            entry = self.ledger_repository.create(
-                meter_assignment_id=assignment_id,
-                cycle_id=cycle_id,
-                entry_type=LedgerEntryType.CHARGE,
-                amount=amount,
-                is_credit=False,
-                description=description,
-                created_by=created_by,
+            new_rows.append(
+                {
+                    "meter_assignment_id": assignment_id,
+                    "cycle_id": cycle_id,
+                    "entry_type": LedgerEntryType.CHARGE,
+                    "amount": amount,
+                    "is_credit": False,
+                    "description": description,
+                    "created_by": created_by,
+                }
             )
-            created_entries.append(entry)
+
+        created_entries = self.ledger_repository.create_many(new_rows)
 
         summary = {
             "created": len(created_entries),
@@ -4,23 +4,70 @@ Export service - generate CSV/PDF reports for cycles, ledgers, and payments.
 
 import csv
 import io
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import IO, Iterable, Iterator, List, Dict, Optional, Sequence
+from datetime import date, datetime
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy import case, desc, func, literal, select
+from sqlalchemy.orm import Session, joinedload
 from app.repositories.cycle import CycleRepository
 from app.repositories.reading import ReadingRepository
 from app.repositories.ledger_entry import LedgerEntryRepository
 from app.repositories.payment import PaymentRepository
 from app.repositories.meter_assignment import MeterAssignmentRepository
+from app.models.client import Client
 from app.models.cycle import Cycle
+from app.models.meter import Meter
+from app.models.meter_assignment import AssignmentStatus, MeterAssignment
 from app.models.reading import Reading
 from app.models.ledger_entry import LedgerEntry
+from app.models.payment import Payment
+
+# Rows buffered per yielded chunk when streaming CSV
+CSV_CHUNK_ROWS = 500
+# Rows fetched per round trip when streaming query results
+EXPORT_YIELD_PER = 1000
+
+
+def _load_parties(assignment_attr) -> tuple:
+    """
+    Loader options joining an assignment's client and meter into the query.
+
+    The row builders read both for every row; lazy loading them would cost
+    two extra SELECTs per distinct assignment.
+    """
+    assignment = joinedload(assignment_attr)
+    return (
+        assignment.joinedload(MeterAssignment.client),
+        assignment.joinedload(MeterAssignment.meter),
+    )
+
+
+def _iter_csv(header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Encode rows as CSV, yielding the text in chunks of CSV_CHUNK_ROWS rows"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % CSV_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
 
 
 class ExportService:
     """Service for generating exports and reports"""
 
+    __slots__ = (
+        "db",
+        "cycle_repo",
+        "reading_repo",
+        "ledger_repo",
+        "payment_repo",
+        "assignment_repo",
+    )
+
     def __init__(self, db: Session):
         self.db = db
         self.cycle_repo = CycleRepository(db)
@@ -29,286 +76,318 @@ class ExportService:
         self.payment_repo = PaymentRepository(db)
         self.assignment_repo = MeterAssignmentRepository(db)
 
-    def export_cycle_readings_csv(self, cycle_id: int) -> str:
+    def _stream(self, stmt) -> Iterator:
+        """Execute an ORM select, fetching EXPORT_YIELD_PER rows at a time"""
+        return iter(
+            self.db.scalars(stmt.execution_options(yield_per=EXPORT_YIELD_PER))
+        )
+
+    def iter_cycle_readings_csv(self, cycle_id: int) -> Iterator[str]:
         """
-        Export all readings for a cycle to CSV.
+        Stream all readings for a cycle as CSV chunks.
         Includes: client, meter, reading value, consumption, status.
+
+        Raises ValueError up front (before any chunk) if the cycle is missing.
         """
         cycle = self.cycle_repo.get(cycle_id)
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
 
-        readings = self.reading_repo.list_by_cycle(cycle_id)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Reading ID",
-                "Client Name",
-                "Phone Number",
-                "Meter Serial",
-                "Reading Value",
-                "Previous Reading",
-                "Consumption (m³)",
-                "Status",
-                "Approved",
-                "Submitted At",
-                "Approved At",
-                "Approved By",
-            ]
+        readings = self._stream(
+            select(Reading)
+            .options(*_load_parties(Reading.meter_assignment))
+            .where(Reading.cycle_id == cycle_id)
+            .order_by(Reading.submitted_at)
         )
-
-        # Data rows
-        for reading in readings:
-            assignment = reading.meter_assignment
-            client = assignment.client
-            meter = assignment.meter
-
-            writer.writerow(
-                [
-                    reading.id,
-                    f"{client.first_name} {client.surname}",
-                    client.phone_number,
-                    meter.serial_number,
-                    f"{reading.reading_value:.4f}",
-                    (
-                        f"{reading.previous_reading:.4f}"
-                        if reading.previous_reading
-                        else ""
-                    ),
-                    f"{reading.consumption:.4f}" if reading.consumption else "",
-                    reading.status,
-                    "Yes" if reading.approved else "No",
-                    (
-                        reading.submitted_at.strftime("%Y-%m-%d %H:%M:%S")
-                        if reading.submitted_at
-                        else ""
-                    ),
-                    (
-                        reading.approved_at.strftime("%Y-%m-%d %H:%M:%S")
-                        if reading.approved_at
-                        else ""
-                    ),
-                    reading.approved_by or "",
-                ]
-            )
-
-        return output.getvalue()
-
-    def export_cycle_charges_csv(self, cycle_id: int) -> str:
+        header = [
+            "Reading ID",
+            "Client Name",
+            "Phone Number",
+            "Meter Serial",
+            "Reading Value",
+            "Previous Reading",
+            "Consumption (m³)",
+            "Status",
+            "Approved",
+            "Submitted At",
+            "Approved At",
+            "Approved By",
+        ]
+        return _iter_csv(header, (self._reading_row(r) for r in readings))
+
+    @staticmethod
+    def _reading_row(reading: Reading) -> list:
+        assignment = reading.meter_assignment
+        client = assignment.client
+        meter = assignment.meter
+
+        # Previous value is implied by consumption unless the meter rolled over
+        previous = (
+            reading.absolute_value - reading.consumption
+            if reading.consumption is not None and not reading.has_rollover
+            else None
+        )
+        return [
+            reading.id,
+            f"{client.first_name} {client.surname}",
+            client.phone_number,
+            meter.serial_number,
+            f"{reading.absolute_value:.4f}",
+            f"{previous:.4f}" if previous is not None else "",
+            f"{reading.consumption:.4f}" if reading.consumption else "",
+            reading.type,
+            "Yes" if reading.approved else "No",
+            (
+                reading.submitted_at.strftime("%Y-%m-%d %H:%M:%S")
+                if reading.submitted_at
+                else ""
+            ),
+            (
+                reading.approved_at.strftime("%Y-%m-%d %H:%M:%S")
+                if reading.approved_at
+                else ""
+            ),
+            reading.approved_by or "",
+        ]
+
+    def iter_cycle_charges_csv(self, cycle_id: int) -> Iterator[str]:
         """
-        Export all charges (ledger entries) for a cycle to CSV.
+        Stream all charges (ledger entries) for a cycle as CSV chunks.
         Includes: client, meter, charge amount, cycle period.
+
+        Raises ValueError up front (before any chunk) if the cycle is missing.
         """
         cycle = self.cycle_repo.get(cycle_id)
         if not cycle:
             raise ValueError(f"Cycle {cycle_id} not found")
 
-        ledger_entries = self.ledger_repo.list_by_cycle(cycle_id)
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Entry ID",
-                "Client Name",
-                "Phone Number",
-                "Meter Serial",
-                "Entry Type",
-                "Amount (TZS)",
-                "Is Credit",
-                "Description",
-                "Created At",
-                "Created By",
-            ]
+        ledger_entries = self._stream(
+            select(LedgerEntry)
+            .options(*_load_parties(LedgerEntry.meter_assignment))
+            .where(LedgerEntry.cycle_id == cycle_id)
+            .order_by(desc(LedgerEntry.created_at))
         )
-
-        # Data rows
-        for entry in ledger_entries:
-            assignment = entry.meter_assignment
-            client = assignment.client
-            meter = assignment.meter
-
-            writer.writerow(
-                [
-                    entry.id,
-                    f"{client.first_name} {client.surname}",
-                    client.phone_number,
-                    meter.serial_number,
-                    entry.entry_type,
-                    f"{float(entry.amount):,.2f}",
-                    "Yes" if entry.is_credit else "No",
-                    entry.description,
-                    entry.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    entry.created_by,
-                ]
+        header = [
+            "Entry ID",
+            "Client Name",
+            "Phone Number",
+            "Meter Serial",
+            "Entry Type",
+            "Amount (TZS)",
+            "Is Credit",
+            "Description",
+            "Created At",
+            "Created By",
+        ]
+        return _iter_csv(header, (self._ledger_row(e) for e in ledger_entries))
+
+    @staticmethod
+    def _ledger_row(entry: LedgerEntry, cycle: Optional[Cycle] = None) -> list:
+        assignment = entry.meter_assignment
+        client = assignment.client
+        meter = assignment.meter
+
+        row = [
+            entry.id,
+            f"{client.first_name} {client.surname}",
+            client.phone_number,
+            meter.serial_number,
+            entry.entry_type,
+            f"{float(entry.amount):,.2f}",
+            "Yes" if entry.is_credit else "No",
+            entry.description,
+            entry.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            entry.created_by,
+        ]
+        if cycle is not None:
+            row.insert(
+                1,
+                f"{cycle.start_date.isoformat()} to {cycle.end_date.isoformat()}",
             )
+        return row
 
-        return output.getvalue()
+    @staticmethod
+    def _year_filter(year: int):
+        return Cycle.start_date.between(date(year, 1, 1), date(year, 12, 31))
 
-    def export_annual_ledger_csv(self, year: int) -> str:
+    def check_annual_ledger_year(self, year: int) -> None:
+        """Raise ValueError if no cycle starts in the given year."""
+        stmt = select(Cycle.id).where(self._year_filter(year)).limit(1)
+        if self.db.scalar(stmt) is None:
+            raise ValueError(f"No cycles found for year {year}")
+
+    def iter_annual_ledger_csv(self, year: int) -> Iterator[str]:
         """
-        Export all ledger entries for a year to CSV.
+        Stream all ledger entries for a year as CSV chunks.
         Annual financial report for compliance and auditing.
-        """
-        # Get all cycles for the year
-        all_cycles = self.cycle_repo.list(skip=0, limit=1000)
-        year_cycles = [c for c in all_cycles if c.start_date.year == year]
 
-        if not year_cycles:
-            raise ValueError(f"No cycles found for year {year}")
-
-        # Collect all ledger entries for year cycles
-        all_entries = []
-        for cycle in year_cycles:
-            entries = self.ledger_repo.list_by_cycle(cycle.id)
-            all_entries.extend([(entry, cycle) for entry in entries])
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Entry ID",
-                "Cycle",
-                "Client Name",
-                "Phone Number",
-                "Meter Serial",
-                "Entry Type",
-                "Amount (TZS)",
-                "Is Credit",
-                "Description",
-                "Created At",
-                "Created By",
-            ]
+        Raises ValueError up front (before any chunk) if the year has no cycles.
+        """
+        self.check_annual_ledger_year(year)
+
+        rows = self.db.execute(
+            select(LedgerEntry, Cycle)
+            .options(*_load_parties(LedgerEntry.meter_assignment))
+            .join(Cycle, LedgerEntry.cycle_id == Cycle.id)
+            .where(self._year_filter(year))
+            .order_by(LedgerEntry.created_at)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        header = [
+            "Entry ID",
+            "Cycle",
+            "Client Name",
+            "Phone Number",
+            "Meter Serial",
+            "Entry Type",
+            "Amount (TZS)",
+            "Is Credit",
+            "Description",
+            "Created At",
+            "Created By",
+        ]
+        return _iter_csv(
+            header, (self._ledger_row(entry, cycle) for entry, cycle in rows)
         )
 
-        # Data rows
-        for entry, cycle in sorted(all_entries, key=lambda x: x[0].created_at):
-            assignment = entry.meter_assignment
-            client = assignment.client
-            meter = assignment.meter
+    def write_annual_ledger_csv(self, year: int, out: IO[str]) -> None:
+        """
+        Write the annual ledger CSV to a text file.
 
-            writer.writerow(
-                [
-                    entry.id,
-                    f"{cycle.start_date.strftime('%Y-%m-%d')} to {cycle.end_date.strftime('%Y-%m-%d')}",
-                    f"{client.first_name} {client.surname}",
-                    client.phone_number,
-                    meter.serial_number,
-                    entry.entry_type,
-                    f"{float(entry.amount):,.2f}",
-                    "Yes" if entry.is_credit else "No",
-                    entry.description,
-                    entry.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    entry.created_by,
-                ]
-            )
+        On PostgreSQL the rows are formatted by the server and copied straight
+        into the file with COPY ... TO STDOUT, skipping ORM loading and the csv
+        module; other databases fall back to iter_annual_ledger_csv.
 
-        return output.getvalue()
+        Raises ValueError before writing anything if the year has no cycles.
+        """
+        bind = self.db.get_bind()
+        if bind.dialect.name != "postgresql":
+            for chunk in self.iter_annual_ledger_csv(year):
+                out.write(chunk)
+            return
+
+        self.check_annual_ledger_year(year)
+        stmt = self._annual_ledger_text_select(year)
+        compiled = stmt.compile(dialect=bind.dialect)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            query = cursor.mogrify(str(compiled), compiled.params).decode()
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV HEADER", out)
+        finally:
+            cursor.close()
+
+    @classmethod
+    def _annual_ledger_text_select(cls, year: int):
+        """Annual ledger rows formatted as text in SQL, matching _ledger_row"""
+        return (
+            select(
+                LedgerEntry.id.label("Entry ID"),
+                (
+                    func.to_char(Cycle.start_date, "YYYY-MM-DD")
+                    + literal(" to ")
+                    + func.to_char(Cycle.end_date, "YYYY-MM-DD")
+                ).label("Cycle"),
+                (Client.first_name + literal(" ") + Client.surname).label(
+                    "Client Name"
+                ),
+                Client.phone_number.label("Phone Number"),
+                Meter.serial_number.label("Meter Serial"),
+                LedgerEntry.entry_type.label("Entry Type"),
+                func.to_char(LedgerEntry.amount, "FM9,999,999,990.00").label(
+                    "Amount (TZS)"
+                ),
+                case((LedgerEntry.is_credit, "Yes"), else_="No").label("Is Credit"),
+                LedgerEntry.description.label("Description"),
+                func.to_char(LedgerEntry.created_at, "YYYY-MM-DD HH24:MI:SS").label(
+                    "Created At"
+                ),
+                LedgerEntry.created_by.label("Created By"),
+            )
+            .join(Cycle, LedgerEntry.cycle_id == Cycle.id)
+            .join(
+                MeterAssignment, LedgerEntry.meter_assignment_id == MeterAssignment.id
+            )
+            .join(Client, MeterAssignment.client_id == Client.id)
+            .join(Meter, MeterAssignment.meter_id == Meter.id)
+            .where(cls._year_filter(year))
+            .order_by(LedgerEntry.created_at)
+        )
 
-    def export_payments_csv(
+    def iter_payments_csv(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Export all payments within date range to CSV.
+        Stream all payments within date range as CSV chunks (newest first).
         """
-        payments = self.payment_repo.list(skip=0, limit=10000)
-
-        # Filter by date range if provided
+        stmt = (
+            select(Payment)
+            .options(
+                joinedload(Payment.meter_assignment).joinedload(MeterAssignment.client)
+            )
+            .order_by(desc(Payment.received_at))
+        )
         if start_date:
-            payments = [p for p in payments if p.received_at >= start_date]
+            stmt = stmt.where(Payment.received_at >= start_date)
         if end_date:
-            payments = [p for p in payments if p.received_at <= end_date]
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Payment ID",
-                "Client Name",
-                "Phone Number",
-                "Amount (TZS)",
-                "Reference",
-                "Method",
-                "Notes",
-                "Received At",
-                "Recorded By",
-            ]
-        )
-
-        # Data rows
-        for payment in payments:
-            assignment = payment.meter_assignment
-            client = (
-                self.assignment_repo.get(payment.meter_assignment_id).client
-                if payment.meter_assignment_id
-                else None
-            )
-
-            writer.writerow(
-                [
-                    payment.id,
-                    f"{client.first_name} {client.surname}" if client else "N/A",
-                    client.phone_number if client else "N/A",
-                    f"{float(payment.amount):,.2f}",
-                    payment.reference or "",
-                    payment.method or "",
-                    payment.notes or "",
-                    payment.received_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    payment.recorded_by,
-                ]
-            )
-
-        return output.getvalue()
-
-    def export_client_balances_csv(self) -> str:
+            stmt = stmt.where(Payment.received_at <= end_date)
+        payments = self._stream(stmt)
+
+        header = [
+            "Payment ID",
+            "Client Name",
+            "Phone Number",
+            "Amount (TZS)",
+            "Reference",
+            "Method",
+            "Notes",
+            "Received At",
+            "Recorded By",
+        ]
+        return _iter_csv(header, (self._payment_row(p) for p in payments))
+
+    @staticmethod
+    def _payment_row(payment: Payment) -> list:
+        assignment = payment.meter_assignment
+        client = assignment.client if assignment else None
+
+        return [
+            payment.id,
+            f"{client.first_name} {client.surname}" if client else "N/A",
+            client.phone_number if client else "N/A",
+            f"{float(payment.amount):,.2f}",
+            payment.reference or "",
+            payment.method or "",
+            payment.notes or "",
+            payment.received_at.strftime("%Y-%m-%d %H:%M:%S"),
+            payment.recorded_by,
+        ]
+
+    def iter_client_balances_csv(self) -> Iterator[str]:
         """
-        Export current balance summary for all active clients.
+        Stream current balance summary for all active clients as CSV chunks.
         """
         from app.services.ledger_service import LedgerService
 
-        # Get all active assignments
-        assignments = self.assignment_repo.list_active()
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Headers
-        writer.writerow(
-            [
-                "Client Name",
-                "Phone Number",
-                "Meter Serial",
-                "Total Debits (TZS)",
-                "Total Credits (TZS)",
-                "Net Balance (TZS)",
-                "Charges (TZS)",
-                "Penalties (TZS)",
-                "Payments (TZS)",
-            ]
-        )
-
-        # Data rows
+        # All active assignments, with client and meter loaded in the same query
+        assignments = self.db.scalars(
+            select(MeterAssignment)
+            .options(
+                joinedload(MeterAssignment.client), joinedload(MeterAssignment.meter)
+            )
+            .where(MeterAssignment.status == AssignmentStatus.ACTIVE)
+            .order_by(MeterAssignment.id)
+        ).all()
         ledger_service = LedgerService(self.db)
-        for assignment in assignments:
-            client = assignment.client
-            meter = assignment.meter
 
-            balance, error = ledger_service.compute_balance(assignment.id)
-            if error:
-                continue
+        def rows():
+            for assignment in assignments:
+                balance, error = ledger_service.compute_balance(assignment.id)
+                if error:
+                    continue
 
-            writer.writerow(
-                [
+                client = assignment.client
+                meter = assignment.meter
+                yield [
                     f"{client.first_name} {client.surname}",
                     client.phone_number,
                     meter.serial_number,
@@ -319,6 +398,40 @@ class ExportService:
                     f"{balance['breakdown']['penalties']:,.2f}",
                     f"{balance['breakdown']['payments']:,.2f}",
                 ]
-            )
 
-        return output.getvalue()
+        header = [
+            "Client Name",
+            "Phone Number",
+            "Meter Serial",
+            "Total Debits (TZS)",
+            "Total Credits (TZS)",
+            "Net Balance (TZS)",
+            "Charges (TZS)",
+            "Penalties (TZS)",
+            "Payments (TZS)",
+        ]
+        return _iter_csv(header, rows())
+
+    # Whole-document variants for callers that need the CSV as one string
+
+    def export_cycle_readings_csv(self, cycle_id: int) -> str:
+        """Export all readings for a cycle to CSV."""
+        return "".join(self.iter_cycle_readings_csv(cycle_id))
+
+    def export_cycle_charges_csv(self, cycle_id: int) -> str:
+        """Export all charges (ledger entries) for a cycle to CSV."""
+        return "".join(self.iter_cycle_charges_csv(cycle_id))
+
+    def export_annual_ledger_csv(self, year: int) -> str:
+        """Export all ledger entries for a year to CSV."""
+        return "".join(self.iter_annual_ledger_csv(year))
+
+    def export_payments_csv(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> str:
+        """Export all payments within date range to CSV."""
+        return "".join(self.iter_payments_csv(start_date, end_date))
+
+    def export_client_balances_csv(self) -> str:
+        """Export current balance summary for all active clients."""
+        return "".join(self.iter_client_balances_csv())
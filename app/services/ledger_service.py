@@ -14,6 +14,8 @@ from app.repositories.cycle import CycleRepository
 class LedgerService:
     """Service layer for ledger entries with basic validation"""
 
+    __slots__ = ("db", "repository", "assignment_repository", "cycle_repository")
+
     def __init__(self, db: Session):
         self.db = db
         self.repository = LedgerEntryRepository(db)
@@ -58,11 +60,15 @@ class LedgerService:
     def list_entries(self, skip: int = 0, limit: int = 100) -> List[LedgerEntry]:
         return self.repository.list(skip, limit)
 
-    def list_entries_by_assignment(self, meter_assignment_id: int) -> List[LedgerEntry]:
-        return self.repository.list_by_assignment(meter_assignment_id)
+    def list_entries_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[LedgerEntry]:
+        return self.repository.list_by_assignment(meter_assignment_id, skip, limit)
 
-    def list_entries_by_cycle(self, cycle_id: int) -> List[LedgerEntry]:
-        return self.repository.list_by_cycle(cycle_id)
+    def list_entries_by_cycle(
+        self, cycle_id: int, skip: int = 0, limit: int = 100
+    ) -> List[LedgerEntry]:
+        return self.repository.list_by_cycle(cycle_id, skip, limit)
 
     def compute_balance(
         self,
@@ -17,6 +17,8 @@ class MeterAssignmentService:
     starting meter reading when assignment begins.
     """
 
+    __slots__ = ("db", "repo", "reading_repo")
+
     def __init__(self, db: Session):
         self.db = db
         self.repo = MeterAssignmentRepository(db)
@@ -6,6 +6,8 @@ from app.schemas.meter import MeterCreate, MeterUpdate
 
 
 class MeterService:
+    __slots__ = ("repo",)
+
     def __init__(self, db: Session):
         self.repo = MeterRepository(db)
 
@@ -2,20 +2,20 @@
 Mobile service - handles bootstrap, incremental updates, and mobile reading submission.
 """
 
+import base64
+import binascii
+import hashlib
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_, and_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, desc, func, or_, and_, select, tuple_
 
 from app.models.cycle import Cycle, CycleStatus
 from app.models.meter_assignment import MeterAssignment, AssignmentStatus
 from app.models.reading import Reading, ReadingType
 from app.models.client import Client
 from app.models.meter import Meter
-from app.repositories.cycle import CycleRepository
-from app.repositories.meter_assignment import MeterAssignmentRepository
-from app.repositories.reading import ReadingRepository
 from app.services.reading_service import ReadingService
 from app.schemas.mobile import (
     MobileBootstrapResponse,
@@ -25,14 +25,33 @@ from app.schemas.mobile import (
 )
 
 
+# Readings per /updates page when the client pages with a cursor
+UPDATES_PAGE_SIZE = 500
+
+
+def encode_sync_cursor(updated_at: datetime, reading_id: int) -> str:
+    """Opaque /updates cursor for the (updated_at, id) of the last reading sent"""
+    raw = f"{updated_at.isoformat()}|{reading_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_sync_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Inverse of encode_sync_cursor; None if the cursor is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, reading_id = raw.split("|")
+        return datetime.fromisoformat(updated_at), int(reading_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
 class MobileService:
     """Service for mobile app sync and reading submission"""
 
+    __slots__ = ("db", "reading_service")
+
     def __init__(self, db: Session):
         self.db = db
-        self.cycle_repo = CycleRepository(db)
-        self.assignment_repo = MeterAssignmentRepository(db)
-        self.reading_repo = ReadingRepository(db)
         self.reading_service = ReadingService(db)
 
     def get_bootstrap(self) -> MobileBootstrapResponse:
@@ -46,8 +65,17 @@ class MobileService:
         )
         cycle_ids = [c.id for c in all_cycles]
 
-        # Get all active assignments
-        assignments = self.assignment_repo.list_active(skip=0, limit=10000)
+        # Get all active assignments, with their clients and meters joined in
+        assignments = (
+            self.db.query(MeterAssignment)
+            .options(
+                joinedload(MeterAssignment.client), joinedload(MeterAssignment.meter)
+            )
+            .filter(MeterAssignment.status == AssignmentStatus.ACTIVE)
+            .order_by(MeterAssignment.id)
+            .limit(10000)
+            .all()
+        )
         assignment_ids = [a.id for a in assignments]
 
         # Get latest approved readings for each assignment+cycle pair
@@ -65,12 +93,9 @@ class MobileService:
             .all()
         )
 
-        # Get all clients and meters referenced by active assignments
-        client_ids = list({a.client_id for a in assignments})
-        meter_ids = list({a.meter_id for a in assignments})
-
-        clients = self.db.query(Client).filter(Client.id.in_(client_ids)).all()
-        meters = self.db.query(Meter).filter(Meter.id.in_(meter_ids)).all()
+        # Clients and meters referenced by active assignments (already loaded)
+        clients = list({a.client_id: a.client for a in assignments}.values())
+        meters = list({a.meter_id: a.meter for a in assignments}.values())
 
         return MobileBootstrapResponse(
             assignments=assignments,
@@ -81,10 +106,20 @@ class MobileService:
             last_sync=datetime.utcnow(),
         )
 
-    def get_updates(self, since: datetime) -> MobileUpdatesResponse:
+    def get_updates(
+        self,
+        since: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        page_size: Optional[int] = None,
+    ) -> MobileUpdatesResponse:
         """
         Get incremental updates since last sync.
         Returns changed entities + tombstones for closed/archived cycles.
+
+        With page_size (or an after cursor), readings are returned in
+        (updated_at, id) order one page at a time and next_cursor points at
+        the following page. Every other entity and the tombstones come only
+        with the first page; later pages carry readings alone.
         """
         # Get cycles updated since timestamp (within last 12 cycles window)
         all_cycles = (
@@ -92,6 +127,40 @@ class MobileService:
         )
         cycle_ids = [c.id for c in all_cycles]
 
+        # Get readings updated since timestamp (approved only, in 12-cycle window)
+        readings_query = self.db.query(Reading).filter(
+            and_(
+                Reading.cycle_id.in_(cycle_ids),
+                Reading.updated_at >= since,
+                Reading.approved == True,
+            )
+        )
+        next_cursor = None
+        if after is None and page_size is None:
+            updated_readings = readings_query.all()
+        else:
+            page_size = page_size or UPDATES_PAGE_SIZE
+            if after is not None:
+                readings_query = readings_query.filter(
+                    tuple_(Reading.updated_at, Reading.id) > after
+                )
+            updated_readings = (
+                readings_query.order_by(Reading.updated_at, Reading.id)
+                .limit(page_size + 1)
+                .all()
+            )
+            if len(updated_readings) > page_size:
+                updated_readings = updated_readings[:page_size]
+                last = updated_readings[-1]
+                next_cursor = encode_sync_cursor(last.updated_at, last.id)
+
+        if after is not None:
+            return MobileUpdatesResponse(
+                readings=updated_readings,
+                last_sync=datetime.utcnow(),
+                next_cursor=next_cursor,
+            )
+
         updated_cycles = (
             self.db.query(Cycle)
             .filter(
@@ -112,19 +181,6 @@ class MobileService:
 
         assignment_ids = [a.id for a in updated_assignments]
 
-        # Get readings updated since timestamp (approved only, in 12-cycle window)
-        updated_readings = (
-            self.db.query(Reading)
-            .filter(
-                and_(
-                    Reading.cycle_id.in_(cycle_ids),
-                    Reading.updated_at >= since,
-                    Reading.approved == True,
-                )
-            )
-            .all()
-        )
-
         # Get clients and meters that may have changed
         client_ids = list({a.client_id for a in updated_assignments})
         meter_ids = list({a.meter_id for a in updated_assignments})
@@ -210,17 +266,59 @@ class MobileService:
             meters=updated_meters,
             tombstones=tombstones,
             last_sync=datetime.utcnow(),
+            next_cursor=next_cursor,
+        )
+
+    def get_updates_version(
+        self,
+        since: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        page_size: Optional[int] = None,
+    ) -> str:
+        """
+        Cheap fingerprint of what get_updates would return for these arguments.
+
+        Built from the row count and newest updated_at of everything changed
+        since `since`, plus the cycle rows themselves (cycles.updated_at only
+        has day precision). Any write that would change the delta changes
+        the fingerprint, so it can serve as an ETag for /updates.
+        """
+        aggregates = self.db.execute(
+            select(
+                *(
+                    select(aggregate)
+                    .where(model.updated_at >= since)
+                    .scalar_subquery()
+                    for model in (Reading, MeterAssignment, Client, Meter)
+                    for aggregate in (func.count(), func.max(model.updated_at))
+                )
+            )
+        ).one()
+
+        window = (
+            select(Cycle.id).order_by(desc(Cycle.start_date)).limit(12).subquery()
         )
+        cycles = self.db.execute(
+            select(*Cycle.__table__.columns)
+            .where(or_(Cycle.id.in_(select(window.c.id)), Cycle.updated_at >= since))
+            .order_by(Cycle.id)
+        ).all()
+
+        source = repr((since, after, page_size, tuple(aggregates), cycles))
+        return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
 
     def submit_mobile_reading(
         self, payload: MobileReadingSubmit
-    ) -> Tuple[Optional[Reading], Optional[str]]:
+    ) -> Tuple[Optional[Reading], Optional[str], Optional[Reading]]:
         """
         Submit reading from mobile app.
         Delegates to existing ReadingService with mobile-specific metadata.
+
+        Returns (reading, error, existing); existing is the reading already
+        submitted for the assignment and cycle when the submission conflicts.
         """
         # Use existing reading service for validation and submission
-        reading, error = self.reading_service.submit_reading(
+        reading, error, existing = self.reading_service.submit_reading_or_conflict(
             meter_assignment_id=payload.meter_assignment_id,
             cycle_id=payload.cycle_id,
             absolute_value=payload.absolute_value,
@@ -232,4 +330,28 @@ class MobileService:
         # in a separate mobile_metadata JSON column or audit log
         # For now, we just return the reading
 
-        return reading, error
+        return reading, error, existing
+
+    def submit_mobile_readings(
+        self, payloads: List[MobileReadingSubmit]
+    ) -> List[Tuple[Optional[Row], Optional[str], Optional[Row]]]:
+        """
+        Submit a batch of offline-queued readings from the mobile app.
+
+        Returns one (reading, error, existing) per payload, in order, as
+        submit_mobile_reading does for a single reading.
+        """
+        return self.reading_service.submit_readings_batch(
+            [
+                payload.model_dump(
+                    include={
+                        "meter_assignment_id",
+                        "cycle_id",
+                        "absolute_value",
+                        "submitted_by",
+                        "submission_notes",
+                    }
+                )
+                for payload in payloads
+            ]
+        )
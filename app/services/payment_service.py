@@ -14,6 +14,8 @@ from app.repositories.cycle import CycleRepository
 class PaymentService:
     """Service layer for payments with basic validation"""
 
+    __slots__ = ("db", "repository", "assignment_repository", "cycle_repository")
+
     def __init__(self, db: Session):
         self.db = db
         self.repository = PaymentRepository(db)
@@ -60,11 +62,15 @@ class PaymentService:
     def list_payments(self, skip: int = 0, limit: int = 100) -> List[Payment]:
         return self.repository.list(skip, limit)
 
-    def list_payments_by_assignment(self, meter_assignment_id: int) -> List[Payment]:
-        return self.repository.list_by_assignment(meter_assignment_id)
+    def list_payments_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Payment]:
+        return self.repository.list_by_assignment(meter_assignment_id, skip, limit)
 
-    def list_payments_by_client(self, client_id: int) -> List[Payment]:
-        return self.repository.list_by_client(client_id)
+    def list_payments_by_client(
+        self, client_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Payment]:
+        return self.repository.list_by_client(client_id, skip, limit)
 
     def allocate_payment_fifo(
         self,
@@ -15,6 +15,8 @@ from app.repositories.cycle import CycleRepository
 class PenaltyService:
     """Service layer for penalties with validation"""
 
+    __slots__ = ("db", "repository", "assignment_repository", "cycle_repository")
+
     def __init__(self, db: Session):
         self.db = db
         self.repository = PenaltyRepository(db)
@@ -56,8 +58,10 @@ class PenaltyService:
     def list_penalties(self, skip: int = 0, limit: int = 100) -> List[Penalty]:
         return self.repository.list(skip, limit)
 
-    def list_penalties_by_assignment(self, meter_assignment_id: int) -> List[Penalty]:
-        return self.repository.list_by_assignment(meter_assignment_id)
+    def list_penalties_by_assignment(
+        self, meter_assignment_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Penalty]:
+        return self.repository.list_by_assignment(meter_assignment_id, skip, limit)
 
     def waive_penalty(
         self,
@@ -4,7 +4,8 @@ Reading service - business logic for meter readings and consumption calculation.
 
 from datetime import datetime, date
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 from app.models.reading import Reading, ReadingType
 from app.models.meter_assignment import MeterAssignment, AssignmentStatus
@@ -14,7 +15,11 @@ from app.repositories.reading import ReadingRepository
 from app.repositories.meter_assignment import MeterAssignmentRepository
 from app.repositories.cycle import CycleRepository
 from app.repositories.anomaly import AnomalyRepository
-from app.services.anomaly_service import AnomalyService
+from app.services.anomaly_service import (
+    AnomalyService,
+    ROLLOVER_THRESHOLD,
+    rollover_threshold_description,
+)
 
 
 class ReadingService:
@@ -28,6 +33,15 @@ class ReadingService:
     - Rollover detection (reading decreased = meter rolled over)
     """
 
+    __slots__ = (
+        "db",
+        "repository",
+        "assignment_repository",
+        "cycle_repository",
+        "anomaly_repository",
+        "anomaly_service",
+    )
+
     def __init__(self, db: Session):
         self.db = db
         self.repository = ReadingRepository(db)
@@ -60,26 +74,53 @@ class ReadingService:
             (Reading, None) if successful
             (None, error_message) if validation fails
         """
+        reading, error, _ = self.submit_reading_or_conflict(
+            meter_assignment_id,
+            cycle_id,
+            absolute_value,
+            submitted_by,
+            submission_notes,
+        )
+        return reading, error
+
+    def submit_reading_or_conflict(
+        self,
+        meter_assignment_id: int,
+        cycle_id: int,
+        absolute_value: Decimal,
+        submitted_by: str,
+        submission_notes: Optional[str] = None,
+    ) -> Tuple[Optional[Reading], Optional[str], Optional[Reading]]:
+        """
+        submit_reading, also returning the reading already in the cycle.
+
+        Returns:
+            (Reading, None, None) if successful
+            (None, error_message, existing_reading) for a duplicate submission
+            (None, error_message, None) if any other validation fails
+        """
         # ============ Validate Assignment ============
         assignment = self.assignment_repository.get(meter_assignment_id)
         if not assignment:
-            return None, f"Meter assignment {meter_assignment_id} not found"
+            return None, f"Meter assignment {meter_assignment_id} not found", None
 
         if assignment.status != AssignmentStatus.ACTIVE:
             return (
                 None,
                 f"Meter assignment {meter_assignment_id} is not ACTIVE (current: {assignment.status})",
+                None,
             )
 
         # ============ Validate Cycle ============
         cycle = self.cycle_repository.get(cycle_id)
         if not cycle:
-            return None, f"Cycle {cycle_id} not found"
+            return None, f"Cycle {cycle_id} not found", None
 
         if cycle.status != CycleStatus.OPEN.value:
             return (
                 None,
                 f"Cycle {cycle_id} is not OPEN for submissions (current status: {cycle.status})",
+                None,
             )
 
         # ============ Check Submission Window ============
@@ -99,20 +140,11 @@ class ReadingService:
             return (
                 None,
                 f"No baseline reading exists for assignment {meter_assignment_id}. Cannot submit normal readings.",
-            )
-
-        # ============ Check for Duplicate Submission ============
-        existing_in_cycle = self.repository.get_by_assignment_and_cycle(
-            meter_assignment_id, cycle_id
-        )
-        if existing_in_cycle:
-            return (
                 None,
-                f"Reading already submitted for this meter in cycle {cycle_id}. ID: {existing_in_cycle.id}",
             )
 
-        # ============ Create Reading ============
-        reading = self.repository.create(
+        # ============ Create Reading (rejects duplicate submissions) ============
+        reading = self.repository.create_unless_in_cycle(
             meter_assignment_id=meter_assignment_id,
             cycle_id=cycle_id,
             absolute_value=absolute_value,
@@ -120,6 +152,15 @@ class ReadingService:
             submitted_by=submitted_by,
             submission_notes=submission_notes,
         )
+        if reading is None:
+            existing_in_cycle = self.repository.get_by_assignment_and_cycle(
+                meter_assignment_id, cycle_id
+            )
+            return (
+                None,
+                f"Reading already submitted for this meter in cycle {cycle_id}. ID: {existing_in_cycle.id}",
+                existing_in_cycle,
+            )
 
         # ============ Detect Anomalies ============
         anomalies = []
@@ -169,15 +210,186 @@ class ReadingService:
         if threshold_anomaly:
             anomalies.append(threshold_anomaly)
 
-        return reading, None
+        return reading, None, None
+
+    def submit_readings_batch(
+        self, submissions: Sequence[Dict]
+    ) -> List[Tuple[Optional[Row], Optional[str], Optional[Row]]]:
+        """
+        Submit several readings with the same rules as submit_reading.
+
+        Each submission is a dict of submit_reading's arguments. Assignments,
+        cycles, baselines, readings already in the cycle, previous approved
+        values and open threshold alerts are each fetched with one IN query;
+        accepted readings go in with one multi-row INSERT and anomalies are
+        committed with them.
+
+        Returns one (reading, error, existing) per submission, in order, as in
+        submit_reading_or_conflict. A second submission for the same
+        assignment and cycle within the batch conflicts with the first.
+        Readings are returned as plain rows.
+        """
+        if not submissions:
+            return []
+
+        assignment_ids = {s["meter_assignment_id"] for s in submissions}
+        assignments = self.assignment_repository.get_many_with_meter(assignment_ids)
+        cycles = self.cycle_repository.get_many(s["cycle_id"] for s in submissions)
+        with_baseline = self.repository.assignments_with_baseline(assignment_ids)
+        existing = self.repository.get_by_assignments_and_cycles(
+            (s["meter_assignment_id"], s["cycle_id"]) for s in submissions
+        )
+
+        today = date.today()
+        results: List = [None] * len(submissions)
+        accepted: List[int] = []
+        claimed: Dict[Tuple[int, int], int] = {}
+        for index, submission in enumerate(submissions):
+            meter_assignment_id = submission["meter_assignment_id"]
+            cycle_id = submission["cycle_id"]
+            pair = (meter_assignment_id, cycle_id)
+
+            assignment = assignments.get(meter_assignment_id)
+            cycle = cycles.get(cycle_id)
+            if not assignment:
+                error = f"Meter assignment {meter_assignment_id} not found"
+            elif assignment.status != AssignmentStatus.ACTIVE:
+                error = f"Meter assignment {meter_assignment_id} is not ACTIVE (current: {assignment.status})"
+            elif not cycle:
+                error = f"Cycle {cycle_id} not found"
+            elif cycle.status != CycleStatus.OPEN.value:
+                error = f"Cycle {cycle_id} is not OPEN for submissions (current status: {cycle.status})"
+            elif meter_assignment_id not in with_baseline:
+                error = f"No baseline reading exists for assignment {meter_assignment_id}. Cannot submit normal readings."
+            elif pair in existing:
+                error = f"Reading already submitted for this meter in cycle {cycle_id}. ID: {existing[pair].id}"
+                results[index] = (None, error, existing[pair])
+                continue
+            elif pair in claimed:
+                # Resolved against the earlier submission once it is inserted
+                continue
+            else:
+                claimed[pair] = index
+                accepted.append(index)
+                continue
+            results[index] = (None, error, None)
+
+        inserted = self.repository.insert_many(
+            [
+                {
+                    "meter_assignment_id": submissions[i]["meter_assignment_id"],
+                    "cycle_id": submissions[i]["cycle_id"],
+                    "absolute_value": submissions[i]["absolute_value"],
+                    "type": ReadingType.NORMAL.value,
+                    "submitted_by": submissions[i]["submitted_by"],
+                    "submission_notes": submissions[i].get("submission_notes"),
+                }
+                for i in accepted
+            ]
+        )
+        # A reading committed since the duplicate check above skips its row
+        skipped = self.repository.get_by_assignments_and_cycles(
+            (submissions[i]["meter_assignment_id"], submissions[i]["cycle_id"])
+            for i, reading in zip(accepted, inserted)
+            if reading is None
+        )
+        for index, reading in zip(accepted, inserted):
+            if reading is None:
+                pair = (
+                    submissions[index]["meter_assignment_id"],
+                    submissions[index]["cycle_id"],
+                )
+                reading = skipped[pair]
+                results[index] = (
+                    None,
+                    f"Reading already submitted for this meter in cycle {reading.cycle_id}. ID: {reading.id}",
+                    reading,
+                )
+            else:
+                results[index] = (reading, None, None)
+        for index, submission in enumerate(submissions):
+            if results[index] is None:
+                pair = (submission["meter_assignment_id"], submission["cycle_id"])
+                first, _, existing_in_cycle = results[claimed[pair]]
+                first = first or existing_in_cycle
+                results[index] = (
+                    None,
+                    f"Reading already submitted for this meter in cycle {first.cycle_id}. ID: {first.id}",
+                    first,
+                )
+        inserted = [reading for reading in inserted if reading is not None]
+
+        # ============ Detect Anomalies ============
+        previous_values = self.repository.latest_approved_values(assignment_ids)
+        alerted = (
+            self.anomaly_repository.assignments_with_unacknowledged_threshold_alert(
+                assignment_ids
+            )
+        )
+        anomalies = []
+        for reading in inserted:
+            cycle = cycles[reading.cycle_id]
+            if today > cycle.target_date:
+                anomalies.append(
+                    dict(
+                        meter_assignment_id=reading.meter_assignment_id,
+                        cycle_id=reading.cycle_id,
+                        reading_id=reading.id,
+                        anomaly_type=AnomalyType.LATE_SUBMISSION,
+                        description=f"Reading submitted {(today - cycle.target_date).days} days after deadline ({cycle.target_date})",
+                    )
+                )
+
+            previous = previous_values.get(reading.meter_assignment_id)
+            if previous is not None and Decimal(reading.absolute_value) < Decimal(
+                previous
+            ):
+                anomalies.append(
+                    dict(
+                        meter_assignment_id=reading.meter_assignment_id,
+                        cycle_id=reading.cycle_id,
+                        reading_id=reading.id,
+                        anomaly_type=AnomalyType.ROLLOVER_WITHOUT_LIMIT,
+                        description=f"Meter reading decreased from {previous} to {reading.absolute_value}. Possible rollover.",
+                    )
+                )
+
+            # One open threshold alert per assignment, as in check_and_log_rollover_threshold
+            if (
+                Decimal(reading.absolute_value) >= ROLLOVER_THRESHOLD
+                and reading.meter_assignment_id not in alerted
+            ):
+                alerted.add(reading.meter_assignment_id)
+                assignment = assignments[reading.meter_assignment_id]
+                meter_serial = (
+                    assignment.meter.serial_number if assignment.meter else "UNKNOWN"
+                )
+                anomalies.append(
+                    dict(
+                        meter_assignment_id=reading.meter_assignment_id,
+                        cycle_id=reading.cycle_id,
+                        reading_id=reading.id,
+                        anomaly_type=AnomalyType.METER_ROLLOVER_THRESHOLD,
+                        description=rollover_threshold_description(
+                            meter_serial, Decimal(reading.absolute_value)
+                        ),
+                        severity="CRITICAL",
+                    )
+                )
+        self.anomaly_repository.add_many(anomalies)
+        self.db.commit()
+
+        return results
 
     def get_reading(self, reading_id: int) -> Optional[Reading]:
         """Get reading by ID"""
         return self.repository.get(reading_id)
 
-    def list_readings(self, skip: int = 0, limit: int = 100) -> List[Reading]:
+    def list_readings(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reading]:
         """List all readings"""
-        return self.repository.list(skip, limit)
+        return self.repository.list(skip, limit, after_id)
 
     def get_readings_by_assignment(self, meter_assignment_id: int) -> List[Reading]:
         """Get all readings for a meter assignment"""
@@ -187,6 +399,18 @@ class ReadingService:
         """Get all readings for a cycle"""
         return self.repository.get_by_cycle(cycle_id)
 
+    def iter_readings_by_assignment(self, meter_assignment_id: int) -> Iterator[Reading]:
+        """Stream all readings for a meter assignment from the database"""
+        return self.repository.iter_by_assignment(meter_assignment_id)
+
+    def iter_readings_by_cycle(self, cycle_id: int) -> Iterator[Reading]:
+        """Stream all readings for a cycle from the database"""
+        return self.repository.iter_by_cycle(cycle_id)
+
+    def iter_readings(self, after_id: Optional[int] = None) -> Iterator[Reading]:
+        """Stream all readings (newest first) from the database"""
+        return self.repository.iter_all(after_id)
+
     def get_pending_readings(self) -> List[Reading]:
         """Get all unapproved readings waiting for admin review"""
         return self.repository.get_pending()
@@ -202,6 +426,9 @@ class ReadingService:
         - NORMAL readings: consumption = current - previous approved
         - Rollover: if negative, flag with has_rollover=True
 
+        Approved readings already store the consumption worked out (or
+        overridden) at approval, so they are answered from that one row.
+
         Returns:
             (consumption in m³, error/warning message)
         """
@@ -213,6 +440,14 @@ class ReadingService:
         if reading.type == ReadingType.BASELINE.value:
             return Decimal(0), None
 
+        if reading.approved and reading.consumption is not None:
+            if reading.has_rollover:
+                return (
+                    reading.consumption,
+                    "ROLLOVER: Meter reading decreased - possible meter reset/rollover",
+                )
+            return reading.consumption, None
+
         # Get previous approved reading
         prev_reading = self.repository.get_latest_approved(
             reading.meter_assignment_id, exclude_id=reading.id
@@ -224,8 +459,8 @@ class ReadingService:
                 "No previous approved reading found for consumption calculation",
             )
 
-        consumption = Decimal(reading.reading_value) - Decimal(
-            prev_reading.reading_value
+        consumption = Decimal(reading.absolute_value) - Decimal(
+            prev_reading.absolute_value
         )
 
         if consumption < 0:
@@ -257,7 +492,7 @@ class ReadingService:
             (approved Reading, None) if successful
             (None, error_message) if validation fails
         """
-        reading = self.repository.get(reading_id)
+        reading = self.repository.get_for_update(reading_id)
         if not reading:
             return None, f"Reading {reading_id} not found"
 
@@ -340,7 +575,7 @@ class ReadingService:
 
         Allows the user to submit a corrected reading.
         """
-        reading = self.repository.get(reading_id)
+        reading = self.repository.get_for_update(reading_id)
         if not reading:
             return None, f"Reading {reading_id} not found"
 
@@ -384,7 +619,7 @@ class ReadingService:
             (updated Reading, None) if successful
             (None, error_message) if validation fails
         """
-        reading = self.repository.get(reading_id)
+        reading = self.repository.get_for_update(reading_id)
         if not reading:
             return None, f"Reading {reading_id} not found"
 
@@ -452,7 +687,7 @@ class ReadingService:
         Allows admin to mark a rollover detection as a false positive.
         User must resubmit corrected reading.
         """
-        reading = self.repository.get(reading_id)
+        reading = self.repository.get_for_update(reading_id)
         if not reading:
             return None, f"Reading {reading_id} not found"
 
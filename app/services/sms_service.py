@@ -1,28 +1,56 @@
 """SMS service"""
 
-from typing import List, Optional, Tuple
+import asyncio
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
 from datetime import datetime
 from decimal import Decimal
 import json
 import uuid
+from anyio import to_thread
 from sqlalchemy.orm import Session
 from app.repositories.sms import SMSRepository
-from app.schemas.sms import SMSMessageCreate, SMSMessageUpdate, SMSMessageResponse
+from app.schemas.sms import SMSMessageCreate, SMSMessageResponse
 from app.models.sms import SMSMessage, SMSStatus, SMSDeliveryStatus
 from app.services.africastalking_client import AfricasTalkingClient
 
+T = TypeVar("T")
+
 
 class SMSService:
     """Service for SMS operations"""
 
+    __slots__ = ("repository", "_db_lock")
+
     def __init__(self, db: Session):
         self.repository = SMSRepository(db)
+        self._db_lock = asyncio.Lock()
 
     def queue_sms(self, sms: SMSMessageCreate) -> SMSMessageResponse:
         """Queue new SMS for sending"""
         db_sms = self.repository.create(sms)
         return SMSMessageResponse.model_validate(db_sms)
 
+    def queue_sms_once(self, sms: SMSMessageCreate) -> Tuple[SMSMessageResponse, bool]:
+        """
+        Queue an SMS unless one was already queued with its idempotency key.
+
+        Returns (sms, created); on a duplicate, sms is the existing message.
+        """
+        db_sms, created = self.repository.create_unless_duplicate(sms)
+        return SMSMessageResponse.model_validate(db_sms), created
+
+    def queue_sms_bulk(
+        self, smss: Sequence[SMSMessageCreate]
+    ) -> Tuple[List[SMSMessage], int]:
+        """
+        Queue many SMS at once, skipping idempotency keys already queued.
+
+        Returns the SMS in request order (the existing message for a
+        duplicate key) and how many were newly queued.
+        """
+        db_sms_list, created = self.repository.create_many_unless_duplicate(smss)
+        return db_sms_list, len(created)
+
     def get_sms(self, sms_id: int) -> Optional[SMSMessageResponse]:
         """Get SMS by ID"""
         db_sms = self.repository.get_by_id(sms_id)
@@ -30,38 +58,48 @@ class SMSService:
             return SMSMessageResponse.model_validate(db_sms)
         return None
 
-    def get_all_sms(self, skip: int = 0, limit: int = 100) -> List[SMSMessageResponse]:
-        """Get all SMS with pagination"""
-        db_sms_list = self.repository.get_all(skip, limit)
-        return [SMSMessageResponse.model_validate(sms) for sms in db_sms_list]
+    def get_all_sms(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
+        """
+        Get all SMS with pagination.
+
+        The list methods return ORM rows; routes serialize them in one pass
+        with adapter_json_response.
+        """
+        return self.repository.get_all(skip, limit, after_id)
 
     def get_pending_sms(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[SMSMessageResponse]:
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
         """Get pending SMS (not yet sent)"""
-        db_sms_list = self.repository.get_pending(skip, limit)
-        return [SMSMessageResponse.model_validate(sms) for sms in db_sms_list]
+        return self.repository.get_pending(skip, limit, after_id)
 
     def get_retry_scheduled(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[SMSMessageResponse]:
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[SMSMessage]:
         """Get SMS ready for retry (for scheduler)"""
-        db_sms_list = self.repository.get_retry_scheduled(skip, limit)
-        return [SMSMessageResponse.model_validate(sms) for sms in db_sms_list]
+        return self.repository.get_retry_scheduled(skip, limit, after_id)
 
     def get_sms_by_client(
-        self, client_id: int, skip: int = 0, limit: int = 100
-    ) -> List[SMSMessageResponse]:
+        self,
+        client_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> List[SMSMessage]:
         """Get SMS for specific client"""
-        db_sms_list = self.repository.get_by_client(client_id, skip, limit)
-        return [SMSMessageResponse.model_validate(sms) for sms in db_sms_list]
+        return self.repository.get_by_client(client_id, skip, limit, after_id)
 
     def get_sms_by_phone(
-        self, phone_number: str, skip: int = 0, limit: int = 100
-    ) -> List[SMSMessageResponse]:
+        self,
+        phone_number: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> List[SMSMessage]:
         """Get SMS for specific phone number"""
-        db_sms_list = self.repository.get_by_phone(phone_number, skip, limit)
-        return [SMSMessageResponse.model_validate(sms) for sms in db_sms_list]
+        return self.repository.get_by_phone(phone_number, skip, limit, after_id)
 
     def check_idempotency(self, idempotency_key: str) -> Optional[SMSMessageResponse]:
         """Check if SMS already queued with this key (prevent duplicates)"""
@@ -74,38 +112,23 @@ class SMSService:
         self, sms_id: int, gateway_reference: str
     ) -> Optional[SMSMessageResponse]:
         """Record that SMS was sent to gateway"""
-        update = SMSMessageUpdate(
-            status=SMSStatus.SENT, gateway_reference=gateway_reference
-        )
-        db_sms = self.repository.update(sms_id, update)
-        if db_sms:
-            db_sms.last_attempt_at = datetime.utcnow()
-            db_sms.sent_at = datetime.utcnow()
-            db_sms.retry_count += 1
-            return SMSMessageResponse.model_validate(db_sms)
-        return None
+        db_sms = self.repository.mark_sent(sms_id, gateway_reference)
+        if db_sms is None:
+            return None
+        response = SMSMessageResponse.model_validate(db_sms)
+        self.repository.db.commit()
+        return response
 
     def record_failed(
         self, sms_id: int, error_reason: str
     ) -> Optional[SMSMessageResponse]:
-        """Record that SMS sending failed"""
-        db_sms = self.repository.get_by_id(sms_id)
-        if db_sms:
-            db_sms.last_attempt_at = datetime.utcnow()
-            db_sms.error_reason = error_reason
-
-            # If we have retries left, schedule next retry
-            if db_sms.retry_count < db_sms.max_retries:
-                db_sms.status = SMSStatus.PENDING
-                db_sms.calculate_next_retry()
-            else:
-                db_sms.status = SMSStatus.FAILED
-
-            self.repository.db.add(db_sms)
-            self.repository.db.commit()
-            self.repository.db.refresh(db_sms)
-            return SMSMessageResponse.model_validate(db_sms)
-        return None
+        """Record that SMS sending failed (re-queued while retries remain)"""
+        db_sms = self.repository.mark_failed(sms_id, error_reason)
+        if db_sms is None:
+            return None
+        response = SMSMessageResponse.model_validate(db_sms)
+        self.repository.db.commit()
+        return response
 
     def record_delivery_attempt(
         self,
@@ -139,11 +162,10 @@ class SMSService:
         self, gateway_reference: str, callback_status: str
     ) -> Optional[SMSMessageResponse]:
         """Process SMS gateway callback (delivered/failed/bounced)"""
-        # Find SMS by gateway reference
-        db_sms = (
-            self.repository.db.query(SMSMessage)
-            .filter(SMSMessage.gateway_reference == gateway_reference)
-            .first()
+        # Find SMS by gateway reference; the row lock serialises a gateway
+        # that delivers the same callback twice at once
+        db_sms = self.repository.get_by_gateway_reference_for_update(
+            gateway_reference
         )
 
         if db_sms:
@@ -154,17 +176,28 @@ class SMSService:
             )
         return None
 
-    async def send_sms(self, sms_id: int) -> Tuple[bool, Optional[str]]:
+    async def send_sms(
+        self, sms_id: int
+    ) -> Tuple[bool, Optional[str], Optional[SMSStatus]]:
         """
         Send SMS via TextBee gateway and record delivery attempt.
-        Returns (success, error_message).
+        Returns (success, error_message, status); status is the SMS status
+        after the attempt (None if the SMS does not exist), taken before the
+        commit so callers need not reload the row.
+
+        The blocking DB steps run in a worker thread so the event loop only
+        waits on the gateway; see _run_db.
         """
-        db_sms = self.repository.get_by_id(sms_id)
+        db_sms = await self._run_db(self.repository.get_by_id, sms_id)
         if not db_sms:
-            return False, f"SMS {sms_id} not found"
+            return False, f"SMS {sms_id} not found", None
 
         if db_sms.status not in [SMSStatus.PENDING]:
-            return False, f"SMS {sms_id} status is {db_sms.status}, cannot send"
+            return (
+                False,
+                f"SMS {sms_id} status is {db_sms.status}, cannot send",
+                db_sms.status,
+            )
 
         # Initialize Africa's Talking client
         at_client = AfricasTalkingClient()
@@ -179,7 +212,33 @@ class SMSService:
             idempotency_key=db_sms.idempotency_key,
         )
 
-        # Record delivery attempt
+        return await self._run_db(
+            self._record_send_result,
+            db_sms,
+            success,
+            gateway_reference,
+            response_data,
+        )
+
+    async def _run_db(self, func: Callable[..., T], *args) -> T:
+        """
+        Run blocking session work in anyio's threadpool.
+
+        process_retry_queue overlaps several sends on one service, so the
+        lock keeps the shared session to one thread at a time.
+        """
+        async with self._db_lock:
+            return await to_thread.run_sync(func, *args)
+
+    def _record_send_result(
+        self,
+        db_sms: SMSMessage,
+        success: bool,
+        gateway_reference: Optional[str],
+        response_data: dict,
+    ) -> Tuple[bool, Optional[str], SMSStatus]:
+        """Record a gateway attempt on the SMS and its delivery history"""
+        sms_id = db_sms.id
         attempt_number = db_sms.retry_count + 1
 
         if success and gateway_reference:
@@ -202,7 +261,7 @@ class SMSService:
                 gateway_response=json.dumps(response_data),
             )
 
-            return True, None
+            return True, None, SMSStatus.SENT
         else:
             # Failed - record failure and schedule retry if available
             error_msg = response_data.get("error", "Unknown error")
@@ -217,6 +276,7 @@ class SMSService:
                 db_sms.calculate_next_retry()
             else:
                 db_sms.status = SMSStatus.FAILED
+            status = db_sms.status
 
             self.repository.db.add(db_sms)
             self.repository.db.commit()
@@ -231,7 +291,7 @@ class SMSService:
                 error_message=error_msg,
             )
 
-            return False, error_msg
+            return False, error_msg, status
 
     def compose_balance_alert(
         self,
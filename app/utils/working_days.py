@@ -6,14 +6,14 @@ Saturday and Sunday, and holidays are automatically detected for Tanzania.
 """
 
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import Collection, Optional
 
 from app.config.holidays import is_holiday
 
 
 def is_working_day(
     check_date: date, 
-    holidays: Optional[List[date]] = None,
+    holidays: Optional[Collection[date]] = None,
 ) -> bool:
     """
     Check if a date is a working day (not weekend or holiday) in Tanzania.
@@ -46,7 +46,7 @@ def is_working_day(
 
 def get_nearest_previous_working_day(
     target_date: date, 
-    holidays: Optional[List[date]] = None,
+    holidays: Optional[Collection[date]] = None,
 ) -> date:
     """
     Get the nearest previous working day from a target date in Tanzania.
@@ -62,6 +62,9 @@ def get_nearest_previous_working_day(
         The nearest previous working day
     """
     current = target_date
+    if holidays is not None:
+        # Each step checks membership; hash the custom list once per walk
+        holidays = frozenset(holidays)
 
     # Move backward until we find a working day
     max_iterations = 365  # Safety limit to prevent infinite loop
@@ -76,7 +79,7 @@ def get_nearest_previous_working_day(
 
 def get_nearest_next_working_day(
     target_date: date, 
-    holidays: Optional[List[date]] = None,
+    holidays: Optional[Collection[date]] = None,
 ) -> date:
     """
     Get the nearest next working day from a target date in Tanzania.
@@ -92,6 +95,9 @@ def get_nearest_next_working_day(
         The nearest next working day
     """
     current = target_date
+    if holidays is not None:
+        # Each step checks membership; hash the custom list once per walk
+        holidays = frozenset(holidays)
 
     # Move forward until we find a working day
     max_iterations = 365  # Safety limit to prevent infinite loop
@@ -107,7 +113,7 @@ def get_nearest_next_working_day(
 def adjust_target_date_to_working_day(
     target_date: date, 
     prefer: str = "previous", 
-    holidays: Optional[List[date]] = None,
+    holidays: Optional[Collection[date]] = None,
 ) -> date:
     """
     Adjust a target date to the nearest working day in Tanzania.
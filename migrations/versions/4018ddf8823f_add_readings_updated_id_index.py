@@ -0,0 +1,26 @@
+"""add_readings_updated_id_index
+
+Composite index backing keyset pagination of /mobile/updates readings.
+
+Revision ID: 4018ddf8823f
+Revises: 6d373cad96ad
+Create Date: 2026-10-16 20:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4018ddf8823f'
+down_revision = '6d373cad96ad'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_readings_updated_id', 'readings', ['updated_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_readings_updated_id', table_name='readings')
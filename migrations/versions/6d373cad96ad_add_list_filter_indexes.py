@@ -0,0 +1,39 @@
+"""add_list_filter_indexes
+
+Composite indexes for the filtered list routes (filter column + sort column)
+and for the cycle date-range lookup.
+
+Revision ID: 6d373cad96ad
+Revises: c5bfaead4c30
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6d373cad96ad'
+down_revision = 'c5bfaead4c30'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_ledger_entries_assignment_created", "ledger_entries", ["meter_assignment_id", "created_at"]),
+    ("ix_ledger_entries_cycle_created", "ledger_entries", ["cycle_id", "created_at"]),
+    ("ix_payments_assignment_received", "payments", ["meter_assignment_id", "received_at"]),
+    ("ix_payments_client_received", "payments", ["client_id", "received_at"]),
+    ("ix_penalties_assignment_created", "penalties", ["meter_assignment_id", "created_at"]),
+    ("ix_cycles_date_range", "cycles", ["start_date", "end_date"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
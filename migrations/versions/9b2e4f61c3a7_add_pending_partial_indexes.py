@@ -0,0 +1,45 @@
+"""add_pending_partial_indexes
+
+Partial indexes for the review and send queues: unapproved readings,
+pending SMS and SMS due for retry.
+
+Revision ID: 9b2e4f61c3a7
+Revises: 4018ddf8823f
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b2e4f61c3a7'
+down_revision = '4018ddf8823f'
+branch_labels = None
+depends_on = None
+
+
+READINGS_PENDING = sa.text("approved = false")
+SMS_PENDING = sa.text("status = 'PENDING'")
+SMS_RETRY = sa.text("status IN ('PENDING', 'FAILED') AND retry_count < max_retries")
+
+
+def upgrade():
+    op.create_index(
+        'ix_readings_pending', 'readings', ['submitted_at'],
+        postgresql_where=READINGS_PENDING, sqlite_where=READINGS_PENDING,
+    )
+    op.create_index(
+        'ix_sms_pending', 'sms_messages', ['id'],
+        postgresql_where=SMS_PENDING, sqlite_where=SMS_PENDING,
+    )
+    op.create_index(
+        'ix_sms_retry', 'sms_messages', ['next_retry_at'],
+        postgresql_where=SMS_RETRY, sqlite_where=SMS_RETRY,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_sms_retry', table_name='sms_messages')
+    op.drop_index('ix_sms_pending', table_name='sms_messages')
+    op.drop_index('ix_readings_pending', table_name='readings')
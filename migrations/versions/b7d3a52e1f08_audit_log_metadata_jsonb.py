@@ -0,0 +1,44 @@
+"""audit_log_metadata_jsonb
+
+Store audit_logs.metadata as JSONB on PostgreSQL instead of JSON text.
+
+Revision ID: b7d3a52e1f08
+Revises: 9b2e4f61c3a7
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3a52e1f08'
+down_revision = '9b2e4f61c3a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite keeps JSON as text, so only PostgreSQL needs the type change
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'audit_logs', 'metadata',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='metadata::jsonb',
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'audit_logs', 'metadata',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='metadata::text',
+    )
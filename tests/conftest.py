@@ -0,0 +1,59 @@
+"""
+Shared fixtures: a throwaway SQLite database per test and an app client bound to it.
+
+Every ResponseCache starts and ends each test empty.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.responses import clear_all_response_caches
+from app.main import app
+from app.db.base import Base
+from app.db.deps import get_db
+
+
+@pytest.fixture(autouse=True)
+def empty_response_caches():
+    """Start and end each test with every response cache empty"""
+    clear_all_response_caches()
+    yield
+    clear_all_response_caches()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine for a fresh SQLite file under tmp_path, with every table created"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def client(session_factory):
+    """Client whose get_db uses session_factory; restores overrides afterwards"""
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    if previous is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous
@@ -0,0 +1,60 @@
+"""
+Tests for shared response helpers.
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.api.responses import (
+    ResponseCache,
+    adapter_json_response,
+    clear_response_caches,
+)
+from app.schemas.auth import CollectorListResponse
+
+
+def test_adapter_json_response_reads_orm_attributes():
+    rows = [
+        SimpleNamespace(
+            id=i, name=f"c{i}", is_active=True, created_at=datetime(2024, 1, 1)
+        )
+        for i in range(3)
+    ]
+    adapter = TypeAdapter(CollectorListResponse)
+
+    response = adapter_json_response(adapter, {"total": len(rows), "collectors": rows})
+
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert body["total"] == 3
+    assert [c["name"] for c in body["collectors"]] == ["c0", "c1", "c2"]
+    assert body["collectors"][0]["created_at"] == "2024-01-01T00:00:00"
+    assert body["collectors"][0]["plain_password"] is None
+
+
+def test_clear_response_caches_clears_only_the_named_topics():
+    calls = []
+    widgets = ResponseCache(ttl_seconds=60, topic="test-widgets")
+    gadgets = ResponseCache(ttl_seconds=60, topic="test-gadgets")
+
+    @widgets
+    def list_widgets():
+        calls.append("widgets")
+        return Response(content=b"[]", media_type="application/json")
+
+    @gadgets
+    def list_gadgets():
+        calls.append("gadgets")
+        return Response(content=b"[]", media_type="application/json")
+
+    list_widgets()
+    list_gadgets()
+    clear_response_caches("test-widgets")
+    list_widgets()
+    list_gadgets()
+
+    assert calls == ["widgets", "gadgets", "widgets"]
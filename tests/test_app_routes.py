@@ -0,0 +1,29 @@
+"""
+Application route table tests.
+"""
+
+import warnings
+
+from fastapi.openapi.utils import get_openapi
+
+from app.main import app
+
+
+def test_no_route_is_registered_twice():
+    """A handler included twice shows up as a duplicate operation ID"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        spec = get_openapi(title=app.title, version=app.version, routes=app.routes)
+
+    assert spec["paths"]
+    duplicates = [w for w in caught if "Duplicate Operation ID" in str(w.message)]
+    assert duplicates == []
+
+
+def test_route_table_registers_every_router():
+    paths = set(app.openapi()["paths"])
+
+    assert "/api/v1/sms/bulk" in paths
+    assert any(path.startswith("/api/v1/auth/") for path in paths)
+    assert any(path.startswith("/api/v1/admin/") for path in paths)
+    assert len(paths) > 2
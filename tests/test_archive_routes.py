@@ -0,0 +1,93 @@
+"""
+Archive route tests.
+"""
+
+from datetime import date
+
+from app.api.routes import archive
+from app.models.cycle import Cycle
+
+
+def test_statistics_etag_round_trip(client):
+    response = client.get("/api/v1/archive/statistics")
+    assert response.status_code == 200
+    assert response.json()["total_cycles"] == 0
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "max-age=60"
+
+    response = client.get(
+        "/api/v1/archive/statistics", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_statistics_served_from_cache_until_invalidated(client, monkeypatch):
+    calls = []
+    real = archive.ArchiveService.get_archive_statistics
+
+    def counting(self):
+        calls.append(1)
+        return real(self)
+
+    monkeypatch.setattr(archive.ArchiveService, "get_archive_statistics", counting)
+    client.get("/api/v1/archive/statistics")
+    client.get("/api/v1/archive/statistics")
+    assert len(calls) == 1
+
+    client.post("/api/v1/archive/archive-old?dry_run=false")
+    client.get("/api/v1/archive/statistics")
+    assert len(calls) == 2
+
+
+def test_statistics_etag_matches_weak_list_and_wildcard(client):
+    etag = client.get("/api/v1/archive/statistics").headers["etag"]
+    for if_none_match in (f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get(
+            "/api/v1/archive/statistics", headers={"If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "max-age=60"
+
+
+def test_statistics_cleared_by_cycle_writes(client):
+    assert client.get("/api/v1/archive/statistics").json()["total_cycles"] == 0
+    response = client.post(
+        "/api/v1/cycles/",
+        json={
+            "start_date": "2026-03-01",
+            "end_date": "2026-03-28",
+            "target_date": "2026-03-25",
+            "status": "CLOSED",
+        },
+    )
+    assert response.status_code == 201
+    assert client.get("/api/v1/archive/statistics").json()["total_cycles"] == 1
+
+
+def test_eligible_cycles_streams_json(client, session_factory):
+    db = session_factory()
+    for i, status in enumerate(["CLOSED", "ARCHIVED", "OPEN"]):
+        db.add(
+            Cycle(
+                start_date=date(2015, i + 1, 1),
+                end_date=date(2015, i + 1, 28),
+                target_date=date(2015, i + 1, 25),
+                status=status,
+            )
+        )
+    db.commit()
+    db.close()
+
+    response = client.get("/api/v1/archive/eligible-cycles?cutoff_months=36")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["cutoff_months"] == 36
+    assert body["eligible_count"] == 2
+    assert {c["status"] for c in body["cycles"]} == {"CLOSED", "ARCHIVED"}
+    assert body["cycles"][0]["start_date"].startswith("2015-")
+
+
+def test_eligible_cycles_empty(client):
+    body = client.get("/api/v1/archive/eligible-cycles").json()
+    assert body == {"cutoff_months": 36, "cycles": [], "eligible_count": 0}
@@ -0,0 +1,111 @@
+"""
+Tests for the audit log decorator and its batching writer.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.core import audit_decorator
+from app.core.audit_decorator import AuditLogWriter, audit_log
+from app.models.audit_log import AuditAction, AuditLog
+
+
+@pytest.fixture
+def writer(session_factory, monkeypatch):
+    """A writer bound to a fresh database, installed as the process writer"""
+    writer = AuditLogWriter(session_factory=session_factory)
+    monkeypatch.setattr(AuditLogWriter, "_instance", writer)
+    yield writer
+    writer.flush()
+
+
+def test_decorated_calls_are_written_in_batches(writer, monkeypatch, session_factory):
+    monkeypatch.setattr(audit_decorator, "AUDIT_BATCH_SIZE", 10)
+
+    @audit_log(
+        action=AuditAction.READING_APPROVED,
+        entity_type="reading",
+        description_template="Approved reading {reading_id}",
+        get_metadata=lambda result: {"ok": result},
+    )
+    def approve(reading_id: int, admin_username: str):
+        return True
+
+    for reading_id in range(1, 26):
+        assert approve(reading_id=reading_id, admin_username="admin") is True
+    writer.flush()
+
+    db = session_factory()
+    logs = db.query(AuditLog).order_by(AuditLog.entity_id).all()
+    db.close()
+    assert [log.entity_id for log in logs] == list(range(1, 26))
+    assert logs[0].description == "Approved reading 1"
+    assert logs[0].admin_username == "admin"
+    assert logs[0].metadata_json == {"ok": True}
+
+
+def test_description_falls_back_when_template_arguments_are_missing(
+    writer, session_factory
+):
+    @audit_log(
+        action=AuditAction.READING_APPROVED,
+        entity_type="reading",
+        description_template="Approved reading {reading_id} for meter {meter_id}",
+    )
+    def approve(reading_id: int, admin_username: str):
+        return None
+
+    approve(reading_id=7, admin_username="admin")
+    writer.flush()
+
+    db = session_factory()
+    log = db.query(AuditLog).one()
+    db.close()
+    assert log.description == "READING_APPROVED on reading 7"
+
+
+def test_async_functions_are_audited(writer, session_factory):
+    @audit_log(action=AuditAction.READING_APPROVED, entity_type="reading")
+    async def approve(reading_id: int, admin_username: str):
+        return reading_id
+
+    assert asyncio.run(approve(reading_id=3, admin_username="admin")) == 3
+    writer.flush()
+
+    db = session_factory()
+    assert [log.entity_id for log in db.query(AuditLog)] == [3]
+    db.close()
+
+
+def test_failed_batch_is_retried_row_by_row(writer, session_factory, caplog):
+    def row(entity_id, description):
+        return {
+            "admin_username": "admin",
+            "action": AuditAction.READING_APPROVED,
+            "entity_type": "reading",
+            "entity_id": entity_id,
+            "description": description,
+            "metadata": None,
+            "timestamp": datetime.utcnow(),
+        }
+
+    # The NULL description fails the batch INSERT; the other rows still land
+    writer._write([row(1, "ok"), row(2, None), row(3, "ok")])
+
+    db = session_factory()
+    ids = [log.entity_id for log in db.query(AuditLog).order_by(AuditLog.id)]
+    assert ids == [1, 3]
+    db.close()
+    assert "Failed to write audit log entry" in caplog.text
+
+
+def test_disabled_auditing_leaves_functions_unwrapped(monkeypatch):
+    monkeypatch.setattr(audit_decorator.settings, "audit_enabled", False)
+
+    def approve(reading_id: int):
+        return reading_id
+
+    decorated = audit_log(action=AuditAction.READING_APPROVED, entity_type="reading")
+    assert decorated(approve) is approve
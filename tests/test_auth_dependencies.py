@@ -0,0 +1,213 @@
+"""
+Tests for shared auth dependencies (admin lookup and token caching).
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import dependencies
+from app.api.dependencies import (
+    get_current_admin,
+    get_current_admin_claims,
+    invalidate_admin_cache,
+)
+from app.core.mobile_auth import require_mobile_auth
+from app.models.auth import AdminUser
+from app.services import auth_service
+from app.services.auth_service import (
+    clear_token_cache,
+    create_access_token,
+    decode_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start and end each test with empty admin and token caches"""
+    invalidate_admin_cache()
+    clear_token_cache()
+    yield
+    invalidate_admin_cache()
+    clear_token_cache()
+
+
+@pytest.fixture
+def admin(session_factory):
+    db = session_factory()
+    admin = AdminUser(
+        username="admin1",
+        password_hash="x",
+        company_name="AquaCo",
+        company_phone="+255712345678",
+        role_at_company="Manager",
+        estimated_clients=10,
+    )
+    db.add(admin)
+    db.commit()
+    db.refresh(admin)
+    db.close()
+    return admin
+
+
+def _resolve(token: str, db):
+    return get_current_admin(authorization=f"Bearer {token}", db=db)
+
+
+def test_admin_lookup_is_cached(admin, session_factory):
+    token = create_access_token(
+        {"admin_id": admin.id, "username": admin.username, "type": "admin"}
+    )
+    db = session_factory()
+    first = _resolve(token, db)
+    assert first.id == admin.id
+    assert first.company_name == "AquaCo"
+
+    # Remove the row: a cached lookup must not hit the database again
+    db.query(AdminUser).delete()
+    db.commit()
+    second = _resolve(token, db)
+    assert second == first
+
+    # After invalidation the missing row is noticed
+    invalidate_admin_cache(admin.id)
+    with pytest.raises(HTTPException) as exc:
+        _resolve(token, db)
+    assert exc.value.status_code == 401
+    db.close()
+
+
+def test_admin_changes_through_the_orm_drop_the_cached_admin(admin, session_factory):
+    token = create_access_token(
+        {"admin_id": admin.id, "username": admin.username, "type": "admin"}
+    )
+    db = session_factory()
+    assert _resolve(token, db).company_name == "AquaCo"
+
+    row = db.get(AdminUser, admin.id)
+    row.company_name = "AquaCo Ltd"
+    db.commit()
+    assert _resolve(token, db).company_name == "AquaCo Ltd"
+
+    # Deleting the admin revokes its token on the next request
+    db.delete(row)
+    db.commit()
+    with pytest.raises(HTTPException) as exc:
+        _resolve(token, db)
+    assert exc.value.status_code == 401
+    db.close()
+
+
+def test_expired_cache_entry_is_reloaded(admin, session_factory, monkeypatch):
+    token = create_access_token(
+        {"admin_id": admin.id, "username": admin.username, "type": "admin"}
+    )
+    db = session_factory()
+    _resolve(token, db)
+    monkeypatch.setattr(dependencies, "ADMIN_CACHE_TTL_SECONDS", -1.0)
+    invalidate_admin_cache()
+    _resolve(token, db)
+
+    db.query(AdminUser).delete()
+    db.commit()
+    with pytest.raises(HTTPException):
+        _resolve(token, db)
+    db.close()
+
+
+def test_admin_claims_are_checked_against_the_cached_admin(admin, session_factory):
+    token = create_access_token(
+        {"admin_id": admin.id, "username": "from-token", "type": "admin"}
+    )
+    db = session_factory()
+    claims = get_current_admin_claims(authorization=f"Bearer {token}", db=db)
+    assert claims.id == admin.id
+    assert claims.username == "from-token"
+
+    # A cached admin is not queried again
+    db.query(AdminUser).delete()
+    db.commit()
+    assert get_current_admin_claims(authorization=f"Bearer {token}", db=db) == claims
+
+    # Once its entry is dropped, a deleted admin's token stops working
+    invalidate_admin_cache(admin.id)
+    with pytest.raises(HTTPException) as exc:
+        get_current_admin_claims(authorization=f"Bearer {token}", db=db)
+    assert exc.value.status_code == 401
+    db.close()
+
+
+def test_admin_claims_reject_collector_token(session_factory):
+    token = create_access_token(
+        {"collector_id": 1, "admin_id": 42, "name": "c", "type": "collector"}
+    )
+    db = session_factory()
+    with pytest.raises(HTTPException) as exc:
+        get_current_admin_claims(authorization=f"Bearer {token}", db=db)
+    assert exc.value.status_code == 401
+    db.close()
+
+
+def test_verified_token_is_cached(monkeypatch):
+    token = create_access_token({"admin_id": 7, "type": "admin"})
+    calls = []
+    real_decode = auth_service.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth_service.jwt, "decode", counting_decode)
+    assert decode_token(token)["admin_id"] == 7
+    assert decode_token(token)["admin_id"] == 7
+    assert len(calls) == 1
+
+    assert decode_token(token + "x") is None
+    assert len(calls) == 2
+
+
+def test_token_cache_hands_out_copies():
+    token = create_access_token({"admin_id": 7, "type": "admin"})
+    decode_token(token)["admin_id"] = 99
+    assert decode_token(token)["admin_id"] == 7
+
+
+def test_token_cache_respects_expiry():
+    token = create_access_token(
+        {"admin_id": 7, "type": "admin"}, expires_delta=timedelta(seconds=-1)
+    )
+    assert decode_token(token) is None
+    assert decode_token(token) is None
+
+
+class _HeaderRequest:
+    """Just enough of a Request for require_mobile_auth"""
+
+    def __init__(self, authorization):
+        self.headers = {"Authorization": authorization} if authorization else {}
+
+
+@pytest.mark.parametrize(
+    "header, token",
+    [
+        ("Bearer abc123", "abc123"),
+        ("bearer abc123", "abc123"),
+        ("Bearer  abc", "abc"),
+        (" Bearer abc", "abc"),
+        ("Bearer\tabc", "abc"),
+        ("Bearer abc ", "abc"),
+    ],
+)
+def test_mobile_auth_accepts_bearer_tokens(header, token):
+    assert asyncio.run(require_mobile_auth(_HeaderRequest(header))) == token
+
+
+@pytest.mark.parametrize(
+    "header", [None, "Bearer", "Bearer ", "Basic abc", "Bearer a b", "Bearer a\tb"]
+)
+def test_mobile_auth_rejects_malformed_headers(header):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(require_mobile_auth(_HeaderRequest(header)))
+    assert exc.value.status_code == 401
@@ -0,0 +1,100 @@
+"""
+Admin and collector authentication route tests.
+"""
+
+from app.models.auth import AdminUser
+
+
+REGISTER_PAYLOAD = {
+    "username": "admin1",
+    "password": "secret123",
+    "confirm_password": "secret123",
+    "company_name": "AquaCo",
+    "company_phone": "+255712345678",
+    "role_at_company": "Manager",
+    "estimated_clients": 10,
+}
+
+
+def test_register_then_login_admin(client):
+    response = client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD)
+    assert response.status_code == 200
+    user_id = response.json()["user_id"]
+
+    response = client.post(
+        "/api/v1/auth/admin/login",
+        json={"username": "admin1", "password": "secret123"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user_id"] == user_id
+    assert body["company_name"] == "AquaCo"
+
+    response = client.post(
+        "/api/v1/auth/admin/login",
+        json={"username": "admin1", "password": "wrong-pass"},
+    )
+    assert response.status_code == 401
+
+
+def test_register_duplicate_username_rejected(client):
+    assert (
+        client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD).status_code
+        == 200
+    )
+    response = client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username already exists"
+
+
+def test_collector_login(client):
+    token = client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD).json()[
+        "token"
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        "/api/v1/admin/collectors",
+        json={"name": "collector1", "password": "pass1234"},
+        headers=headers,
+    )
+    assert created.status_code == 200
+
+    response = client.post(
+        "/api/v1/auth/collector/login",
+        json={"name": "collector1", "password": "pass1234"},
+    )
+    assert response.status_code == 200
+    assert response.json()["collector_id"] == created.json()["id"]
+
+
+def test_list_collectors_paginates_with_full_total(client):
+    token = client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD).json()[
+        "token"
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    for i in range(3):
+        client.post(
+            "/api/v1/admin/collectors",
+            json={"name": f"collector{i}", "password": "pass1234"},
+            headers=headers,
+        )
+
+    response = client.get("/api/v1/admin/collectors?skip=1&limit=1", headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3
+    assert [c["name"] for c in body["collectors"]] == ["collector1"]
+
+
+def test_deleted_admin_token_is_rejected(client, session_factory):
+    body = client.post("/api/v1/auth/admin/register", json=REGISTER_PAYLOAD).json()
+    headers = {"Authorization": f"Bearer {body['token']}"}
+    assert client.get("/api/v1/admin/collectors", headers=headers).status_code == 200
+
+    db = session_factory()
+    db.delete(db.get(AdminUser, body["user_id"]))
+    db.commit()
+    db.close()
+
+    response = client.get("/api/v1/admin/collectors", headers=headers)
+    assert response.status_code == 401
@@ -0,0 +1,301 @@
+"""
+Cycle route tests.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from app.models.client import Client
+from app.models.cycle import Cycle
+from app.models.meter import Meter
+from app.models.meter_assignment import MeterAssignment
+from app.models.reading import Reading
+from app.repositories.cycle import CycleRepository
+from app.services.cycle_service import CycleService, _ranges_overlap
+
+
+def _add_cycle(session_factory, month: int, status: str = "OPEN") -> None:
+    db = session_factory()
+    db.add(
+        Cycle(
+            start_date=date(2026, month, 1),
+            end_date=date(2026, month, 28),
+            target_date=date(2026, month, 25),
+            status=status,
+        )
+    )
+    db.commit()
+    db.close()
+
+
+def test_cycle_list_is_cached_until_mutation(client, session_factory):
+    _add_cycle(session_factory, 1)
+    assert len(client.get("/api/v1/cycles/").json()) == 1
+
+    # A write that bypasses the routes is not seen while the entry is fresh
+    _add_cycle(session_factory, 2, status="CLOSED")
+    assert len(client.get("/api/v1/cycles/").json()) == 1
+
+    response = client.post(
+        "/api/v1/cycles/",
+        json={
+            "start_date": "2026-03-01",
+            "end_date": "2026-03-28",
+            "target_date": "2026-03-25",
+            "status": "CLOSED",
+        },
+    )
+    assert response.status_code == 201
+    assert len(client.get("/api/v1/cycles/").json()) == 3
+
+
+def test_open_cycle_not_found_is_not_cached(client, session_factory):
+    assert client.get("/api/v1/cycles/open/current").status_code == 404
+    _add_cycle(session_factory, 1)
+    response = client.get("/api/v1/cycles/open/current")
+    assert response.status_code == 200
+    assert response.json()["start_date"] == "2026-01-01"
+
+
+def test_get_cycle_by_id(client, session_factory):
+    _add_cycle(session_factory, 1)
+    body = client.get("/api/v1/cycles/1").json()
+    assert body["id"] == 1
+    assert body["target_date"] == "2026-01-25"
+    assert client.get("/api/v1/cycles/99").status_code == 404
+
+
+def test_cycles_by_status_are_paginated_newest_first(client, session_factory):
+    for month in (1, 2, 3):
+        _add_cycle(session_factory, month, status="CLOSED")
+
+    page = client.get("/api/v1/cycles/status/CLOSED?skip=1&limit=1").json()
+    assert [c["start_date"] for c in page] == ["2026-02-01"]
+
+
+def _seed_approved_readings(session_factory, count: int) -> int:
+    db = session_factory()
+    cycle = Cycle(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 28),
+        target_date=date(2026, 1, 25),
+        status="PENDING_REVIEW",
+    )
+    db.add(cycle)
+    db.flush()
+    for i in range(1, count + 1):
+        serial = f"MTR-{i:03d}"
+        db.add(
+            Client(
+                id=i,
+                first_name="Client",
+                surname=str(i),
+                phone_number=f"+2557123456{i:02d}",
+                meter_serial_number=serial,
+                initial_meter_reading=Decimal("0"),
+            )
+        )
+        db.add(Meter(id=i, serial_number=serial))
+        db.add(
+            MeterAssignment(id=i, meter_id=i, client_id=i, start_date=date(2025, 1, 1))
+        )
+        db.add(
+            Reading(
+                meter_assignment_id=i,
+                cycle_id=cycle.id,
+                absolute_value=Decimal("110"),
+                consumption=Decimal("10"),
+                type="NORMAL",
+                submitted_by="collector",
+                approved=True,
+                approved_at=datetime(2026, 1, 26),
+                approved_by="admin",
+            )
+        )
+    db.commit()
+    cycle_id = cycle.id
+    db.close()
+    return cycle_id
+
+
+def _count_queries(engine, callback) -> int:
+    """Count non-INSERT statements (INSERT batching is dialect-dependent)"""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        callback()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return sum(1 for s in statements if not s.lstrip().startswith("INSERT"))
+
+
+@pytest.mark.parametrize("assignments", [2, 8])
+def test_generate_charges_query_count_is_constant(
+    client, session_factory, engine, assignments
+):
+    cycle_id = _seed_approved_readings(session_factory, assignments)
+    url = f"/api/v1/cycles/{cycle_id}/charges?rate_per_m3=1500"
+    results = []
+
+    def post():
+        results.append(client.post(url))
+
+    queries = _count_queries(engine, post)
+    body = results[0].json()
+    assert body["created_count"] == assignments
+    assert len(body["entry_ids"]) == assignments
+    # cycle, consumption totals, existing charges; the INSERT returns the rows
+    assert queries == 3
+
+    repeat = client.post(url).json()
+    assert repeat["created_count"] == 0
+    assert repeat["skipped_existing"] == assignments
+
+
+def test_get_cycle_honours_if_none_match(client, session_factory):
+    _add_cycle(session_factory, 1)
+    first = client.get("/api/v1/cycles/1")
+    etag = first.headers["etag"]
+
+    response = client.get("/api/v1/cycles/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    transition = client.post(
+        "/api/v1/cycles/1/transition", json={"status": "PENDING_REVIEW"}
+    )
+    assert transition.status_code == 200
+    response = client.get("/api/v1/cycles/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_auto_transition_overdue_updates_only_past_deadline(client, session_factory):
+    _add_cycle(session_factory, 1)
+    db = session_factory()
+    db.add(
+        Cycle(
+            start_date=date(2999, 1, 1),
+            end_date=date(2999, 1, 28),
+            target_date=date(2999, 1, 25),
+            status="OPEN",
+        )
+    )
+    db.commit()
+    db.close()
+
+    body = client.post("/api/v1/cycles/auto-transition/overdue").json()
+    assert body["updated_count"] == 1
+    assert body["updated_ids"] == [1]
+    assert client.get("/api/v1/cycles/1").json()["status"] == "PENDING_REVIEW"
+    assert client.get("/api/v1/cycles/2").json()["status"] == "OPEN"
+
+    body = client.post("/api/v1/cycles/auto-transition/overdue").json()
+    assert body["updated_count"] == 0
+
+
+def test_partially_scheduled_cycles_clear_the_cache(client):
+    assert client.get("/api/v1/cycles/").json() == []
+
+    # Cycle 1 is created OPEN; cycle 2 is rejected by the one-OPEN rule
+    response = client.post(
+        "/api/v1/cycles/schedule",
+        json={
+            "start_date": "2026-01-01",
+            "num_cycles": 2,
+            "submission_window_days": 0,
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Cycle 2: Cycle 1 is already OPEN")
+
+    listed = client.get("/api/v1/cycles/").json()
+    assert [c["start_date"] for c in listed] == ["2026-01-01"]
+
+
+def _schedule(session_factory, start: date, num_cycles: int, length: int = 28):
+    db = session_factory()
+    try:
+        cycles, error = CycleService(db).schedule_cycles(
+            start,
+            num_cycles,
+            cycle_length_days=length,
+            submission_window_days=0,
+            adjust_to_working_day=False,
+        )
+        return [(c.start_date, c.end_date, c.status) for c in cycles], error
+    finally:
+        db.close()
+
+
+def _create_error(session_factory, start: date, end: date) -> str:
+    db = session_factory()
+    try:
+        cycle, error = CycleService(db).create_cycle(start, end, end)
+        assert cycle is None
+        return error
+    finally:
+        db.close()
+
+
+def test_schedule_rejects_cycles_overlapping_an_existing_one(session_factory):
+    _add_cycle(session_factory, 2, status="CLOSED")
+
+    # Jan 1-28 fits; Jan 29 - Feb 25 runs into cycle 1 (Feb 1-28)
+    cycles, error = _schedule(session_factory, date(2026, 1, 1), 2)
+    assert cycles == [(date(2026, 1, 1), date(2026, 1, 28), "OPEN")]
+    expected = _create_error(session_factory, date(2026, 1, 29), date(2026, 2, 25))
+    assert expected.startswith("Date range overlaps")
+    assert error == f"Cycle 2: {expected}"
+
+
+def test_schedule_opens_only_the_first_cycle(session_factory):
+    cycles, error = _schedule(session_factory, date(2026, 1, 1), 3)
+    assert [c[0] for c in cycles] == [date(2026, 1, 1)]
+    expected = _create_error(session_factory, date(2026, 3, 1), date(2026, 3, 28))
+    assert expected == "Cycle 1 is already OPEN. Close it before opening a new cycle."
+    assert error == f"Cycle 2: {expected} | Cycle 3: {expected}"
+
+
+def test_schedule_is_blocked_by_an_already_open_cycle(session_factory):
+    _add_cycle(session_factory, 6)
+    cycles, error = _schedule(session_factory, date(2026, 1, 1), 1)
+    assert cycles == []
+    expected = _create_error(session_factory, date(2026, 1, 1), date(2026, 1, 28))
+    assert error == f"Cycle 1: {expected}"
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date(2026, 1, 1), date(2026, 2, 1)),  # ends on the existing start
+        (date(2026, 2, 28), date(2026, 3, 15)),  # starts on the existing end
+        (date(2026, 1, 1), date(2026, 1, 31)),  # ends the day before
+        (date(2026, 3, 1), date(2026, 3, 31)),  # starts the day after
+        (date(2026, 2, 1), date(2026, 2, 28)),  # identical
+        (date(2026, 2, 1), date(2026, 2, 10)),  # shares the start
+        (date(2026, 2, 20), date(2026, 2, 28)),  # shares the end
+        (date(2026, 2, 5), date(2026, 2, 10)),  # strictly inside
+        (date(2026, 1, 15), date(2026, 3, 15)),  # strictly around
+        (date(2026, 1, 15), date(2026, 2, 15)),  # straddles the start
+        (date(2026, 2, 15), date(2026, 3, 15)),  # straddles the end
+        (date(2026, 2, 10), date(2026, 2, 10)),  # single day inside
+    ],
+)
+def test_ranges_overlap_matches_get_overlapping(session_factory, start, end):
+    _add_cycle(session_factory, 2, status="CLOSED")
+    db = session_factory()
+    try:
+        existing = db.get(Cycle, 1)
+        in_sql = bool(CycleRepository(db).get_overlapping(start, end))
+        in_python = _ranges_overlap(existing.start_date, existing.end_date, start, end)
+    finally:
+        db.close()
+    assert in_python == in_sql
@@ -0,0 +1,130 @@
+"""
+Export route tests.
+"""
+
+import csv
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from app.models.client import Client
+from app.models.cycle import Cycle, CycleStatus
+from app.models.meter import Meter
+from app.models.meter_assignment import MeterAssignment, AssignmentStatus
+from app.models.reading import Reading, ReadingType
+from app.api.routes import exports
+from app.services import export_service
+
+
+def _seed_readings(session_factory, count: int) -> int:
+    db = session_factory()
+    db.add(
+        Client(
+            id=1,
+            first_name="John",
+            surname="Doe",
+            phone_number="+255712345678",
+            meter_serial_number="MTR-001",
+            initial_meter_reading=Decimal("1000.0000"),
+        )
+    )
+    db.add(Meter(id=1, serial_number="MTR-001"))
+    db.add(
+        MeterAssignment(
+            id=1,
+            meter_id=1,
+            client_id=1,
+            start_date=date.today() - timedelta(days=365),
+            status=AssignmentStatus.ACTIVE,
+        )
+    )
+    cycle = Cycle(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 31),
+        target_date=date(2026, 1, 25),
+        status=CycleStatus.OPEN.value,
+    )
+    db.add(cycle)
+    db.flush()
+    for i in range(count):
+        db.add(
+            Reading(
+                meter_assignment_id=1,
+                cycle_id=cycle.id,
+                absolute_value=Decimal(1000 + 10 * i),
+                consumption=Decimal(10) if i else None,
+                type=(ReadingType.NORMAL if i else ReadingType.BASELINE).value,
+                submitted_by="collector",
+                submitted_at=datetime(2026, 1, 2) + timedelta(minutes=i),
+            )
+        )
+    db.commit()
+    cycle_id = cycle.id
+    db.close()
+    return cycle_id
+
+
+def test_cycle_readings_export_streams_all_rows(client, monkeypatch, session_factory):
+    monkeypatch.setattr(export_service, "CSV_CHUNK_ROWS", 2)
+    cycle_id = _seed_readings(session_factory, 5)
+
+    response = client.get(
+        f"/api/v1/exports/cycle/{cycle_id}/readings",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-encoding"] == "gzip"
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][0] == "Reading ID"
+    assert len(rows) == 6
+    assert rows[1][4] == "1000.0000"
+    assert rows[1][5] == ""
+    assert rows[2][5] == "1000.0000"
+    assert rows[2][7] == ReadingType.NORMAL.value
+
+
+def test_missing_cycle_export_returns_404(client):
+    response = client.get("/api/v1/exports/cycle/999/readings")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Cycle 999 not found"
+
+
+def test_payments_export_rejects_malformed_dates(client):
+    response = client.get("/api/v1/exports/payments?start_date=2026-13-01")
+    assert response.status_code == 422
+
+
+def test_payments_export_filename_uses_date_range(client):
+    response = client.get(
+        "/api/v1/exports/payments?start_date=2026-01-01&end_date=2026-01-31"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].endswith(
+        "payments_2026-01-01_to_2026-01-31.csv"
+    )
+    assert response.text.startswith("Payment ID,")
+
+
+def test_annual_ledger_background_job(client, tmp_path, monkeypatch, session_factory):
+    monkeypatch.setattr(exports, "EXPORT_JOB_DIR", tmp_path)
+    _seed_readings(session_factory, 1)
+
+    response = client.post("/api/v1/exports/annual-ledger/2026/jobs")
+    assert response.status_code == 202
+    job = response.json()
+    assert job["job_id"].startswith("2026-")
+
+    # TestClient runs background tasks before returning, so the job is done
+    response = client.get(job["status_url"])
+    assert response.status_code == 200
+    assert "ledger_2026.csv" in response.headers["content-disposition"]
+    assert response.text.startswith("Entry ID,Cycle,")
+
+
+def test_export_job_unknown_or_invalid_ids(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, "EXPORT_JOB_DIR", tmp_path)
+    assert client.post("/api/v1/exports/annual-ledger/1999/jobs").status_code == 404
+    assert client.get(f"/api/v1/exports/jobs/2026-{'0' * 32}").status_code == 404
+    assert client.get("/api/v1/exports/jobs/..%2Fetc").status_code == 404
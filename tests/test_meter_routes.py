@@ -0,0 +1,22 @@
+"""
+Meter route tests.
+"""
+
+from app.models.meter import Meter
+
+
+def test_meter_list_is_cached_until_mutation(client, session_factory):
+    response = client.post("/api/v1/meters/", json={"serial_number": "MTR-001"})
+    assert response.status_code == 201
+    assert len(client.get("/api/v1/meters/").json()) == 1
+
+    # A write that bypasses the routes is not seen while the entry is fresh
+    db = session_factory()
+    db.add(Meter(serial_number="MTR-002"))
+    db.commit()
+    db.close()
+    assert len(client.get("/api/v1/meters/").json()) == 1
+
+    assert client.delete("/api/v1/meters/2").status_code == 204
+    meters = client.get("/api/v1/meters/").json()
+    assert [m["serial_number"] for m in meters] == ["MTR-001"]
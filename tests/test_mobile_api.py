@@ -5,52 +5,19 @@ Mobile API integration tests.
 import pytest
 from datetime import datetime, timedelta, date
 from decimal import Decimal
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from app.main import app
-from app.db.base import Base
-from app.db.deps import get_db
 from app.models.client import Client
 from app.models.meter import Meter
 from app.models.meter_assignment import MeterAssignment, AssignmentStatus
 from app.models.cycle import Cycle, CycleStatus
 from app.models.reading import Reading, ReadingType
-
-
-# Test database setup
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test_mobile.db"
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-client = TestClient(app)
-
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_database():
-    """Create tables before each test and drop after"""
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
+from app.repositories.reading import ReadingRepository
 
 
 @pytest.fixture
-def sample_data():
+def sample_data(session_factory):
     """Populate database with sample data for testing"""
-    db = TestingSessionLocal()
+    db = session_factory()
 
     # Create client
     test_client = Client(
@@ -58,6 +25,8 @@ def sample_data():
         first_name="John",
         surname="Doe",
         phone_number="+255712345678",
+        meter_serial_number="MTR-001",
+        initial_meter_reading=Decimal("1000.0000"),
     )
     db.add(test_client)
 
@@ -131,7 +100,7 @@ def sample_data():
     db.close()
 
 
-def test_bootstrap_endpoint(sample_data):
+def test_bootstrap_endpoint(sample_data, client):
     """Test bootstrap returns last 12 cycles + active assignments"""
     headers = {"Authorization": "Bearer test-collector-123"}
     response = client.get("/api/v1/mobile/bootstrap", headers=headers)
@@ -163,7 +132,7 @@ def test_bootstrap_endpoint(sample_data):
     assert len(data["meters"]) == 1
 
 
-def test_updates_endpoint(sample_data):
+def test_updates_endpoint(sample_data, client, session_factory):
     """Test incremental updates endpoint"""
     # Get initial bootstrap timestamp
     headers = {"Authorization": "Bearer test-collector-123"}
@@ -176,7 +145,7 @@ def test_updates_endpoint(sample_data):
 
     time.sleep(0.2)  # Ensure time difference
 
-    db = TestingSessionLocal()
+    db = session_factory()
     new_reading = Reading(
         id=3,
         meter_assignment_id=1,
@@ -212,7 +181,7 @@ def test_updates_endpoint(sample_data):
     assert 3 in reading_ids
 
 
-def test_mobile_reading_submission(sample_data):
+def test_mobile_reading_submission(sample_data, client):
     """Test mobile reading submission endpoint"""
     headers = {"Authorization": "Bearer test-collector-123"}
     payload = {
@@ -245,7 +214,7 @@ def test_mobile_reading_submission(sample_data):
     assert "id" in data
 
 
-def test_mobile_reading_conflict(sample_data):
+def test_mobile_reading_conflict(sample_data, client):
     """Test conflict detection on duplicate submission"""
     # First submission
     headers = {"Authorization": "Bearer test-collector-123"}
@@ -267,9 +236,187 @@ def test_mobile_reading_conflict(sample_data):
     payload["submitted_by"] = "another_collector"  # Different collector
     response2 = client.post("/api/v1/mobile/readings", json=payload, headers=headers)
 
-    # Should return 409 or 400 depending on validation
-    # (current implementation returns 400 for duplicate; we'd enhance to 409)
-    assert response2.status_code in [400, 409]
+    # 409 carries the stored reading so the app can show both side by side
+    assert response2.status_code == 409
+    conflict = response2.json()["detail"]["conflict"]
+    assert conflict["server_reading"]["id"] == response1.json()["id"]
+    assert float(conflict["server_reading"]["absolute_value"]) == 2000.0
+    assert float(conflict["local_reading"]["absolute_value"]) == 2100.0
+    assert conflict["local_reading"]["submitted_by"] == "another_collector"
+
+
+def test_mobile_reading_batch_submission(sample_data, client, session_factory):
+    """Batch submission reports a status per reading, in order"""
+    headers = {"Authorization": "Bearer test-collector-123"}
+
+    def reading(cycle_id, value):
+        return {
+            "meter_assignment_id": 1,
+            "cycle_id": cycle_id,
+            "absolute_value": value,
+            "submitted_by": "mobile_collector",
+            "submitted_at": datetime.utcnow().isoformat() + "Z",
+        }
+
+    response = client.post(
+        "/api/v1/mobile/readings/batch",
+        json=[reading(3, 2000.0), reading(3, 2100.0), reading(1, 1200.0)],
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["index"] for r in data] == [0, 1, 2]
+    assert [r["status"] for r in data] == ["PENDING", "CONFLICT", "REJECTED"]
+    assert data[1]["server_reading"]["id"] == data[0]["reading_id"]
+    assert "not OPEN" in data[2]["message"]
+
+    db = session_factory()
+    assert db.query(Reading).filter(Reading.cycle_id == 3).count() == 1
+    db.close()
+
+    # Resubmitting the queue now conflicts with the stored reading
+    response = client.post(
+        "/api/v1/mobile/readings/batch", json=[reading(3, 2000.0)], headers=headers
+    )
+    assert response.json()[0]["status"] == "CONFLICT"
+    assert response.json()[0]["server_reading"]["id"] == data[0]["reading_id"]
+
+
+def test_mobile_reading_batch_guards_the_insert(
+    sample_data, client, session_factory, monkeypatch
+):
+    """A reading stored after the duplicate check is a CONFLICT, not a copy"""
+    db = session_factory()
+    stored = Reading(
+        meter_assignment_id=1,
+        cycle_id=3,
+        absolute_value=1900,
+        type="NORMAL",
+        submitted_by="web",
+    )
+    db.add(stored)
+    db.commit()
+    stored_id = stored.id
+    db.close()
+
+    # The up-front check misses it, as if it were committed just afterwards
+    real_lookup = ReadingRepository.get_by_assignments_and_cycles
+    lookups = []
+
+    def stale_first_lookup(self, pairs):
+        lookups.append(1)
+        return {} if len(lookups) == 1 else real_lookup(self, pairs)
+
+    monkeypatch.setattr(
+        ReadingRepository, "get_by_assignments_and_cycles", stale_first_lookup
+    )
+    response = client.post(
+        "/api/v1/mobile/readings/batch",
+        json=[
+            {
+                "meter_assignment_id": 1,
+                "cycle_id": 3,
+                "absolute_value": value,
+                "submitted_by": "mobile_collector",
+                "submitted_at": datetime.utcnow().isoformat() + "Z",
+            }
+            for value in (2000.0, 2100.0)
+        ],
+        headers={"Authorization": "Bearer test-collector-123"},
+    )
+
+    data = response.json()
+    assert [r["status"] for r in data] == ["CONFLICT", "CONFLICT"]
+    assert [r["server_reading"]["id"] for r in data] == [stored_id, stored_id]
+    db = session_factory()
+    assert db.query(Reading).filter(Reading.cycle_id == 3).count() == 1
+    db.close()
+
+
+
+def test_updates_paged_by_cursor(client, session_factory):
+    """Paged /updates walks readings in (updated_at, id) order"""
+    db = session_factory()
+    db.add(
+        Client(
+            id=1,
+            first_name="John",
+            surname="Doe",
+            phone_number="+255712345678",
+            meter_serial_number="MTR-001",
+            initial_meter_reading=Decimal("0"),
+        )
+    )
+    db.add(Meter(id=1, serial_number="MTR-001"))
+    db.add(MeterAssignment(id=1, meter_id=1, client_id=1, start_date=date(2025, 1, 1)))
+    db.add(
+        Cycle(
+            id=1,
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 28),
+            target_date=date(2026, 1, 25),
+            status=CycleStatus.CLOSED.value,
+        )
+    )
+    for i in range(1, 4):
+        db.add(
+            Reading(
+                id=i,
+                meter_assignment_id=1,
+                cycle_id=1,
+                absolute_value=Decimal(100 * i),
+                type=ReadingType.NORMAL.value,
+                submitted_by="collector",
+                approved=True,
+                approved_by="admin",
+                approved_at=datetime(2026, 1, 26),
+                updated_at=datetime(2026, 1, 26, 12, 0),
+            )
+        )
+    db.commit()
+    db.close()
+
+    headers = {"Authorization": "Bearer test-collector-123"}
+    url = "/api/v1/mobile/updates?since=2026-01-01T00:00:00"
+    first = client.get(f"{url}&page_size=2", headers=headers).json()
+    assert [r["id"] for r in first["readings"]] == [1, 2]
+    assert [a["id"] for a in first["assignments"]] == [1]
+    assert first["next_cursor"]
+
+    second = client.get(
+        f"{url}&page_size=2&after={first['next_cursor']}", headers=headers
+    ).json()
+    assert [r["id"] for r in second["readings"]] == [3]
+    assert second["assignments"] == []
+    assert second["next_cursor"] is None
+
+    response = client.get(f"{url}&after=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+
+
+def test_updates_not_modified_by_etag(client, session_factory):
+    """A repeated /updates with the returned ETag is a 304 until data changes"""
+    db = session_factory()
+    db.add(Meter(id=1, serial_number="MTR-001"))
+    db.commit()
+
+    headers = {"Authorization": "Bearer test-collector-123"}
+    url = "/api/v1/mobile/updates?since=2026-01-01T00:00:00"
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    repeat = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+
+    db.add(Meter(id=2, serial_number="MTR-002"))
+    db.commit()
+    db.close()
+    changed = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
 
 
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+"""
+Reading route tests.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.models.client import Client
+from app.models.cycle import Cycle
+from app.models.meter import Meter
+from app.models.meter_assignment import MeterAssignment
+from app.models.reading import Reading, ReadingType
+
+
+def _seed_readings(session_factory) -> None:
+    """Approved baseline (100), approved reading (130) and a pending one (150)"""
+    db = session_factory()
+    db.add(
+        Client(
+            id=1,
+            first_name="John",
+            surname="Doe",
+            phone_number="+255712345678",
+            meter_serial_number="MTR-001",
+            initial_meter_reading=Decimal("100"),
+        )
+    )
+    db.add(Meter(id=1, serial_number="MTR-001"))
+    db.add(MeterAssignment(id=1, meter_id=1, client_id=1, start_date=date(2025, 1, 1)))
+    for month in (1, 2):
+        db.add(
+            Cycle(
+                id=month,
+                start_date=date(2026, month, 1),
+                end_date=date(2026, month, 28),
+                target_date=date(2026, month, 25),
+                status="CLOSED",
+            )
+        )
+    for reading_id, value, consumption, approved in (
+        (1, "100", None, True),
+        (2, "130", "30", True),
+        (3, "150", None, False),
+    ):
+        db.add(
+            Reading(
+                id=reading_id,
+                meter_assignment_id=1,
+                cycle_id=min(reading_id, 2),
+                absolute_value=Decimal(value),
+                consumption=Decimal(consumption) if consumption else None,
+                type=(
+                    ReadingType.BASELINE if reading_id == 1 else ReadingType.NORMAL
+                ).value,
+                submitted_by="collector",
+                submitted_at=datetime(2026, 1, reading_id),
+                approved=approved,
+                approved_at=datetime(2026, 1, 26) if approved else None,
+                approved_by="admin" if approved else None,
+            )
+        )
+    db.commit()
+    db.close()
+
+
+def test_consumption_uses_stored_value_once_approved(client, session_factory):
+    _seed_readings(session_factory)
+
+    body = client.get("/api/v1/readings/2/consumption").json()
+    assert body["consumption"] == 30.0
+    assert body["warning"] is None
+
+    # Pending readings are still measured against the latest approved one
+    assert client.get("/api/v1/readings/3/consumption").json()["consumption"] == 20.0
+    assert client.get("/api/v1/readings/99/consumption").status_code == 400
+
+
+def test_second_submission_in_cycle_is_rejected(client, session_factory):
+    _seed_readings(session_factory)
+    db = session_factory()
+    db.add(
+        Cycle(
+            id=3,
+            start_date=date(2026, 3, 1),
+            end_date=date(2999, 12, 31),
+            target_date=date(2999, 12, 1),
+            status="OPEN",
+        )
+    )
+    db.commit()
+    db.close()
+
+    payload = {
+        "meter_assignment_id": 1,
+        "cycle_id": 3,
+        "absolute_value": "160",
+        "submitted_by": "collector",
+    }
+    first = client.post("/api/v1/readings/submit", json=payload)
+    assert first.status_code == 201
+
+    second = client.post("/api/v1/readings/submit", json=payload)
+    assert second.status_code == 400
+    assert second.json()["detail"].endswith(f"ID: {first.json()['id']}")
+
+
+def test_readings_by_assignment_and_cycle_are_streamed(client, session_factory):
+    _seed_readings(session_factory)
+
+    by_assignment = client.get("/api/v1/readings/assignment/1")
+    assert by_assignment.status_code == 200
+    assert [r["id"] for r in by_assignment.json()] == [1, 2, 3]
+
+    assert [r["id"] for r in client.get("/api/v1/readings/cycle/2").json()] == [2, 3]
+    assert client.get("/api/v1/readings/assignment/99").json() == []
+
+
+def test_cached_reads_answer_if_none_match_with_304(client, session_factory):
+    _seed_readings(session_factory)
+
+    etag = client.get("/api/v1/readings/3").headers["etag"]
+    unchanged = client.get("/api/v1/readings/3", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    client.post("/api/v1/readings/3/approve", params={"approved_by": "admin"})
+    changed = client.get("/api/v1/readings/3", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["approved"] is True
+
+
+def test_stream_exports_readings_as_ndjson(client, session_factory):
+    _seed_readings(session_factory)
+
+    response = client.get("/api/v1/readings/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [3, 2, 1]
+
+    resumed = client.get("/api/v1/readings/stream", params={"after_id": 2})
+    assert [json.loads(line)["id"] for line in resumed.text.splitlines()] == [1]
+
+
+def test_submission_rejects_values_the_column_cannot_hold(client):
+    payload = {"meter_assignment_id": 1, "cycle_id": 1, "submitted_by": "collector"}
+
+    for value in ("-1", "100000", "1.23456"):
+        response = client.post(
+            "/api/v1/readings/submit", json={**payload, "absolute_value": value}
+        )
+        assert response.status_code == 422
+
+
+def test_pending_list_is_cached_until_a_reading_is_written(client, session_factory):
+    _seed_readings(session_factory)
+    assert client.get("/api/v1/readings/pending").json()[0]["submitted_by"] == (
+        "collector"
+    )
+
+    # Changed outside the API: the cached queue is still served
+    db = session_factory()
+    db.get(Reading, 3).submitted_by = "someone-else"
+    db.commit()
+    db.close()
+    assert client.get("/api/v1/readings/pending").json()[0]["submitted_by"] == (
+        "collector"
+    )
+
+    approved = client.post(
+        "/api/v1/readings/3/approve", params={"approved_by": "admin"}
+    )
+    assert approved.status_code == 200
+    assert client.get("/api/v1/readings/pending").json() == []
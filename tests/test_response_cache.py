@@ -0,0 +1,73 @@
+"""
+Tests for the short-lived read-route response cache.
+"""
+
+from app.api.responses import clear_all_response_caches
+from app.api.routes.anomaly_conflict import issues_cache
+from app.models.anomaly import Anomaly
+from app.services.anomaly_service import AnomalyService
+
+
+def _insert_anomaly(session_factory):
+    db = session_factory()
+    db.add(
+        Anomaly(
+            anomaly_type="NEGATIVE_CONSUMPTION",
+            description="direct insert",
+            meter_assignment_id=1,
+            cycle_id=1,
+        )
+    )
+    db.commit()
+    db.close()
+
+
+def test_list_is_cached_per_query_params(client, session_factory):
+    assert client.get("/api/v1/issues/anomalies").json() == []
+    _insert_anomaly(session_factory)
+
+    # Same params: served from cache; different params: fresh query
+    assert client.get("/api/v1/issues/anomalies").json() == []
+    assert len(client.get("/api/v1/issues/anomalies?limit=10").json()) == 1
+
+
+def test_mutation_clears_cache(client):
+    assert client.get("/api/v1/issues/anomalies").json() == []
+    response = client.post(
+        "/api/v1/issues/anomalies",
+        json={
+            "anomaly_type": "NEGATIVE_CONSUMPTION",
+            "description": "via api",
+            "meter_assignment_id": 1,
+            "cycle_id": 1,
+        },
+    )
+    assert response.status_code == 201
+    assert len(client.get("/api/v1/issues/anomalies").json()) == 1
+
+
+
+def test_response_computed_across_a_clear_is_not_stored(
+    client, session_factory, monkeypatch
+):
+    real_list = AnomalyService.list_anomalies
+
+    def list_then_clear(self, *args, **kwargs):
+        # A write clearing the cache while this read is still in flight
+        rows = real_list(self, *args, **kwargs)
+        issues_cache.clear()
+        return rows
+
+    monkeypatch.setattr(AnomalyService, "list_anomalies", list_then_clear)
+    assert client.get("/api/v1/issues/anomalies").json() == []
+    monkeypatch.setattr(AnomalyService, "list_anomalies", real_list)
+
+    _insert_anomaly(session_factory)
+    assert len(client.get("/api/v1/issues/anomalies").json()) == 1
+
+
+def test_clear_all_reaches_caches_without_a_topic(client, session_factory):
+    assert client.get("/api/v1/issues/anomalies").json() == []
+    _insert_anomaly(session_factory)
+    clear_all_response_caches()
+    assert len(client.get("/api/v1/issues/anomalies").json()) == 1
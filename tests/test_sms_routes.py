@@ -0,0 +1,134 @@
+"""
+SMS route tests.
+"""
+
+from app.api.routes.sms import sms_cache
+from app.models.sms import SMSDeliveryHistory, SMSMessage, SMSStatus
+from app.services.africastalking_client import AfricasTalkingClient
+
+
+def _payload(key: str) -> dict:
+    return {
+        "idempotency_key": key,
+        "phone_number": "+255712345678",
+        "message_body": "Your balance is 1,000 TZS",
+        "sms_type": "BALANCE_ALERT",
+        "client_id": 1,
+        "metadata": '{"balance": 1000}',
+    }
+
+
+def test_queue_is_idempotent(client, session_factory):
+    first = client.post("/api/v1/sms/", json=_payload("alert-1"))
+    second = client.post("/api/v1/sms/", json=_payload("alert-1"))
+
+    assert first.status_code == second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+
+    db = session_factory()
+    assert db.query(SMSMessage).count() == 1
+    assert db.query(SMSMessage).one().metadata_json == '{"balance": 1000}'
+    db.close()
+
+
+def test_lists_include_delivery_history(client, session_factory):
+    sms_id = client.post("/api/v1/sms/", json=_payload("alert-1")).json()["id"]
+    client.post("/api/v1/sms/", json=_payload("alert-2"))
+
+    db = session_factory()
+    db.add(
+        SMSDeliveryHistory(
+            sms_message_id=sms_id, attempt_number=1, gateway_name="AfricasTalking"
+        )
+    )
+    db.commit()
+    db.close()
+    sms_cache.clear()
+
+    listed = {sms["id"]: sms for sms in client.get("/api/v1/sms/").json()}
+    assert len(listed) == 2
+    assert [h["attempt_number"] for h in listed[sms_id]["delivery_history"]] == [1]
+
+    by_phone = client.get("/api/v1/sms/phone/+255712345678").json()
+    assert sum(len(sms["delivery_history"]) for sms in by_phone) == 1
+
+
+def test_lists_page_by_after_id(client):
+    ids = [
+        client.post("/api/v1/sms/", json=_payload(f"alert-{n}")).json()["id"]
+        for n in range(5)
+    ]
+
+    first = client.get("/api/v1/sms/", params={"limit": 2}).json()
+    assert [sms["id"] for sms in first] == ids[:-3:-1]
+
+    after = first[-1]["id"]
+    second = client.get("/api/v1/sms/", params={"limit": 2, "after_id": after})
+    assert [sms["id"] for sms in second.json()] == [ids[2], ids[1]]
+
+
+def test_record_sent_then_failed(client):
+    sms_id = client.post("/api/v1/sms/", json=_payload("alert-1")).json()["id"]
+
+    sent = client.post(
+        f"/api/v1/sms/{sms_id}/record-sent", params={"gateway_reference": "gw-1"}
+    )
+    assert sent.status_code == 200
+    assert sent.json()["status"] == "SENT"
+    assert sent.json()["retry_count"] == 1
+
+    failed = client.post(
+        f"/api/v1/sms/{sms_id}/record-failed", params={"error_reason": "timeout"}
+    )
+    assert failed.status_code == 200
+    assert failed.json()["status"] == "PENDING"
+    assert failed.json()["error_reason"] == "timeout"
+
+    missing = client.post(
+        "/api/v1/sms/999/record-failed", params={"error_reason": "timeout"}
+    )
+    assert missing.status_code == 404
+
+
+def test_send_failure_requeues_for_retry(client, monkeypatch, session_factory):
+    async def gateway_down(self, phone_number, message, idempotency_key=None):
+        return False, None, {"error": "Gateway timeout"}
+
+    monkeypatch.setattr(AfricasTalkingClient, "send_sms", gateway_down)
+    sms_id = client.post("/api/v1/sms/", json=_payload("alert-1")).json()["id"]
+
+    response = client.post(f"/api/v1/sms/{sms_id}/send")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Gateway timeout"
+
+    db = session_factory()
+    sms = db.get(SMSMessage, sms_id)
+    assert sms.status == SMSStatus.PENDING
+    assert sms.retry_count == 1
+    assert sms.error_reason == "Gateway timeout"
+    assert [h.error_code for h in sms.delivery_history] == ["GATEWAY_ERROR"]
+    db.close()
+
+
+def test_bulk_queue_skips_keys_already_queued(client, session_factory):
+    existing = client.post("/api/v1/sms/", json=_payload("alert-1")).json()
+
+    response = client.post(
+        "/api/v1/sms/bulk",
+        json=[_payload("alert-1"), _payload("alert-2"), _payload("alert-3")],
+    )
+    assert response.status_code == 200
+    queued = response.json()
+    assert [sms["idempotency_key"] for sms in queued] == [
+        "alert-1",
+        "alert-2",
+        "alert-3",
+    ]
+    assert queued[0]["id"] == existing["id"]
+    assert all(sms["status"] == "PENDING" for sms in queued)
+
+    db = session_factory()
+    stored = db.query(SMSMessage).all()
+    assert len(stored) == 3
+    assert {sms.metadata_json for sms in stored} == {'{"balance": 1000}'}
+    db.close()
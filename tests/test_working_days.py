@@ -10,7 +10,7 @@ from app.utils.working_days import (
     get_nearest_next_working_day,
     adjust_target_date_to_working_day,
 )
-from app.config.holidays import is_holiday, get_holiday_name
+from app.config.holidays import get_holidays, is_holiday, get_holiday_name
 from app.services.cycle_service import CycleService
 from app.models.cycle import CycleStatus
 from sqlalchemy.orm import Session
@@ -252,6 +252,22 @@ class TestWorkingDayEdgeCases:
         result = get_nearest_previous_working_day(future_date)
         assert result.weekday() < 5  # Should be a weekday
 
+    def test_holiday_lookups_are_cached_per_year(self):
+        """Repeat lookups reuse one holiday table; returned lists stay independent"""
+        assert get_holiday_name(date(2026, 1, 1)) is not None
+        assert is_holiday(date(2026, 5, 1)) is True
+
+        first = get_holidays(2026)
+        first.clear()
+        assert date(2026, 1, 1) in get_holidays(2026)
+        assert get_holidays() == sorted(get_holidays())
+
+    def test_holiday_lookups_outside_preloaded_years(self):
+        """Years outside the import-time window are loaded on first use"""
+        assert is_holiday(date(1999, 12, 9)) is True  # Independence Day
+        assert get_holiday_name(date(2099, 12, 9)) is not None
+        assert is_holiday(date(2099, 12, 10)) is False
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])